@@ -3274,9 +3274,724 @@ const int catRanges[] = {
 //--Autogenerated -- end of section automatically generated
 };
 
+// Categories of characters below catTrieLimit are also in a three stage table.
+// The top bits of a character select a block of catTrieIndex from catTrieTop, the
+// middle bits select a block of catTrieCategories from that, and the low bits select
+// the category. Repeated blocks are only stored once.
+// catCategoryBlockShift and catIndexBlockShift must match
+// scripts/GenerateCharacterCategory.py.
+
+enum { catCategoryBlockShift=4, catIndexBlockShift=5 };
+
+const unsigned char catTrieTop[] = {
+//++Autogenerated -- start of section automatically generated
+//**1 \(\*\n\)
+0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,
+16,17,18,19,20,21,22,23,24,25,26,26,26,26,26,26,
+26,26,26,26,26,26,27,26,26,26,26,26,26,26,26,26,
+26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,
+26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,28,
+29,26,30,31,32,33,26,26,26,26,26,26,26,26,26,26,
+26,26,26,26,26,26,26,26,26,26,26,34,35,35,35,35,
+36,36,36,36,36,36,36,36,36,36,36,36,37,38,39,40,
+41,42,43,44,45,46,47,48,49,44,44,50,44,44,44,44,
+26,51,52,44,44,44,44,44,26,26,53,44,44,44,44,44,
+44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,
+44,44,44,44,26,54,44,55,44,44,44,44,44,44,44,44,
+44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,
+44,44,44,44,44,44,44,44,56,44,44,44,44,44,44,44,
+44,44,44,44,44,44,44,44,57,58,59,60,44,44,44,44,
+44,44,44,44,44,44,44,61,62,63,64,65,44,44,44,44,
+26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,
+26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,
+26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,
+26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,
+26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,
+26,26,26,66,26,26,26,26,26,26,26,67,68,44,44,44,
+44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,
+44,44,44,44,44,44,44,44,44,44,44,44,26,68,44,44,
+
+//--Autogenerated -- end of section automatically generated
+};
+
+const unsigned short catTrieIndex[] = {
+//++Autogenerated -- start of section automatically generated
+//**2 \(\*\n\)
+0,0,1,2,3,4,5,6,0,0,7,8,9,10,11,12,
+13,13,13,14,15,13,13,16,17,18,19,20,21,22,13,23,
+13,13,13,24,25,11,11,11,11,26,11,27,28,29,30,31,
+32,32,32,32,32,32,32,33,34,35,36,11,37,38,13,39,
+9,9,9,11,11,11,13,13,40,13,13,13,41,13,13,13,
+13,13,42,43,9,44,45,11,46,47,32,48,49,50,51,52,
+53,54,50,50,55,32,56,57,50,50,50,50,50,58,59,60,
+61,62,50,32,63,50,50,50,50,50,64,65,66,50,67,68,
+50,69,70,71,50,72,73,73,73,73,74,73,73,73,75,76,
+77,50,50,78,79,80,81,82,83,84,85,86,87,88,89,90,
+91,84,85,92,93,94,95,96,97,98,85,99,100,101,89,102,
+83,84,85,103,104,105,89,106,107,108,109,110,111,112,95,113,
+114,115,85,116,117,118,89,119,120,115,85,121,122,123,89,124,
+120,115,50,125,126,127,89,128,129,130,50,131,132,133,73,134,
+135,50,50,136,137,138,73,73,139,140,141,142,143,144,73,73,
+145,146,147,148,149,50,150,151,152,153,32,154,155,156,73,73,
+50,50,157,158,159,160,161,162,163,164,9,9,165,50,50,166,
+50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,
+50,50,50,50,167,168,50,50,167,50,50,169,170,171,50,50,
+50,170,50,50,50,172,173,174,50,175,50,50,50,50,50,176,
+177,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,
+50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,
+50,50,50,50,50,50,178,50,179,180,50,50,50,50,181,182,
+183,184,50,185,50,186,183,187,50,50,50,188,189,190,191,192,
+193,191,50,50,194,50,50,195,50,50,196,50,50,50,50,197,
+50,150,198,199,200,50,201,176,50,50,202,203,204,205,206,206,
+50,207,50,50,50,208,209,210,191,191,211,73,73,73,73,73,
+212,50,50,213,214,159,215,216,217,50,218,66,50,50,219,220,
+50,50,221,222,223,66,50,224,73,73,73,73,225,226,227,228,
+11,11,229,27,27,27,230,231,11,232,27,27,32,32,233,234,
+13,13,13,13,13,13,13,13,13,235,13,13,13,13,13,13,
+236,237,236,236,237,238,236,239,240,240,240,241,242,243,244,245,
+246,247,248,249,250,251,252,253,254,255,256,257,73,258,259,260,
+261,262,263,264,265,266,267,267,268,269,270,206,271,272,206,273,
+274,274,274,274,274,274,274,274,274,274,274,274,274,274,274,274,
+275,206,276,206,206,206,206,277,206,278,274,279,206,280,281,282,
+206,206,283,73,284,73,266,266,266,285,206,206,206,206,286,266,
+206,206,206,206,206,206,206,206,206,206,206,287,288,206,206,289,
+206,206,206,206,206,206,290,206,206,206,206,206,206,206,206,206,
+291,206,206,206,206,206,292,293,266,294,206,206,295,274,296,274,
+206,206,206,206,206,206,206,206,206,206,206,206,206,206,206,206,
+274,274,274,274,274,274,274,274,297,298,274,274,274,299,274,300,
+274,274,274,274,274,274,274,274,274,274,274,274,274,274,274,274,
+206,206,206,274,301,175,73,73,73,73,73,73,73,73,73,73,
+9,9,302,11,11,303,304,305,13,13,13,13,13,13,306,307,
+11,11,308,50,50,50,309,310,50,311,312,312,312,312,32,32,
+313,314,315,316,73,73,73,73,206,317,206,206,206,206,206,282,
+206,206,206,206,206,206,206,206,206,206,206,206,206,318,73,319,
+320,321,322,323,135,50,50,50,50,324,177,50,50,50,50,325,
+326,50,201,135,50,50,50,50,327,328,50,51,206,206,282,50,
+206,329,330,206,331,332,206,206,330,206,206,332,206,206,206,329,
+206,206,206,206,206,206,206,206,206,206,206,206,206,206,206,206,
+50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,
+50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,
+50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,
+50,50,50,50,50,50,50,50,50,50,50,197,206,206,206,206,
+50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,
+50,50,50,50,50,50,50,50,50,50,50,50,150,73,73,73,
+50,333,50,50,50,50,50,50,50,50,50,50,50,50,50,50,
+50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,
+50,50,50,50,50,50,50,50,150,206,206,206,283,50,50,224,
+50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,
+334,50,335,73,13,13,336,337,13,338,50,50,50,50,339,340,
+31,341,342,343,13,13,13,344,345,346,347,73,73,73,73,348,
+349,50,350,351,50,50,50,352,353,50,50,354,355,191,32,356,
+66,50,357,50,358,359,50,150,77,50,50,360,361,362,73,73,
+50,50,363,364,365,366,50,367,50,50,50,368,369,370,371,372,
+373,374,312,73,73,73,73,73,73,73,73,73,50,50,375,191,
+50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,
+50,50,50,50,50,50,50,50,50,50,376,50,377,50,50,202,
+378,378,378,378,378,378,378,378,378,378,378,378,378,378,378,378,
+378,378,378,378,378,378,378,378,378,378,378,378,378,378,378,378,
+379,379,379,379,379,379,379,379,379,379,379,379,379,379,379,379,
+379,379,379,379,379,379,379,379,379,379,379,379,379,379,379,379,
+379,379,379,379,379,379,379,379,379,379,379,379,379,379,379,379,
+50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,
+50,50,50,50,50,50,201,50,50,50,50,50,50,380,73,73,
+381,382,383,384,385,50,50,50,50,50,50,386,387,388,50,50,
+50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,
+50,50,50,389,73,50,50,50,50,390,50,50,195,73,73,391,
+32,392,233,393,394,395,396,397,50,50,50,50,50,50,50,398,
+399,2,3,4,5,400,401,402,50,403,50,327,404,405,406,407,
+408,50,171,409,201,201,73,73,50,50,50,50,50,50,50,51,
+410,266,266,411,267,267,267,412,413,319,73,73,73,206,206,414,
+73,73,73,73,73,73,73,73,50,150,50,50,50,101,73,73,
+50,327,415,50,416,73,73,73,50,417,50,50,418,419,73,73,
+9,9,420,11,11,50,50,50,50,201,191,73,73,73,73,73,
+73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,
+73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,
+73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,
+421,50,50,422,50,423,73,73,73,73,73,73,73,73,73,73,
+50,424,50,425,73,73,73,73,50,50,50,426,73,73,73,73,
+427,428,50,429,430,431,50,432,73,73,73,73,73,73,73,73,
+50,50,50,433,50,434,50,435,73,73,73,73,73,73,73,73,
+50,50,50,50,436,73,73,73,73,73,73,73,73,73,73,73,
+73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,
+73,73,73,73,73,73,266,437,73,73,73,73,73,73,73,73,
+73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,
+438,50,50,439,440,441,442,73,217,50,50,443,444,50,436,191,
+445,50,446,447,448,73,73,73,217,50,50,449,450,191,73,73,
+73,73,73,73,73,73,73,73,50,50,451,452,191,73,73,73,
+73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,
+50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,
+50,50,50,50,50,50,327,73,73,73,73,73,73,73,73,73,
+267,267,267,267,267,267,453,448,73,73,73,73,73,73,73,73,
+73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,
+50,50,327,73,73,73,73,73,73,73,73,73,73,73,73,73,
+73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,
+50,50,50,436,73,73,73,73,73,73,73,73,73,73,73,73,
+73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,
+73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,
+50,50,50,50,176,454,203,455,456,457,73,73,73,73,73,73,
+458,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,
+73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,
+206,206,206,206,206,206,206,206,206,206,206,206,206,206,206,318,
+206,206,459,206,206,206,460,461,462,206,463,206,206,464,73,73,
+206,206,206,206,465,73,73,73,73,73,73,73,73,73,73,73,
+206,206,206,206,206,283,266,466,73,73,73,73,73,73,73,73,
+9,467,11,468,469,470,236,9,471,472,473,474,475,9,467,11,
+476,477,11,478,479,480,481,9,482,11,9,467,11,468,469,11,
+236,9,471,481,9,482,11,9,467,11,483,9,484,485,486,487,
+11,488,9,489,490,491,492,11,493,9,494,11,495,496,496,496,
+497,50,498,499,500,501,502,503,504,202,505,202,73,73,73,506,
+73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,
+206,206,319,206,206,206,206,206,206,282,329,507,291,291,73,73,
+508,206,329,206,206,206,319,206,206,284,73,73,73,73,509,206,
+510,206,206,284,511,512,73,73,73,73,73,73,73,73,73,73,
+206,206,513,514,206,206,206,515,206,282,206,206,516,73,206,513,
+206,206,206,329,517,206,206,206,206,206,206,206,206,206,206,518,
+206,206,206,464,282,206,519,73,73,73,73,73,73,73,73,520,
+206,206,206,206,521,73,73,73,206,206,206,206,318,73,73,73,
+206,206,206,206,206,206,206,282,73,73,73,73,73,73,73,73,
+50,50,50,50,50,50,50,50,50,50,50,50,50,311,73,73,
+50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,
+50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,
+50,50,50,176,50,50,50,50,50,50,50,50,50,50,50,50,
+50,201,73,73,73,73,73,73,73,73,73,73,73,73,73,73,
+73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,
+
+//--Autogenerated -- end of section automatically generated
+};
+
+const unsigned char catTrieCategories[] = {
+//++Autogenerated -- start of section automatically generated
+//**3 \(\*\n\)
+25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,
+22,17,17,17,19,17,17,17,13,14,17,18,17,12,17,17,
+8,8,8,8,8,8,8,8,8,8,17,17,18,18,18,17,
+17,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,13,17,14,20,11,
+20,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
+1,1,1,1,1,1,1,1,1,1,1,13,18,14,18,25,
+22,17,19,19,19,19,21,17,20,21,4,15,18,26,21,20,
+21,18,10,10,20,1,17,17,20,10,4,16,10,10,10,17,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,18,0,0,0,0,0,0,0,1,
+1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
+1,1,1,1,1,1,1,18,1,1,1,1,1,1,1,1,
+0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,
+0,1,0,1,0,1,0,1,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,1,0,1,0,1,0,1,
+0,1,0,1,0,1,0,1,0,0,1,0,1,0,1,1,
+1,0,0,1,0,1,0,0,1,0,0,0,1,1,0,0,
+0,0,1,0,0,1,0,0,0,1,1,1,0,0,1,0,
+0,1,0,1,0,1,0,0,1,0,1,1,0,1,0,0,
+1,0,0,0,1,0,1,0,0,1,1,4,0,1,1,1,
+4,4,4,4,0,2,1,0,2,1,0,2,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,1,0,1,
+1,0,2,1,0,1,0,0,0,1,0,1,0,1,0,1,
+0,1,0,1,1,1,1,1,1,1,0,0,1,0,0,1,
+1,0,1,0,0,0,0,1,0,1,0,1,0,1,0,1,
+1,1,1,1,4,1,1,1,1,1,1,1,1,1,1,1,
+3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,
+3,3,20,20,20,20,3,3,3,3,3,3,3,3,3,3,
+3,3,20,20,20,20,20,20,20,20,20,20,20,20,20,20,
+3,3,3,3,3,20,20,20,20,20,20,20,3,20,3,20,
+20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+0,1,0,1,3,20,0,1,29,29,3,1,1,1,17,29,
+29,29,29,29,20,20,0,17,0,0,0,29,0,29,0,0,
+1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,29,0,0,0,0,0,0,0,0,0,1,1,1,1,
+1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,
+1,1,0,0,0,1,1,1,0,1,0,1,0,1,0,1,
+1,1,1,1,0,1,18,0,1,0,0,1,1,0,0,0,
+0,1,21,5,5,5,5,5,7,7,0,1,0,1,0,1,
+0,0,1,0,1,0,1,0,1,0,1,0,1,0,1,1,
+0,1,0,1,0,1,0,1,29,29,29,29,29,29,29,29,
+29,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,29,29,3,17,17,17,17,17,17,
+29,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
+1,1,1,1,1,1,1,1,29,17,12,29,29,29,29,19,
+29,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,12,5,
+17,5,5,17,5,5,17,5,29,29,29,29,29,29,29,29,
+4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,
+4,4,4,4,4,4,4,4,4,4,4,29,29,29,29,29,
+4,4,4,17,17,29,29,29,29,29,29,29,29,29,29,29,
+26,26,26,26,26,29,18,18,18,17,17,19,17,17,21,21,
+5,5,5,5,5,5,5,5,5,5,5,17,29,29,17,17,
+3,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,
+8,8,8,8,8,8,8,8,8,8,17,17,17,17,4,4,
+5,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,
+4,4,4,4,17,4,5,5,5,5,5,5,5,26,21,5,
+5,5,5,5,5,3,3,5,5,21,5,5,5,5,4,4,
+8,8,8,8,8,8,8,8,8,8,4,4,4,21,21,4,
+17,17,17,17,17,17,17,17,17,17,17,17,17,17,29,26,
+4,5,4,4,4,4,4,4,4,4,4,4,4,4,4,4,
+5,5,5,5,5,5,5,5,5,5,5,29,29,4,4,4,
+4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,
+5,4,29,29,29,29,29,29,29,29,29,29,29,29,29,29,
+8,8,8,8,8,8,8,8,8,8,4,4,4,4,4,4,
+4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,
+5,5,5,5,3,3,21,17,17,17,3,29,29,29,29,29,
+4,4,4,4,4,4,5,5,5,5,3,5,5,5,5,5,
+5,5,5,5,3,5,5,5,3,5,5,5,5,5,29,29,
+17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,29,
+4,4,4,4,4,4,4,4,4,5,5,5,29,29,17,29,
+29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,
+4,29,4,4,4,4,4,4,4,4,4,4,4,29,29,29,
+29,29,29,29,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,29,
+5,5,5,6,4,4,4,4,4,4,4,4,4,4,4,4,
+4,4,4,4,4,4,4,4,4,4,5,6,5,4,6,6,
+6,5,5,5,5,5,5,5,5,6,6,6,6,5,6,6,
+4,5,5,5,5,5,5,5,4,4,4,4,4,4,4,4,
+4,4,5,5,17,17,8,8,8,8,8,8,8,8,8,8,
+17,3,4,4,4,4,4,4,29,4,4,4,4,4,4,4,
+29,5,6,6,29,4,4,4,4,4,4,4,4,29,29,4,
+4,29,29,4,4,4,4,4,4,4,4,4,4,4,4,4,
+4,4,4,4,4,4,4,4,4,29,4,4,4,4,4,4,
+4,29,4,29,29,29,4,4,4,4,29,29,5,4,6,6,
+6,5,5,5,5,29,29,6,6,29,29,6,6,5,4,29,
+29,29,29,29,29,29,29,6,29,29,29,29,4,4,29,4,
+4,4,5,5,29,29,8,8,8,8,8,8,8,8,8,8,
+4,4,19,19,10,10,10,10,10,10,21,19,29,29,29,29,
+29,5,5,6,29,4,4,4,4,4,4,29,29,29,29,4,
+4,29,4,4,29,4,4,29,4,4,29,29,5,29,6,6,
+6,5,5,29,29,29,29,5,5,29,29,5,5,5,29,29,
+29,5,29,29,29,29,29,29,29,4,4,4,4,29,4,29,
+29,29,29,29,29,29,8,8,8,8,8,8,8,8,8,8,
+5,5,4,4,4,5,29,29,29,29,29,29,29,29,29,29,
+29,5,5,6,29,4,4,4,4,4,4,4,4,4,29,4,
+4,4,29,4,4,4,4,4,4,4,4,4,4,4,4,4,
+4,29,4,4,29,4,4,4,4,4,29,29,5,4,6,6,
+6,5,5,5,5,5,29,5,5,6,29,6,6,5,29,29,
+4,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,
+17,19,29,29,29,29,29,29,29,29,29,29,29,29,29,29,
+4,29,4,4,29,4,4,4,4,4,29,29,5,4,6,5,
+6,5,5,5,5,29,29,6,6,29,29,6,6,5,29,29,
+29,29,29,29,29,29,5,6,29,29,29,29,4,4,29,4,
+21,4,10,10,10,10,10,10,29,29,29,29,29,29,29,29,
+29,29,5,4,29,4,4,4,4,4,4,29,29,29,4,4,
+4,29,4,4,4,4,29,29,29,4,4,29,4,29,4,4,
+29,29,29,4,4,29,29,29,4,4,4,29,29,29,4,4,
+4,4,4,4,4,4,4,4,4,4,29,29,29,29,6,6,
+5,6,6,29,29,29,6,6,6,29,6,6,6,5,29,29,
+4,29,29,29,29,29,29,6,29,29,29,29,29,29,29,29,
+10,10,10,21,21,21,21,21,21,19,21,29,29,29,29,29,
+29,6,6,6,29,4,4,4,4,4,4,4,4,29,4,4,
+4,29,4,4,4,4,4,4,4,4,4,4,4,4,4,4,
+4,4,4,4,29,4,4,4,4,4,29,29,29,4,5,5,
+5,6,6,6,6,29,5,5,5,29,5,5,5,5,29,29,
+29,29,29,29,29,5,5,29,4,4,29,29,29,29,29,29,
+29,29,29,29,29,29,29,29,10,10,10,10,10,10,10,21,
+29,29,6,6,29,4,4,4,4,4,4,4,4,29,4,4,
+4,4,4,4,29,4,4,4,4,4,29,29,5,4,6,5,
+6,6,6,6,6,29,5,6,6,29,6,6,5,5,29,29,
+29,29,29,29,29,6,6,29,29,29,29,29,29,29,4,29,
+29,4,4,29,29,29,29,29,29,29,29,29,29,29,29,29,
+4,4,4,4,4,4,4,4,4,4,4,29,29,4,6,6,
+6,5,5,5,5,29,6,6,6,29,6,6,6,5,4,29,
+29,29,29,29,29,29,29,6,29,29,29,29,29,29,29,29,
+10,10,10,10,10,10,29,29,29,21,4,4,4,4,4,4,
+29,29,6,6,29,4,4,4,4,4,4,4,4,4,4,4,
+4,4,4,4,4,4,4,29,29,29,4,4,4,4,4,4,
+4,4,29,4,4,4,4,4,4,4,4,4,29,4,29,29,
+4,4,4,4,4,4,4,29,29,29,5,29,29,29,29,6,
+6,6,5,5,5,29,5,29,6,6,6,6,6,6,6,6,
+29,29,6,6,17,29,29,29,29,29,29,29,29,29,29,29,
+29,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,
+4,5,4,4,5,5,5,5,5,5,5,29,29,29,29,19,
+4,4,4,4,4,4,3,5,5,5,5,5,5,5,5,17,
+8,8,8,8,8,8,8,8,8,8,17,17,29,29,29,29,
+29,4,4,29,4,29,29,4,4,29,4,29,29,4,29,29,
+29,29,29,29,4,4,4,4,29,4,4,4,4,4,4,4,
+29,4,4,4,29,4,29,4,29,29,4,4,29,4,4,4,
+4,5,4,4,5,5,5,5,5,5,29,5,5,4,29,29,
+4,4,4,4,4,29,3,29,5,5,5,5,5,5,29,29,
+8,8,8,8,8,8,8,8,8,8,29,29,4,4,4,4,
+4,21,21,21,17,17,17,17,17,17,17,17,17,17,17,17,
+17,17,17,21,17,21,21,21,5,5,21,21,21,21,21,21,
+8,8,8,8,8,8,8,8,8,8,10,10,10,10,10,10,
+10,10,10,10,21,5,21,5,21,5,13,14,13,14,6,6,
+4,4,4,4,4,4,4,4,29,4,4,4,4,4,4,4,
+4,4,4,4,4,4,4,4,4,4,4,4,4,29,29,29,
+29,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6,
+5,5,5,5,5,17,5,5,4,4,4,4,4,5,5,5,
+5,5,5,5,5,5,5,5,29,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,29,21,21,
+21,21,21,21,21,21,5,21,21,21,21,21,21,29,21,21,
+17,17,17,17,17,21,21,21,21,17,17,29,29,29,29,29,
+4,4,4,4,4,4,4,4,4,4,4,6,6,5,5,5,
+5,6,5,5,5,5,5,5,6,5,5,6,6,5,5,4,
+8,8,8,8,8,8,8,8,8,8,17,17,17,17,17,17,
+4,4,4,4,4,4,6,6,5,5,4,4,4,4,5,5,
+5,4,6,6,6,4,4,6,6,6,6,6,6,6,4,4,
+4,5,5,5,5,4,4,4,4,4,4,4,4,4,4,4,
+4,4,5,6,6,5,5,6,6,6,6,6,6,5,4,6,
+8,8,8,8,8,8,8,8,8,8,6,6,6,5,21,21,
+0,0,0,0,0,0,29,0,29,29,29,29,29,0,29,29,
+4,4,4,4,4,4,4,4,4,4,4,17,3,4,4,4,
+4,4,4,4,4,4,4,4,4,29,4,4,4,4,29,29,
+4,4,4,4,4,4,4,29,4,29,4,4,4,4,29,29,
+4,29,4,4,4,4,29,29,4,4,4,4,4,4,4,29,
+4,29,4,4,4,4,29,29,4,4,4,4,4,4,4,4,
+4,4,4,4,4,4,4,29,4,4,4,4,4,4,4,4,
+4,4,4,4,4,4,4,4,4,4,4,29,29,5,5,5,
+17,17,17,17,17,17,17,17,17,10,10,10,10,10,10,10,
+10,10,10,10,10,10,10,10,10,10,10,10,10,29,29,29,
+21,21,21,21,21,21,21,21,21,21,29,29,29,29,29,29,
+4,4,4,4,4,29,29,29,29,29,29,29,29,29,29,29,
+12,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,
+4,4,4,4,4,4,4,4,4,4,4,4,4,17,17,4,
+22,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,
+4,4,4,4,4,4,4,4,4,4,4,13,14,29,29,29,
+4,4,4,4,4,4,4,4,4,4,4,17,17,17,9,9,
+9,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,
+4,4,4,4,4,4,4,4,4,4,4,4,4,29,4,4,
+4,4,5,5,5,29,29,29,29,29,29,29,29,29,29,29,
+4,4,5,5,5,17,17,29,29,29,29,29,29,29,29,29,
+4,4,5,5,29,29,29,29,29,29,29,29,29,29,29,29,
+4,29,5,5,29,29,29,29,29,29,29,29,29,29,29,29,
+4,4,4,4,5,5,6,5,5,5,5,5,5,5,6,6,
+6,6,6,6,6,6,5,6,6,5,5,5,5,5,5,5,
+5,5,5,5,17,17,17,3,17,17,17,19,4,5,29,29,
+8,8,8,8,8,8,8,8,8,8,29,29,29,29,29,29,
+10,10,10,10,10,10,10,10,10,10,29,29,29,29,29,29,
+17,17,17,17,17,17,12,17,17,17,17,5,5,5,22,29,
+4,4,4,3,4,4,4,4,4,4,4,4,4,4,4,4,
+4,4,4,4,4,4,4,4,29,29,29,29,29,29,29,29,
+4,4,4,4,4,4,4,4,4,5,4,29,29,29,29,29,
+4,4,4,4,4,4,29,29,29,29,29,29,29,29,29,29,
+5,5,5,6,6,6,6,5,5,6,6,6,29,29,29,29,
+6,6,5,6,6,6,6,6,6,5,5,5,29,29,29,29,
+21,29,29,29,17,17,8,8,8,8,8,8,8,8,8,8,
+4,4,4,4,4,4,4,4,4,4,4,4,4,4,29,29,
+4,4,4,4,4,4,4,4,4,4,4,4,29,29,29,29,
+6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,
+6,4,4,4,4,4,4,4,6,6,29,29,29,29,29,29,
+8,8,8,8,8,8,8,8,8,8,10,29,29,29,21,21,
+21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,
+4,4,4,4,4,4,4,5,5,6,6,6,29,29,17,17,
+4,4,4,4,4,6,5,6,5,5,5,5,5,5,5,29,
+5,6,5,6,6,5,5,5,5,5,5,5,5,6,6,6,
+6,6,6,5,5,5,5,5,5,5,5,5,5,29,29,5,
+17,17,17,17,17,17,17,3,17,17,17,17,17,17,29,29,
+5,5,5,5,6,4,4,4,4,4,4,4,4,4,4,4,
+4,4,4,4,5,6,5,5,5,5,5,6,5,6,6,6,
+6,6,5,6,6,4,4,4,4,4,4,4,29,29,29,29,
+17,21,21,21,21,21,21,21,21,21,21,5,5,5,5,5,
+5,5,5,5,21,21,21,21,21,21,21,21,21,29,29,29,
+5,5,6,4,4,4,4,4,4,4,4,4,4,4,4,4,
+4,6,5,5,5,5,6,6,5,5,6,5,6,6,4,4,
+4,4,4,4,4,4,5,6,5,5,6,6,6,5,6,5,
+5,5,6,6,29,29,29,29,29,29,29,29,17,17,17,17,
+4,4,4,4,6,6,6,6,6,6,6,6,5,5,5,5,
+5,5,5,5,6,6,5,5,29,29,29,17,17,17,17,17,
+8,8,8,8,8,8,8,8,8,8,29,29,29,4,4,4,
+4,4,4,4,4,4,4,4,3,3,3,3,3,3,17,17,
+17,17,17,17,17,17,17,17,29,29,29,29,29,29,29,29,
+5,5,5,17,5,5,5,5,5,5,5,5,5,5,5,5,
+5,6,5,5,5,5,5,5,5,4,4,4,4,5,4,4,
+4,4,6,6,5,4,4,29,29,29,29,29,29,29,29,29,
+1,1,1,1,1,1,1,1,1,1,1,1,3,3,3,3,
+3,3,3,3,3,3,3,3,3,3,3,1,1,1,1,1,
+1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,
+1,1,1,1,1,1,1,1,1,1,1,3,3,3,3,3,
+5,5,5,5,5,5,5,29,29,29,29,29,29,29,29,29,
+29,29,29,29,29,29,29,29,29,29,29,29,5,5,5,5,
+0,1,0,1,0,1,1,1,1,1,1,1,1,1,0,1,
+1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,
+1,1,1,1,1,1,29,29,0,0,0,0,0,0,29,29,
+1,1,1,1,1,1,1,1,29,0,29,0,29,0,29,0,
+1,1,1,1,1,1,1,1,1,1,1,1,1,1,29,29,
+1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,
+1,1,1,1,1,29,1,1,0,0,0,0,2,20,1,20,
+20,20,1,1,1,29,1,1,0,0,0,0,2,20,20,20,
+1,1,1,1,29,29,1,1,0,0,0,0,29,20,20,20,
+1,1,1,1,1,1,1,1,0,0,0,0,0,20,20,20,
+29,29,1,1,1,29,1,1,0,0,0,0,2,20,20,29,
+22,22,22,22,22,22,22,22,22,22,22,26,26,26,26,26,
+12,12,12,12,12,12,17,17,15,16,13,15,15,16,13,15,
+17,17,17,17,17,17,17,17,23,24,26,26,26,26,26,22,
+17,17,17,17,17,17,17,17,17,15,16,17,17,17,17,11,
+11,17,17,17,18,13,14,17,17,17,17,17,17,17,17,17,
+17,17,18,17,11,17,17,17,17,17,17,17,17,17,17,22,
+26,26,26,26,26,29,29,29,29,29,26,26,26,26,26,26,
+10,3,29,29,10,10,10,10,10,10,18,18,18,13,14,3,
+10,10,10,10,10,10,10,10,10,10,18,18,18,13,14,29,
+3,3,3,3,3,3,3,3,3,3,3,3,3,29,29,29,
+19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,
+19,19,19,19,19,19,19,19,19,19,29,29,29,29,29,29,
+5,5,5,5,5,5,5,5,5,5,5,5,5,7,7,7,
+7,5,7,7,7,5,5,5,5,5,5,5,5,5,5,5,
+5,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,
+21,21,0,21,21,21,21,0,21,21,1,0,0,0,1,1,
+0,0,0,1,21,0,21,21,18,0,0,0,0,0,21,21,
+21,21,21,21,0,21,0,21,0,21,0,0,0,0,21,1,
+0,0,0,0,1,4,4,4,4,1,21,21,1,1,0,0,
+18,18,18,18,18,0,1,1,1,1,21,18,21,21,1,21,
+10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,
+9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,
+9,9,9,0,1,9,9,9,9,10,29,29,29,29,29,29,
+18,18,18,18,18,21,21,21,21,21,18,18,21,21,21,21,
+18,21,21,18,21,21,18,21,21,21,21,21,21,21,18,21,
+21,21,21,21,21,21,21,21,21,21,21,21,21,21,18,18,
+21,21,18,21,18,21,21,21,21,21,21,21,21,21,21,21,
+21,21,21,21,18,18,18,18,18,18,18,18,18,18,18,18,
+18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,
+21,21,21,21,21,21,21,21,18,18,18,18,21,21,21,21,
+18,18,21,21,21,21,21,21,21,13,14,21,21,21,21,21,
+21,21,21,21,21,21,21,21,21,21,21,21,18,21,21,21,
+21,21,21,21,21,21,21,21,21,21,21,18,18,18,18,18,
+18,18,18,18,21,21,21,21,21,21,21,21,21,21,21,21,
+21,21,21,21,21,21,21,21,21,21,21,21,18,18,18,18,
+18,18,21,21,21,21,21,21,21,21,21,21,21,21,21,21,
+21,21,21,21,29,29,29,29,29,29,29,29,29,29,29,29,
+21,21,21,21,21,21,21,29,29,29,29,29,29,29,29,29,
+21,21,21,21,21,21,21,21,21,21,21,29,29,29,29,29,
+10,10,10,10,10,10,10,10,10,10,10,10,21,21,21,21,
+21,21,21,21,21,21,21,21,21,21,10,10,10,10,10,10,
+21,21,21,21,21,21,21,18,21,21,21,21,21,21,21,21,
+21,18,21,21,21,21,21,21,21,21,21,21,21,21,21,21,
+21,21,21,21,21,21,21,21,18,18,18,18,18,18,18,18,
+21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,18,
+29,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,
+21,21,21,21,21,21,21,21,13,14,13,14,13,14,13,14,
+13,14,13,14,13,14,10,10,10,10,10,10,10,10,10,10,
+10,10,10,10,21,21,21,21,21,21,21,21,21,21,21,21,
+18,18,18,18,18,13,14,18,18,18,18,18,18,18,18,18,
+18,18,18,18,18,18,13,14,13,14,13,14,13,14,13,14,
+18,18,18,13,14,13,14,13,14,13,14,13,14,13,14,13,
+14,13,14,13,14,13,14,13,14,18,18,18,18,18,18,18,
+18,18,18,18,18,18,18,18,13,14,13,14,18,18,18,18,
+18,18,18,18,18,18,18,18,18,18,18,18,13,14,18,18,
+18,18,18,18,18,21,21,18,18,18,18,18,18,29,29,29,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,29,
+1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,29,
+0,1,0,0,0,1,1,0,1,0,1,0,1,0,0,0,
+0,1,0,1,1,0,1,1,1,1,1,1,3,3,0,0,
+0,1,0,1,1,21,21,21,21,21,21,0,1,0,1,5,
+5,5,0,1,29,29,29,29,29,17,17,17,17,10,17,17,
+1,1,1,1,1,1,29,1,29,29,29,29,29,1,29,29,
+4,4,4,4,4,4,4,4,29,29,29,29,29,29,29,3,
+17,29,29,29,29,29,29,29,29,29,29,29,29,29,29,5,
+4,4,4,4,4,4,4,29,29,29,29,29,29,29,29,29,
+4,4,4,4,4,4,4,29,4,4,4,4,4,4,4,29,
+17,17,15,16,15,16,17,17,17,15,16,17,15,16,17,17,
+17,17,17,17,17,17,17,12,17,17,12,17,15,16,17,17,
+15,16,13,14,13,14,13,14,13,14,17,17,17,17,17,3,
+17,17,17,17,17,17,17,17,17,17,12,12,29,29,29,29,
+21,21,21,21,21,21,21,21,21,21,29,21,21,21,21,21,
+21,21,21,21,21,21,29,29,29,29,29,29,29,29,29,29,
+21,21,21,21,21,21,21,21,21,21,21,21,29,29,29,29,
+22,17,17,17,21,3,4,9,13,14,13,14,13,14,13,14,
+13,14,21,21,13,14,13,14,13,14,13,14,12,13,14,14,
+21,9,9,9,9,9,9,9,9,9,5,5,5,5,6,6,
+12,3,3,3,3,3,21,21,9,9,9,3,4,17,21,21,
+4,4,4,4,4,4,4,29,29,5,5,20,20,3,3,4,
+4,4,4,4,4,4,4,4,4,4,4,17,3,3,3,4,
+29,29,29,29,29,4,4,4,4,4,4,4,4,4,4,4,
+4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,29,
+21,21,10,10,10,10,21,21,21,21,21,21,21,21,21,21,
+21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,29,
+10,10,10,10,10,10,10,10,10,10,21,21,21,21,21,21,
+21,21,21,21,21,21,21,21,10,10,10,10,10,10,10,10,
+21,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,
+4,4,4,4,4,3,4,4,4,4,4,4,4,4,4,4,
+4,4,4,4,4,4,4,4,4,4,4,4,3,17,17,17,
+8,8,8,8,8,8,8,8,8,8,4,4,29,29,29,29,
+0,1,0,1,0,1,0,1,0,1,0,1,0,1,4,5,
+7,7,7,17,5,5,5,5,5,5,5,5,5,5,17,3,
+0,1,0,1,0,1,0,1,29,29,29,29,29,29,29,5,
+4,4,4,4,4,4,9,9,9,9,9,9,9,9,9,9,
+5,5,17,17,17,17,17,17,29,29,29,29,29,29,29,29,
+20,20,20,20,20,20,20,3,3,3,3,3,3,3,3,3,
+20,20,0,1,0,1,0,1,0,1,0,1,0,1,0,1,
+1,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,
+3,1,1,1,1,1,1,1,1,0,1,0,1,0,0,1,
+0,1,0,1,0,1,0,1,3,20,20,0,1,0,1,29,
+0,1,0,1,29,29,29,29,29,29,29,29,29,29,29,29,
+0,1,0,1,0,1,0,1,0,1,0,29,29,29,29,29,
+29,29,29,29,29,29,29,29,3,3,1,4,4,4,4,4,
+4,4,5,4,4,4,5,4,4,4,4,5,4,4,4,4,
+4,4,4,6,6,5,5,6,21,21,21,21,29,29,29,29,
+10,10,10,10,10,10,21,21,19,21,29,29,29,29,29,29,
+4,4,4,4,17,17,17,17,29,29,29,29,29,29,29,29,
+6,6,4,4,4,4,4,4,4,4,4,4,4,4,4,4,
+4,4,4,4,6,6,6,6,6,6,6,6,6,6,6,6,
+6,6,6,6,5,29,29,29,29,29,29,29,29,29,17,17,
+5,5,4,4,4,4,4,4,17,17,17,4,29,29,29,29,
+4,4,4,4,4,4,5,5,5,5,5,5,5,5,17,17,
+4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,
+5,5,6,6,29,29,29,29,29,29,29,29,29,29,29,17,
+4,4,4,5,6,6,5,5,5,5,6,6,5,6,6,6,
+6,17,17,17,17,17,17,17,17,17,17,17,17,17,29,3,
+8,8,8,8,8,8,8,8,8,8,29,29,29,29,17,17,
+4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,6,
+6,5,5,6,6,5,5,29,29,29,29,29,29,29,29,29,
+4,4,4,5,4,4,4,4,4,4,4,4,5,6,29,29,
+8,8,8,8,8,8,8,8,8,8,29,29,17,17,17,17,
+3,4,4,4,4,4,4,21,21,21,4,6,29,29,29,29,
+5,4,5,5,5,4,4,5,5,4,4,4,4,4,5,5,
+4,5,4,29,29,29,29,29,29,29,29,29,29,29,29,29,
+29,29,29,29,29,29,29,29,29,29,29,4,4,3,17,17,
+4,4,4,4,4,4,4,4,4,4,4,6,5,5,6,6,
+17,17,4,3,3,6,5,29,29,29,29,29,29,29,29,29,
+29,4,4,4,4,4,4,29,29,4,4,4,4,4,4,29,
+29,4,4,4,4,4,4,29,29,29,29,29,29,29,29,29,
+4,4,4,6,6,5,6,6,5,6,6,17,6,5,29,29,
+4,4,4,4,29,29,29,29,29,29,29,29,29,29,29,29,
+4,4,4,4,4,4,4,29,29,29,29,4,4,4,4,4,
+27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,
+28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,
+4,4,4,4,4,4,4,4,4,4,29,29,29,29,29,29,
+1,1,1,1,1,1,1,29,29,29,29,29,29,29,29,29,
+29,29,29,1,1,1,1,1,29,29,29,29,29,4,5,4,
+4,4,4,4,4,4,4,4,4,18,4,4,4,4,4,4,
+4,4,4,4,4,4,4,29,4,4,4,4,4,29,4,29,
+4,4,29,4,4,29,4,4,4,4,4,4,4,4,4,4,
+4,4,20,20,20,20,20,20,20,20,20,20,20,20,20,20,
+20,20,29,29,29,29,29,29,29,29,29,29,29,29,29,29,
+29,29,29,4,4,4,4,4,4,4,4,4,4,4,4,4,
+4,4,4,4,4,4,4,4,4,4,4,4,4,4,13,14,
+29,29,4,4,4,4,4,4,4,4,4,4,4,4,4,4,
+4,4,4,4,4,4,4,4,4,4,4,4,19,21,29,29,
+17,17,17,17,17,17,17,13,14,17,29,29,29,29,29,29,
+17,12,12,11,11,13,14,13,14,13,14,13,14,13,14,13,
+14,13,14,13,14,17,17,13,14,17,17,17,17,11,11,11,
+17,17,17,29,17,17,17,17,12,13,14,13,14,13,14,17,
+17,17,18,12,18,18,18,29,17,19,17,17,29,29,29,29,
+4,4,4,4,4,29,4,4,4,4,4,4,4,4,4,4,
+4,4,4,4,4,4,4,4,4,4,4,4,4,29,29,26,
+29,17,17,17,19,17,17,17,13,14,17,18,17,12,17,17,
+1,1,1,1,1,1,1,1,1,1,1,13,18,14,18,13,
+14,17,13,14,17,17,4,4,4,4,4,4,4,4,4,4,
+3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,
+4,4,4,4,4,4,4,4,4,4,4,4,4,4,3,3,
+29,29,4,4,4,4,4,4,29,29,4,4,4,4,4,4,
+29,29,4,4,4,4,4,4,29,29,4,4,4,29,29,29,
+19,19,18,20,21,19,19,29,21,18,18,18,18,21,21,29,
+29,29,29,29,29,29,29,29,29,26,26,26,21,21,29,29,
+4,4,4,4,4,4,4,4,4,4,4,4,29,4,4,4,
+4,4,4,4,4,4,4,4,4,4,4,29,4,4,29,4,
+17,17,17,29,29,29,29,10,10,10,10,10,10,10,10,10,
+10,10,10,10,29,29,29,21,21,21,21,21,21,21,21,21,
+9,9,9,9,9,10,10,10,10,21,21,21,21,21,21,21,
+21,21,21,21,21,21,21,21,21,21,10,29,29,29,29,29,
+21,21,21,21,21,21,21,21,21,21,21,21,21,5,29,29,
+10,10,10,10,29,29,29,29,29,29,29,29,29,29,29,29,
+4,9,4,4,4,4,4,4,4,4,9,29,29,29,29,29,
+4,4,4,4,4,4,4,4,4,4,4,4,4,4,29,17,
+4,4,4,4,29,29,29,29,4,4,4,4,4,4,4,4,
+17,9,9,9,9,9,29,29,29,29,29,29,29,29,29,29,
+0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,
+4,4,4,4,4,4,29,29,4,29,4,4,4,4,4,4,
+4,4,4,4,4,4,29,4,4,29,29,29,4,29,29,4,
+4,4,4,4,4,4,29,17,10,10,10,10,10,10,10,10,
+4,4,4,4,4,4,10,10,10,10,10,10,29,29,29,17,
+4,4,4,4,4,4,4,4,4,4,29,29,29,29,29,17,
+4,4,4,4,4,4,4,4,29,29,29,29,29,29,4,4,
+4,5,5,5,29,5,5,29,29,29,29,29,5,5,5,5,
+4,4,4,4,29,4,4,4,29,4,4,4,4,4,4,4,
+4,4,4,4,29,29,29,29,5,5,5,29,29,29,29,5,
+10,10,10,10,10,10,10,10,29,29,29,29,29,29,29,29,
+17,17,17,17,17,17,17,17,17,29,29,29,29,29,29,29,
+4,4,4,4,4,4,4,4,4,4,4,4,4,10,10,17,
+4,4,4,4,4,4,29,29,29,17,17,17,17,17,17,17,
+4,4,4,4,4,4,29,29,10,10,10,10,10,10,10,10,
+4,4,4,29,29,29,29,29,10,10,10,10,10,10,10,10,
+4,4,4,4,4,4,4,4,4,29,29,29,29,29,29,29,
+10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,29,
+6,5,6,4,4,4,4,4,4,4,4,4,4,4,4,4,
+4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,17,17,17,17,17,17,17,29,29,
+29,29,10,10,10,10,10,10,10,10,10,10,10,10,10,10,
+10,10,10,10,10,10,8,8,8,8,8,8,8,8,8,8,
+6,6,6,5,5,5,5,6,6,5,5,17,17,26,17,17,
+17,17,29,29,29,29,29,29,29,29,29,29,29,29,29,29,
+5,5,5,4,4,4,4,4,4,4,4,4,4,4,4,4,
+4,4,4,4,4,4,4,5,5,5,5,5,6,5,5,5,
+5,5,5,5,5,29,8,8,8,8,8,8,8,8,8,8,
+17,17,17,17,29,29,29,29,29,29,29,29,29,29,29,29,
+4,4,4,6,6,6,5,5,5,5,5,5,5,5,5,6,
+6,4,4,4,4,17,17,17,17,29,29,29,29,29,29,29,
+4,4,4,4,4,4,4,4,4,4,4,5,6,5,6,6,
+5,5,5,5,5,5,6,5,29,29,29,29,29,29,29,29,
+9,9,9,29,29,29,29,29,29,29,29,29,29,29,29,29,
+4,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,
+6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,29,
+29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,5,
+5,5,5,3,3,3,3,3,3,3,3,3,3,3,3,3,
+4,4,29,29,29,29,29,29,29,29,29,29,29,29,29,29,
+21,21,21,21,21,21,21,29,29,21,21,21,21,21,21,21,
+21,21,21,21,21,6,6,5,5,5,21,21,21,6,6,6,
+6,6,6,26,26,26,26,26,26,26,26,5,5,5,5,5,
+5,5,5,21,21,5,5,5,5,5,5,5,21,21,21,21,
+21,21,21,21,21,21,21,21,21,21,5,5,5,5,21,21,
+21,21,21,21,21,21,21,21,21,21,21,21,21,21,29,29,
+21,21,5,5,5,21,29,29,29,29,29,29,29,29,29,29,
+10,10,29,29,29,29,29,29,29,29,29,29,29,29,29,29,
+0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,
+1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,
+1,1,1,1,1,29,1,1,1,1,1,1,1,1,1,1,
+0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
+1,1,1,1,1,1,1,1,1,1,1,1,0,29,0,0,
+29,29,0,29,29,0,0,29,29,0,0,0,0,29,0,0,
+0,0,0,0,0,0,1,1,1,1,29,1,29,1,1,1,
+1,1,1,1,29,1,1,1,1,1,1,1,1,1,1,1,
+1,1,1,1,0,0,29,0,0,0,0,29,29,0,0,0,
+0,0,0,0,0,29,0,0,0,0,0,0,0,29,1,1,
+1,1,1,1,1,1,1,1,0,0,29,0,0,0,0,29,
+0,0,0,0,0,29,0,29,29,29,0,0,0,0,0,0,
+0,29,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
+1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,
+0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,
+1,1,1,1,1,1,29,29,0,0,0,0,0,0,0,0,
+0,18,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
+1,1,1,1,1,1,1,1,1,1,1,18,1,1,1,1,
+1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,18,1,1,1,1,
+1,1,1,1,1,18,1,1,1,1,1,1,0,0,0,0,
+0,0,0,0,0,18,1,1,1,1,1,1,1,1,1,1,
+1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,18,
+1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,18,
+1,1,1,1,1,1,1,1,1,18,1,1,1,1,1,1,
+0,0,0,0,0,0,0,0,0,18,1,1,1,1,1,1,
+1,1,1,18,1,1,1,1,1,1,0,1,29,29,8,8,
+8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,
+4,4,4,4,29,4,4,4,4,4,4,4,4,4,4,4,
+29,4,4,29,4,29,29,4,29,4,4,4,4,4,4,4,
+4,4,4,29,4,4,4,4,29,4,29,4,29,29,29,29,
+29,29,4,29,29,29,29,4,29,4,29,4,29,4,4,4,
+29,4,4,29,4,29,29,4,29,4,29,4,29,4,29,4,
+29,4,4,29,4,29,29,4,4,4,4,29,4,4,4,4,
+4,4,4,29,4,4,4,4,29,4,4,4,4,29,4,29,
+4,4,4,4,4,4,4,4,4,4,29,4,4,4,4,4,
+29,4,4,4,29,4,4,4,4,4,29,4,4,4,4,4,
+18,18,29,29,29,29,29,29,29,29,29,29,29,29,29,29,
+29,21,21,21,21,21,21,21,21,21,21,21,21,21,21,29,
+10,10,10,10,10,10,10,10,10,10,10,29,29,29,29,29,
+29,29,29,29,29,29,21,21,21,21,21,21,21,21,21,21,
+21,21,21,29,29,29,29,29,29,29,29,29,29,29,29,29,
+21,21,21,21,21,21,21,21,21,29,29,29,29,29,29,29,
+21,21,29,29,29,29,29,29,29,29,29,29,29,29,29,29,
+21,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,
+21,21,21,21,21,21,29,21,21,21,21,21,21,21,21,21,
+21,21,21,21,21,21,21,21,21,21,21,21,21,29,29,29,
+21,21,21,21,21,29,21,21,21,21,21,29,29,29,29,29,
+21,29,21,21,21,21,21,21,21,21,21,21,21,21,21,21,
+21,21,21,21,21,21,21,21,29,21,21,21,21,29,29,29,
+21,21,21,21,21,21,21,21,29,29,29,29,29,29,29,29,
+29,29,29,29,29,29,29,29,29,29,29,21,21,21,21,21,
+21,29,29,29,29,21,21,21,21,21,21,21,21,21,21,21,
+
+//--Autogenerated -- end of section automatically generated
+};
+
 const int maxUnicode = 0x10ffff;
 const int maskCategory = 0x1F;
 const int nRanges = ELEMENTS(catRanges);
+const int catTrieLimit = static_cast<int>(ELEMENTS(catTrieTop)) << (catCategoryBlockShift + catIndexBlockShift);
 
 }
 
@@ -3287,13 +4002,21 @@ const int nRanges = ELEMENTS(catRanges);
 // Initial version has 3249 entries and adds about 13K to the executable.
 // The array is in ascending order so can be searched using binary search.
 // Therefore the average call takes log2(3249) = 12 comparisons.
-// For speed, it may be useful to make a linear table for the common values,
-// possibly for 0..0xff for most Western European text or 0..0xfff for most
-// alphabetic languages.
+// Characters below catTrieLimit, which include all the alphabets, CJK ideographs,
+// and emoji, are instead found with 3 lookups in the three stage table which
+// adds about another 13K. Above that are mostly unassigned and private use
+// characters.
 
 CharacterCategory CategoriseCharacter(int character) {
 	if (character < 0 || character > maxUnicode)
 		return ccCn;
+	if (character < catTrieLimit) {
+		const int indexBlock = catTrieTop[character >> (catCategoryBlockShift + catIndexBlockShift)];
+		const int categoryBlock = catTrieIndex[(indexBlock << catIndexBlockShift) +
+			((character >> catCategoryBlockShift) & ((1 << catIndexBlockShift) - 1))];
+		return static_cast<CharacterCategory>(catTrieCategories[(categoryBlock << catCategoryBlockShift) +
+			(character & ((1 << catCategoryBlockShift) - 1))]);
+	}
 	const int baseValue = character * (maskCategory+1) + maskCategory;
 	const int *placeAfter = std::lower_bound(catRanges, catRanges+nRanges, baseValue);
 	return static_cast<CharacterCategory>(*(placeAfter-1) & maskCategory);
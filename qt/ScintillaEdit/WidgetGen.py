@@ -57,127 +57,119 @@ understoodTypes = ["", "void", "int", "bool", "position",
 
 def checkTypes(name, v):
 	understandAllTypes = True
-	if v["ReturnType"] not in understoodTypes:
-		#~ print("Do not understand", v["ReturnType"], "for", name)
+	if v.returnType not in understoodTypes:
+		#~ print("Do not understand", v.returnType, "for", name)
 		understandAllTypes = False
-	if v["Param1Type"] not in understoodTypes:
-		#~ print("Do not understand", v["Param1Type"], "for", name)
+	if v.param1Type not in understoodTypes:
+		#~ print("Do not understand", v.param1Type, "for", name)
 		understandAllTypes = False
-	if v["Param2Type"] not in understoodTypes:
-		#~ print("Do not understand", v["Param2Type"], "for", name)
+	if v.param2Type not in understoodTypes:
+		#~ print("Do not understand", v.param2Type, "for", name)
 		understandAllTypes = False
 	return understandAllTypes
 
 def arguments(v, stringResult, options):
 	ret = ""
-	p1Type = cppAlias(v["Param1Type"])
+	p1Type = cppAlias(v.param1Type)
 	if p1Type == "int":
 		p1Type = "sptr_t"
 	if p1Type:
-		ret = ret + p1Type + " " + normalisedName(v["Param1Name"], options)
-	p2Type = cppAlias(v["Param2Type"])
+		ret = ret + p1Type + " " + normalisedName(v.param1Name, options)
+	p2Type = cppAlias(v.param2Type)
 	if p2Type == "int":
 		p2Type = "sptr_t"
 	if p2Type and not stringResult:
 		if p1Type:
 			ret = ret + ", "
-		ret = ret + p2Type + " " + normalisedName(v["Param2Name"], options)
+		ret = ret + p2Type + " " + normalisedName(v.param2Name, options)
 	return ret
 
 def printPyFile(f, options):
 	out = []
-	for name in f.order:
+	for name in f.FeatureNames(["val", "evt", "fun"], excludeCategory="Deprecated"):
 		v = f.features[name]
-		if v["Category"] != "Deprecated":
-			feat = v["FeatureType"]
-			if feat in ["val"]:
-				out.append(name + "=" + v["Value"])
-			if feat in ["evt"]:
-				out.append("SCN_" + name.upper() + "=" + v["Value"])
-			if feat in ["fun"]:
-				out.append("SCI_" + name.upper() + "=" + v["Value"])
+		feat = v.featureType
+		if feat in ["val"]:
+			out.append(name + "=" + v.value)
+		if feat in ["evt"]:
+			out.append("SCN_" + name.upper() + "=" + v.value)
+		if feat in ["fun"]:
+			out.append("SCI_" + name.upper() + "=" + v.value)
 	return out
 
 def printHFile(f, options):
 	out = []
-	for name in f.order:
+	for name in f.FeatureNames(["fun", "get", "set"], excludeCategory="Deprecated"):
 		v = f.features[name]
-		if v["Category"] != "Deprecated":
-			feat = v["FeatureType"]
-			if feat in ["fun", "get", "set"]:
-				if checkTypes(name, v):
-					constDeclarator = " const" if feat == "get" else ""
-					returnType = cppAlias(v["ReturnType"])					
-					if returnType == "int":
-						returnType = "sptr_t"
-					stringResult = v["Param2Type"] == "stringresult"
-					if stringResult:
-						returnType = "QByteArray"
-					out.append("\t" + returnType + " " + normalisedName(name, options, feat) + "(" +
-						arguments(v, stringResult, options)+
-						")" + constDeclarator + ";")
+		feat = v.featureType
+		if checkTypes(name, v):
+			constDeclarator = " const" if feat == "get" else ""
+			returnType = cppAlias(v.returnType)					
+			if returnType == "int":
+				returnType = "sptr_t"
+			stringResult = v.param2Type == "stringresult"
+			if stringResult:
+				returnType = "QByteArray"
+			out.append("\t" + returnType + " " + normalisedName(name, options, feat) + "(" +
+				arguments(v, stringResult, options)+
+				")" + constDeclarator + ";")
 	return out
 
 def methodNames(f, options):
-	for name in f.order:
+	for name in f.FeatureNames(["fun", "get", "set"], excludeCategory="Deprecated"):
 		v = f.features[name]
-		if v["Category"] != "Deprecated":
-			feat = v["FeatureType"]
-			if feat in ["fun", "get", "set"]:
-				if checkTypes(name, v):
-					yield normalisedName(name, options)
+		if checkTypes(name, v):
+			yield normalisedName(name, options)
 
 def printCPPFile(f, options):
 	out = []
-	for name in f.order:
+	for name in f.FeatureNames(["fun", "get", "set"], excludeCategory="Deprecated"):
 		v = f.features[name]
-		if v["Category"] != "Deprecated":
-			feat = v["FeatureType"]
-			if feat in ["fun", "get", "set"]:
-				if checkTypes(name, v):
-					constDeclarator = " const" if feat == "get" else ""
-					featureDefineName = "SCI_" + name.upper()
-					returnType = cppAlias(v["ReturnType"])
-					if returnType == "int":
-						returnType = "sptr_t"
-					stringResult = v["Param2Type"] == "stringresult"
-					if stringResult:
-						returnType = "QByteArray"
-					returnStatement = ""
-					if returnType != "void":
-						returnStatement = "return "
-					out.append(returnType + " ScintillaEdit::" + normalisedName(name, options, feat) + "(" +
-						arguments(v, stringResult, options) +
-						")" + constDeclarator + " {")
-					returns = ""
-					if stringResult:
-						returns += "    " + returnStatement + "TextReturner(" + featureDefineName + ", "
-						if "*" in cppAlias(v["Param1Type"]):
-							returns += "(sptr_t)"
-						if v["Param1Name"]:
-							returns += normalisedName(v["Param1Name"], options)
-						else:
-							returns += "0"
-						returns += ");"
-					else:
-						returns += "    " + returnStatement + "send(" + featureDefineName + ", "
-						if "*" in cppAlias(v["Param1Type"]):
-							returns += "(sptr_t)"
-						if v["Param1Name"]:
-							returns += normalisedName(v["Param1Name"], options)
-						else:
-							returns += "0"
-						returns += ", "
-						if "*" in cppAlias(v["Param2Type"]):
-							returns += "(sptr_t)"
-						if v["Param2Name"]:
-							returns += normalisedName(v["Param2Name"], options)
-						else:
-							returns += "0"
-						returns += ");"
-					out.append(returns)
-					out.append("}")
-					out.append("")
+		feat = v.featureType
+		if checkTypes(name, v):
+			constDeclarator = " const" if feat == "get" else ""
+			featureDefineName = "SCI_" + name.upper()
+			returnType = cppAlias(v.returnType)
+			if returnType == "int":
+				returnType = "sptr_t"
+			stringResult = v.param2Type == "stringresult"
+			if stringResult:
+				returnType = "QByteArray"
+			returnStatement = ""
+			if returnType != "void":
+				returnStatement = "return "
+			out.append(returnType + " ScintillaEdit::" + normalisedName(name, options, feat) + "(" +
+				arguments(v, stringResult, options) +
+				")" + constDeclarator + " {")
+			returns = ""
+			if stringResult:
+				returns += "    " + returnStatement + "TextReturner(" + featureDefineName + ", "
+				if "*" in cppAlias(v.param1Type):
+					returns += "(sptr_t)"
+				if v.param1Name:
+					returns += normalisedName(v.param1Name, options)
+				else:
+					returns += "0"
+				returns += ");"
+			else:
+				returns += "    " + returnStatement + "send(" + featureDefineName + ", "
+				if "*" in cppAlias(v.param1Type):
+					returns += "(sptr_t)"
+				if v.param1Name:
+					returns += normalisedName(v.param1Name, options)
+				else:
+					returns += "0"
+				returns += ", "
+				if "*" in cppAlias(v.param2Type):
+					returns += "(sptr_t)"
+				if v.param2Name:
+					returns += normalisedName(v.param2Name, options)
+				else:
+					returns += "0"
+				returns += ");"
+			out.append(returns)
+			out.append("}")
+			out.append("")
 	return out
 
 def gtkNames():
@@ -202,12 +194,81 @@ def usage():
 	print("-h --help  display this text")
 	print("-u --underscore-names  use method_names consistent with GTK+ standards")
 
+# Which features each generated file depends upon so that files are only regenerated
+# when those features change.
+
+def inCPPFile(feature):
+	return feature.featureType in ["fun", "get", "set"]
+
+def inPyFile(feature):
+	return feature.featureType in ["val", "evt", "fun"]
+
+# Generated files also depend on the code that generates them
+generatorPath = os.path.abspath(__file__)
+
+def interfaceDifference(f, snapshotName, useSnapshot, dependencies, outputs=()):
+	""" Return how 'f' differs from the interface saved in 'snapshotName' by the previous run.
+	Without a usable snapshot, every feature is treated as added. The snapshot is not usable
+	when any of 'outputs' has changed since it was written. """
+	previous = None
+	if useSnapshot:
+		previous = Face.readSnapshot(snapshotName, dependencies, outputs)
+	return Face.diff(previous or Face.Face(), f)
+
+def isOutOfDate(difference, selector, fields, template, output):
+	""" Whether 'output' needs to be generated from 'template' again. """
+	if not os.path.exists(output) or os.path.getmtime(template) > os.path.getmtime(output):
+		return True
+	return difference.Affects(selector, fields)
+
+def updateSnapshot(f, snapshotName, useSnapshot, outputs=()):
+	if useSnapshot:
+		Face.writeSnapshot(snapshotName, f, outputs)
+	elif os.path.exists(snapshotName):
+		# Files are no longer generated from the snapshot so it can not be trusted
+		os.remove(snapshotName)
+
 def readInterface(cleanGenerated):
 	f = Face.Face()
 	if not cleanGenerated:
 		f.ReadFromFile("../../include/Scintilla.iface")
 	return f
 
+def generateFiles(f, options, directory, useSnapshot=True):
+	""" Generate the files for the interface 'f' in 'directory' which is the ScintillaEdit
+	directory. """
+	def path(name):
+		return os.path.normpath(os.path.join(directory, name))
+	# The snapshot is only kept for the default Qt style names
+	snapshotName = path("ScintillaEdit.iface.cache")
+	useSnapshot = useSnapshot and options["qtStyle"]
+	outputs = [path("ScintillaEdit.cpp"), path("ScintillaEdit.h"),
+		path("../ScintillaEditPy/ScintillaConstants.py")]
+	difference = interfaceDifference(f, snapshotName, useSnapshot, [generatorPath], outputs)
+	if isOutOfDate(difference, inCPPFile, Face.definitionFields,
+		path("ScintillaEdit.cpp.template"), path("ScintillaEdit.cpp")):
+		GenerateFile(path("ScintillaEdit.cpp.template"), path("ScintillaEdit.cpp"),
+			"/* ", True, printCPPFile(f, options))
+	if isOutOfDate(difference, inCPPFile, Face.definitionFields,
+		path("ScintillaEdit.h.template"), path("ScintillaEdit.h")):
+		GenerateFile(path("ScintillaEdit.h.template"), path("ScintillaEdit.h"),
+			"/* ", True, printHFile(f, options))
+	if isOutOfDate(difference, inPyFile, ["featureType", "value", "category"],
+		path("../ScintillaEditPy/ScintillaConstants.py.template"),
+		path("../ScintillaEditPy/ScintillaConstants.py")):
+		GenerateFile(path("../ScintillaEditPy/ScintillaConstants.py.template"),
+			path("../ScintillaEditPy/ScintillaConstants.py"),
+			"# ", True, printPyFile(f, options))
+	updateSnapshot(f, snapshotName, useSnapshot, outputs)
+
+def RegenerateAll(root, f=None):
+	""" Generate the Qt style files from 'f' or, when it is None, from a Face read from the
+	interface file. """
+	if f is None:
+		f = Face.Face()
+		f.ReadFromFile(root + "include/Scintilla.iface")
+	generateFiles(f, {"qtStyle": True}, root + "qt/ScintillaEdit")
+
 def main(argv):
 	# Using local path for gtkscintilla2 so don't default to checking
 	checkGTK = False
@@ -230,13 +291,7 @@ def main(argv):
 	options = {"qtStyle": qtStyleInterface}
 	f = readInterface(cleanGenerated)
 	try:
-		GenerateFile("ScintillaEdit.cpp.template", "ScintillaEdit.cpp", 
-			"/* ", True, printCPPFile(f, options))
-		GenerateFile("ScintillaEdit.h.template", "ScintillaEdit.h",
-			"/* ", True, printHFile(f, options))
-		GenerateFile("../ScintillaEditPy/ScintillaConstants.py.template",
-			"../ScintillaEditPy/ScintillaConstants.py",
-			"# ", True, printPyFile(f, options))
+		generateFiles(f, options, "", not cleanGenerated)
 		if checkGTK:
 			names = set(methodNames(f))
 			#~ print("\n".join(names))
@@ -14,6 +14,7 @@ import WidgetGen
 scintillaDirectory = "../.."
 scintillaScriptsDirectory = os.path.join(scintillaDirectory, "scripts")
 sys.path.append(scintillaScriptsDirectory)
+import Face
 from FileGenerator import GenerateFile
 
 # Decide up front which platform, treat anything other than Windows or OS X as Linux
@@ -78,42 +79,40 @@ injectCheckN = """
 
 def methodSignature(name, v, options):
 	argTypes = ""
-	p1Type = WidgetGen.cppAlias(v["Param1Type"])
+	p1Type = WidgetGen.cppAlias(v.param1Type)
 	if p1Type == "int":
 		p1Type = "sptr_t"
 	if p1Type:
 		argTypes = argTypes + p1Type
-	p2Type = WidgetGen.cppAlias(v["Param2Type"])
+	p2Type = WidgetGen.cppAlias(v.param2Type)
 	if p2Type == "int":
 		p2Type = "sptr_t"
-	if p2Type and v["Param2Type"] != "stringresult":
+	if p2Type and v.param2Type != "stringresult":
 		if p1Type:
 			argTypes = argTypes + ", "
 		argTypes = argTypes + p2Type
-	methodName = WidgetGen.normalisedName(name, options, v["FeatureType"])
-	constDeclarator = " const" if v["FeatureType"] == "get" else ""
+	methodName = WidgetGen.normalisedName(name, options, v.featureType)
+	constDeclarator = " const" if v.featureType == "get" else ""
 	return methodName + "(" + argTypes + ")" + constDeclarator
 
 def printTypeSystemFile(f, options):
 	out = []
-	for name in f.order:
+	for name in f.FeatureNames(["fun", "get", "set"], excludeCategory="Deprecated"):
 		v = f.features[name]
-		if v["Category"] != "Deprecated":
-			feat = v["FeatureType"]
-			if feat in ["fun", "get", "set"]:
-				checks = ""
-				if v["Param1Type"] == "string":
-					checks = checks + (injectCheckN % 0)
-				if v["Param2Type"] == "string":
-					if v["Param1Type"] == "":	# Only arg 2 -> treat as first
-						checks = checks + (injectCheckN % 0)
-					else:
-						checks = checks + (injectCheckN % 1)
-				if checks:
-					inject = injectCode % checks
-					out.append(modifyFunctionElement % (methodSignature(name, v, options), inject))
-				#if v["Param1Type"] == "string":
-				#	out.append("<string-xml>" + name + "</string-xml>\n")
+		feat = v.featureType
+		checks = ""
+		if v.param1Type == "string":
+			checks = checks + (injectCheckN % 0)
+		if v.param2Type == "string":
+			if v.param1Type == "":	# Only arg 2 -> treat as first
+				checks = checks + (injectCheckN % 0)
+			else:
+				checks = checks + (injectCheckN % 1)
+		if checks:
+			inject = injectCode % checks
+			out.append(modifyFunctionElement % (methodSignature(name, v, options), inject))
+		#if v.param1Type == "string":
+		#	out.append("<string-xml>" + name + "</string-xml>\n")
 	return out
 
 def doubleBackSlashes(s):
@@ -209,8 +208,15 @@ class SepBuilder:
 		f = WidgetGen.readInterface(False)
 		os.chdir(os.path.join("..", "ScintillaEditPy"))
 		options = {"qtStyle": self.qtStyleInterface}
-		GenerateFile("typesystem_ScintillaEdit.xml.template", "typesystem_ScintillaEdit.xml", 
-			"<!-- ", True, printTypeSystemFile(f, options))
+		snapshotName = "typesystem_ScintillaEdit.iface.cache"
+		outputs = ["typesystem_ScintillaEdit.xml"]
+		difference = WidgetGen.interfaceDifference(f, snapshotName, self.qtStyleInterface,
+			[os.path.abspath(__file__), WidgetGen.generatorPath], outputs)
+		if WidgetGen.isOutOfDate(difference, WidgetGen.inCPPFile, Face.definitionFields,
+			"typesystem_ScintillaEdit.xml.template", "typesystem_ScintillaEdit.xml"):
+			GenerateFile("typesystem_ScintillaEdit.xml.template", "typesystem_ScintillaEdit.xml", 
+				"<!-- ", True, printTypeSystemFile(f, options))
+		WidgetGen.updateSnapshot(f, snapshotName, self.qtStyleInterface, outputs)
 
 	def runGenerator(self):
 		generatorrunner = "shiboken"
@@ -263,7 +269,8 @@ class SepBuilder:
 	def cleanEverything(self):
 		self.generateAPI(["--clean"])
 		runProgram([self.MakeCommand, "distclean"], exitOnFailure=False)
-		filesToRemove = [self.ProInclude, "typesystem_ScintillaEdit.xml", 
+		filesToRemove = [self.ProInclude, "typesystem_ScintillaEdit.xml",
+			"typesystem_ScintillaEdit.iface.cache",
 			"../../bin/ScintillaEditPy.so", "../../bin/ScintillaConstants.py"]
 		for file in filesToRemove:
 			try:
@@ -0,0 +1,463 @@
+#!/usr/bin/env python
+# Benchmark.py - time alternative implementations of the source regeneration scripts
+# and the test harness.
+# Released to the public domain.
+
+# Each benchmark compares the current implementation with the one it replaced and
+# prints the time taken by each. Run with the names of benchmarks to run or with no
+# arguments to run them all.
+# Requires Python 2.7 or later
+
+from __future__ import with_statement
+
+import codecs, ctypes, glob, locale, os, string, sys, timeit
+
+import Face
+import FileGenerator
+import GenerateCaseConvert
+import ScintillaData
+import UnicodeProperties
+import UnicodeTables
+
+sys.path.append("../test")
+import ScintillaCallable
+
+ifacePath = "../include/Scintilla.iface"
+
+def splitFeatures(lines):
+    # Feature decoding with str.split as performed before the regular expression decoder
+    currentCategory = ""
+    currentComment = []
+    currentCommentFinished = 0
+    for line in lines:
+        line = Face.sanitiseLine(line)
+        if line:
+            if line[0] == "#":
+                if line[1] == " ":
+                    if currentCommentFinished:
+                        currentComment = []
+                        currentCommentFinished = 0
+                    currentComment.append(line[2:])
+            else:
+                currentCommentFinished = 1
+                featureType, featureVal = line.split(" ", 1)
+                if featureType in ["fun", "get", "set"]:
+                    retType, name, value, param1, param2 = Face.decodeFunction(featureVal)
+                    p1 = Face.decodeParam(param1)
+                    p2 = Face.decodeParam(param2)
+                    yield Face.Feature(name, featureType, value, currentCategory,
+                        retType, p1, p2, currentComment)
+                elif featureType == "evt":
+                    retType, name, value = Face.decodeEvent(featureVal)
+                    yield Face.Feature(name, featureType, value, currentCategory,
+                        retType, comment=currentComment)
+                elif featureType == "cat":
+                    currentCategory = featureVal
+                elif featureType in ["val", "enu", "lex"]:
+                    name, value = featureVal.split("=", 1)
+                    yield Face.Feature(name, featureType, value, currentCategory)
+
+def timeBest(function, repeat=3):
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+def report(title, times):
+    print(title)
+    baseline = times[0][1]
+    for name, seconds in times:
+        print("    %-20s %8.3f seconds  %5.2fx" % (name, seconds, baseline / seconds))
+
+def benchmarkFace():
+    with open(ifacePath) as f:
+        lines = f.read().splitlines() * 100
+    if list(splitFeatures(lines[:5000])) != list(Face.featuresFromLines(lines[:5000])):
+        raise Exception("Decoders differ")
+    report("Decode Scintilla.iface x 100 (%d lines)" % len(lines), [
+        ("split", timeBest(lambda: list(splitFeatures(lines)))),
+        ("regular expression", timeBest(lambda: list(Face.featuresFromLines(lines)))),
+    ])
+
+# Template expansion with string concatenation as performed before compiled definitions
+def concatenatingCopyWithInsertion(input, commentPrefix, retainDefs, lists):
+    copying = 1
+    generated = False
+    listid = 0
+    output = []
+    for line in input.splitlines(0):
+        isStartGenerated = line.lstrip().startswith(commentPrefix + "++Autogenerated")
+        if copying and not isStartGenerated:
+            output.append(line)
+        if isStartGenerated:
+            if retainDefs:
+                output.append(line)
+            copying = 0
+            generated = False
+        elif not copying and not generated:
+            # Generating
+            if line.startswith(commentPrefix + "**"):
+                # Pattern to transform input data
+                if retainDefs:
+                    output.append(line)
+                definition = line[len(commentPrefix + "**"):]
+                if (commentPrefix == "<!--") and (" -->" in definition):
+                    definition = definition.replace(" -->", "")
+                listid = 0
+                if definition[0] in string.digits:
+                    listid = int(definition[:1])
+                    definition = definition[2:]
+                # Hide double slashes as a control character
+                definition = definition.replace("\\\\", "\001")
+                # Do some normal C style transforms
+                definition = definition.replace("\\n", "\n")
+                definition = definition.replace("\\t", "\t")
+                # Get the doubled backslashes back as single backslashes
+                definition = definition.replace("\001", "\\")
+                startRepeat = definition.find("\\(")
+                endRepeat = definition.find("\\)")
+                intro = definition[:startRepeat]
+                out = ""
+                if intro.endswith("\n"):
+                    pos = 0
+                else:
+                    pos = len(intro)
+                out += intro
+                middle = definition[startRepeat+2:endRepeat]
+                for i in lists[listid]:
+                    item = middle.replace("\\*", i)
+                    if pos and (pos + len(item) >= 80):
+                        out += "\\\n"
+                        pos = 0
+                    out += item
+                    pos += len(item)
+                    if item.endswith("\n"):
+                        pos = 0
+                outro = definition[endRepeat+2:]
+                out += outro
+                out = out.replace("\n", FileGenerator.lineEnd) # correct EOLs in generated content
+                output.append(out)
+            else:
+                # Simple form with no rule to transform input
+                output.extend(lists[0])
+            generated = True
+        if line.lstrip().startswith(commentPrefix + "--Autogenerated") or \
+            line.lstrip().startswith(commentPrefix + "~~Autogenerated"):
+            copying = 1
+            if retainDefs:
+                output.append(line)
+    output = [line.rstrip(" \t") for line in output] # trim trailing whitespace
+    return FileGenerator.lineEnd.join(output) + FileGenerator.lineEnd
+
+def generatedLists(text, commentPrefix):
+    # Recover the lists used to generate each section of an already generated file
+    lists = []
+    inSection = False
+    for line in text.splitlines():
+        if line.startswith(commentPrefix + "++Autogenerated"):
+            inSection = True
+        elif line.startswith(commentPrefix + "--Autogenerated"):
+            inSection = False
+        elif inSection and line and not line.startswith(commentPrefix + "**"):
+            lists[-1].append(line)
+            continue
+        else:
+            continue
+        if inSection:
+            lists.append([])
+    return lists
+
+def benchmarkTemplate():
+    # scintilla.mak has definition lines so each lexer file is expanded through them
+    with codecs.open("../win32/scintilla.mak", "r", "utf-8") as mak:
+        makText = mak.read()
+    makLists = [ScintillaData.ScintillaData("../").lexFiles]
+    if FileGenerator.CopyWithInsertion(makText, "#", True, makLists) != makText:
+        raise Exception("scintilla.mak not reproduced")
+    with codecs.open("../src/CaseConvert.cxx", "r", "utf-8") as caseConvert:
+        caseText = caseConvert.read()
+    caseLists = generatedLists(caseText, "//")
+    if FileGenerator.CopyWithInsertion(caseText, "//", True, caseLists) != caseText:
+        raise Exception("CaseConvert.cxx not reproduced")
+    for text, prefix, lists in [(makText, "#", makLists), (caseText, "//", caseLists)]:
+        if concatenatingCopyWithInsertion(text, prefix, True, lists) != \
+            FileGenerator.CopyWithInsertion(text, prefix, True, lists):
+            raise Exception("Template engines differ")
+    report("Generate scintilla.mak x 20", [
+        ("concatenation", timeBest(lambda: [concatenatingCopyWithInsertion(
+            makText, "#", True, makLists) for i in range(20)])),
+        ("compiled", timeBest(lambda: [FileGenerator.CopyWithInsertion(
+            makText, "#", True, makLists) for i in range(20)])),
+    ])
+    report("Generate CaseConvert.cxx x 20", [
+        ("concatenation", timeBest(lambda: [concatenatingCopyWithInsertion(
+            caseText, "//", True, caseLists) for i in range(20)])),
+        ("compiled", timeBest(lambda: [FileGenerator.CopyWithInsertion(
+            caseText, "//", True, caseLists) for i in range(20)])),
+    ])
+
+def readable(path):
+    # The separate Find functions read with the locale's encoding
+    try:
+        with open(path) as f:
+            f.read()
+        return True
+    except UnicodeDecodeError:
+        return False
+
+def benchmarkLexers():
+    lexFiles = [path for path in glob.glob("../lexers/Lex*.cxx") if readable(path)]
+    def separate():
+        return [(ScintillaData.FindModules(path), ScintillaData.FindProperties(path),
+            ScintillaData.FindPropertyDocumentation(path)) for path in lexFiles]
+    def single():
+        return [ScintillaData.ScanLexFile(path) for path in lexFiles]
+    if separate() != single():
+        raise Exception("Lexer scanners differ")
+    report("Scan %d lexer files readable with %s" % (len(lexFiles),
+        locale.getpreferredencoding()), [
+        ("three passes", timeBest(separate)),
+        ("single mmap pass", timeBest(single)),
+    ])
+
+def serialConversionSets():
+    # Examine every code point as performed before blocks and shards
+    complexes = []
+    symmetrics = []
+    for ch in range(sys.maxunicode):
+        if ch >= 0xd800 and ch <= 0xDBFF:
+            continue
+        if ch >= 0xdc00 and ch <= 0xDFFF:
+            continue
+        uch = chr(ch)
+
+        fold = uch.casefold()
+        upper = uch.upper()
+        lower = uch.lower()
+        symmetric = False
+        if uch != upper and len(upper) == 1 and uch == lower and uch == fold:
+            lowerUpper = upper.lower()
+            foldUpper = upper.casefold()
+            if lowerUpper == foldUpper and lowerUpper == uch:
+                symmetric = True
+                symmetrics.append((ch, ord(upper), ch - ord(upper)))
+        if uch != lower and len(lower) == 1 and uch == upper and lower == fold:
+            upperLower = lower.upper()
+            if upperLower == uch:
+                symmetric = True
+
+        if fold == uch:
+            fold = ""
+        if upper == uch:
+            upper = ""
+        if lower == uch:
+            lower = ""
+
+        if (fold or upper or lower) and not symmetric:
+            complexes.append((uch, fold, upper, lower))
+
+    return symmetrics, complexes
+
+def listNonRanges(symmetrics, rangeGroups):
+    # Range coverage tested with a list as performed before using a set
+    rangeCoverage = list(UnicodeTables.flatten(
+        [range(r[0], r[0]+r[2]*r[3], r[3]) for r in rangeGroups]))
+    return [(l, u) for l, u, d in symmetrics if l not in rangeCoverage]
+
+def benchmarkCaseConvert():
+    serial = serialConversionSets()
+    cached = UnicodeProperties.readCache(UnicodeProperties.cacheName)
+    if cached is None:
+        cached = UnicodeProperties.Sweep()
+        UnicodeProperties.writeCache(UnicodeProperties.cacheName, cached)
+    if serial != GenerateCaseConvert.conversionSets(UnicodeProperties.Sweep(False)) or \
+        serial != GenerateCaseConvert.conversionSets(UnicodeProperties.Sweep(True)) or \
+        serial != GenerateCaseConvert.conversionSets(cached):
+        raise Exception("Case conversion sets differ")
+    rangeGroups, nonRanges = GenerateCaseConvert.groupRanges(serial[0])
+    if listNonRanges(serial[0], rangeGroups) != nonRanges:
+        raise Exception("Non ranges differ")
+    report("Find case conversions", [
+        ("every code point", timeBest(serialConversionSets)),
+        ("blocks", timeBest(lambda: GenerateCaseConvert.conversionSets(
+            UnicodeProperties.Sweep(False)))),
+        ("blocks and processes", timeBest(lambda: GenerateCaseConvert.conversionSets(
+            UnicodeProperties.Sweep(True)))),
+        ("cached properties", timeBest(lambda: GenerateCaseConvert.conversionSets(
+            UnicodeProperties.readCache(UnicodeProperties.cacheName)))),
+    ])
+    report("Group ranges", [
+        ("list coverage", timeBest(lambda: listNonRanges(serial[0], rangeGroups))),
+        ("set coverage", timeBest(lambda: GenerateCaseConvert.groupRanges(serial[0]))),
+    ])
+
+class CastingSciCall(ScintillaCallable.SciCall):
+    # Arguments converted with ctypes.cast as performed before charPointer
+    def __call__(self, w=0, l=0):
+        ww = ctypes.cast(w, ctypes.c_char_p)
+        if self._stringResult:
+            lengthBytes = self._fn(self._ptr, self._msg, ww, None)
+            if lengthBytes == 0:
+                return bytearray()
+            result = (ctypes.c_byte * lengthBytes)(0)
+            lengthBytes2 = self._fn(self._ptr, self._msg, ww, ctypes.cast(result, ctypes.c_char_p))
+            assert lengthBytes == lengthBytes2
+            return bytearray(result)[:lengthBytes]
+        else:
+            ll = ctypes.cast(l, ctypes.c_char_p)
+            return self._fn(self._ptr, self._msg, ww, ll)
+
+class GetattrCallable:
+    # Attribute access examining the face on every access as performed before
+    # ScintillaCallable made dispatch tables
+    def __init__(self, face, scifn, sciptr):
+        self.__dict__["face"] = face
+        self.__dict__["used"] = set()
+        self.__dict__["all"] = set()
+        self.__dict__["k"] = {}
+        for f in face.features:
+            self.all.add(f)
+            if face.features[f].featureType == "val":
+                self.k[f] = self.face.features[f].number
+            elif face.features[f].featureType == "evt":
+                self.k["SCN_"+f] = self.face.features[f].number
+        self.__dict__["_scifn"] = ScintillaCallable.sciFX(scifn)
+        self.__dict__["_sciptr"] = sciptr
+    def __getattr__(self, name):
+        if name in self.face.features:
+            self.used.add(name)
+            feature = self.face.features[name]
+            value = feature.number
+            if feature.featureType == "val":
+                self.__dict__[name] = value
+                return value
+            else:
+                if feature.param2Type == "stringresult" and \
+                    name not in ["GetText", "GetLine", "GetCurLine"]:
+                    return CastingSciCall(self._scifn, self._sciptr, value, True)
+                else:
+                    return CastingSciCall(self._scifn, self._sciptr, value)
+        elif self.face.properties.get(name, (None, None))[0]:
+            getter = self.face.properties[name][0]
+            self.used.add(getter)
+            feature = self.face.features[getter]
+            value = feature.number
+            if not name.startswith("Get") and \
+                not feature.param1Type and \
+                not feature.param2Type and \
+                feature.returnType in ["bool", "int", "position"]:
+                return self._scifn(self._sciptr, value, None, None)
+        raise AttributeError(name)
+    def __setattr__(self, name, val):
+        if self.face.properties.get(name, (None, None))[1]:
+            setter = self.face.properties[name][1]
+            self.used.add(setter)
+            feature = self.face.features[setter]
+            value = feature.number
+            if not name.startswith("Set"):
+                if feature.param1Type in ["bool", "int", "position"]:
+                    return self._scifn(self._sciptr, value, ctypes.c_char_p(val), None)
+                elif feature.param2Type in ["string"]:
+                    return self._scifn(self._sciptr, value, None, ctypes.c_char_p(val))
+                raise AttributeError(name)
+        raise AttributeError(name)
+
+# The direct function signature with pointers that are not dereferenced
+recordingFX = ctypes.CFUNCTYPE(ctypes.c_long, ctypes.c_void_p, ctypes.c_int,
+    ctypes.c_void_p, ctypes.c_void_p)
+
+def recordingFunction(messages):
+    # A direct function that records each message instead of calling Scintilla
+    def directFunction(ptr, msg, w, l):
+        messages.append((msg, w, l is None))
+        return msg
+    return recordingFX(directFunction)
+
+def accessAll(ed, face):
+    # Access every message, constant, and property returning the results and messages
+    # sent. Events, enumerations, and lexers were treated as messages before.
+    def access(name):
+        value = getattr(ed, name)
+        if isinstance(value, ScintillaCallable.SciCall):
+            value = (value._msg, value._stringResult, value(1, 2))
+        return value
+    results = []
+    for name in sorted(face.features):
+        if face.features[name].featureType in ["fun", "get", "set", "val"]:
+            results.append((name, access(name)))
+    for name in sorted(name for name in face.properties if name not in face.features):
+        try:
+            results.append((name, access(name)))
+        except AttributeError:
+            results.append((name, None))
+        try:
+            setattr(ed, name, 1)
+        except AttributeError:
+            pass
+    return results, sorted(ed.used)
+
+calls = 100000
+
+def callMany(ed):
+    for i in range(calls):
+        ed.GetCurrentPos()
+        ed.SetAnchor(i)
+        ed.Length
+        ed.CurrentPos = i
+        ed.INVALID_POSITION
+
+def callDirect(scifn):
+    for i in range(calls):
+        scifn(None, 2008, None, None)
+        scifn(None, 2026, ctypes.c_char_p(i), ctypes.c_char_p(0))
+        scifn(None, 2006, None, None)
+        scifn(None, 2141, ctypes.c_char_p(i), None)
+
+def benchmarkCallable():
+    face = Face.Face()
+    face.ReadFromFile(ifacePath)
+    messages = []
+    directFunction = recordingFunction(messages)
+    address = ctypes.cast(directFunction, ctypes.c_void_p).value
+    getattrResults = accessAll(GetattrCallable(face, address, None), face)
+    getattrMessages = list(messages)
+    del messages[:]
+    if accessAll(ScintillaCallable.ScintillaCallable(face, address, None), face) != \
+        getattrResults or messages != getattrMessages:
+        raise Exception("Callables differ")
+    def count(ed):
+        del messages[:]
+        callMany(ed)
+    getattrCallable = GetattrCallable(face, address, None)
+    dispatchCallable = ScintillaCallable.ScintillaCallable(face, address, None)
+    profiledCallable = ScintillaCallable.ScintillaCallable(face, address, None)
+    profiledCallable.Instrument(ScintillaCallable.CallProfile())
+    # Instrumenting then stopping should leave no cost behind
+    stoppedCallable = ScintillaCallable.ScintillaCallable(face, address, None)
+    stoppedCallable.Instrument(ScintillaCallable.CallProfile())
+    callMany(stoppedCallable)
+    stoppedCallable.Instrument(None)
+    scifn = ScintillaCallable.sciFX(address)
+    report("ScintillaCallable %d x 4 calls and a constant" % calls, [
+        ("__getattr__", timeBest(lambda: count(getattrCallable))),
+        ("dispatch tables", timeBest(lambda: count(dispatchCallable))),
+        ("profiled", timeBest(lambda: count(profiledCallable))),
+        ("profile stopped", timeBest(lambda: count(stoppedCallable))),
+        ("direct function", timeBest(lambda: callDirect(scifn))),
+    ])
+    profiledCallable.profile.Clear()
+    callMany(profiledCallable)
+    if profiledCallable.profile.messages["GetCurrentPos"].count != calls:
+        raise Exception("Calls not counted")
+
+benchmarks = {
+    "callable": benchmarkCallable,
+    "caseconvert": benchmarkCaseConvert,
+    "face": benchmarkFace,
+    "lexers": benchmarkLexers,
+    "template": benchmarkTemplate,
+}
+
+def main(names):
+    for name in names or sorted(benchmarks.keys()):
+        benchmarks[name]()
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -3,6 +3,25 @@
 # Released to the public domain.
 # Requires Python 2.5 or later
 
+# Face.ReadFromFile builds a complete model of the interface. Tools that need only some
+# features can instead iterate over featuresFromFile which decodes features lazily and
+# can be restricted to particular feature types and categories:
+#     for feature in Face.featuresFromFile("Scintilla.iface", ["lex"]): ...
+
+# The parsed form of an interface file is cached in a file next to it (Scintilla.iface.cache)
+# so that repeated reads of an unchanged file avoid parsing. The cache records the size,
+# modification time and SHA-1 hash of the file it was made from and is only used when either
+# the size and modification time or the hash match the current file.
+
+from __future__ import with_statement
+
+import hashlib, os, pickle, re
+
+import FileGenerator
+
+# Increment when the cached representation changes so older caches are ignored
+cacheVersion = 3
+
 def sanitiseLine(line):
 	if line[-1:] == '\n': line = line[:-1]
 	if line.find("##") != -1:
@@ -10,6 +29,9 @@ def sanitiseLine(line):
 	line = line.strip()
 	return line
 	
+# The split based decoders below are retained for compatibility but features are now
+# decoded with the regular expressions that follow them.
+
 def decodeFunction(featureVal):
 	retType, rest = featureVal.split(" ", 1)
 	nameIdent, params = rest.split("(")
@@ -37,6 +59,368 @@ def decodeParam(p):
 			name = nv
 	return type, name, value
 
+# Each feature line is decoded by a single match of the pattern for its kind of feature, chosen
+# by the start of the line. Function and event patterns also match any trailing white space
+# and "##" comment while these are removed from the ends of values and categories afterwards.
+# Definitions are made from sequences of pieces so that, when a line does not match,
+# the pieces can be tried in turn to find the column where decoding failed.
+
+paramPiece = r"\s*(?:(\w+)\s+(\w+)(?:=(\w+))?)?\s*"
+functionPieces = [r"(fun|get|set)\s+", r"(\w+)\s+", r"(\w+)", "=", r"(\w+)", r"\(",
+	paramPiece, ",", paramPiece, r"\)", r"[ \t]*(?:\#\#.*)?\r?\n?$"]
+eventPieces = [r"evt\s+", r"(\w+)\s+", r"(\w+)", "=", r"(\w+)", r"\(", r"[^()]*", r"\)",
+	r"[ \t]*(?:\#\#.*)?\r?\n?$"]
+valuePieces = [r"(val|enu|lex)\s+", r"([^=]+)", "=", r"(.*)"]
+categoryPieces = [r"cat\s+", r"(.*\S.*)"]
+
+featurePieces = {
+	"fun": functionPieces, "get": functionPieces, "set": functionPieces,
+	"evt": eventPieces,
+	"val": valuePieces, "enu": valuePieces, "lex": valuePieces,
+	"cat": categoryPieces,
+}
+
+linePatterns = {
+	"function": re.compile(r"[ \t]*" + "".join(functionPieces)),
+	"event": re.compile(r"[ \t]*" + "".join(eventPieces)),
+	"value": re.compile(r"[ \t]*" + "".join(valuePieces)),
+	"category": re.compile(r"[ \t]*" + "".join(categoryPieces)),
+}
+
+def trimmed(text):
+	# Remove trailing white space and "##" comment
+	if "##" in text:
+		text = text[:text.find("##")]
+	return text.rstrip()
+
+kindsOfFeature = {
+	"fun": "function", "get": "function", "set": "function",
+	"evt": "event",
+	"val": "value", "enu": "value", "lex": "value",
+	"cat": "category",
+}
+
+whiteSpace = frozenset([" ", "\t"])
+
+class IfaceError(ValueError):
+	""" Failure to decode a line of an interface file with its location.
+	Column numbers start at 1 and include any leading white space. """
+	def __init__(self, fileName, lineNumber, column, message):
+		ValueError.__init__(self, "%s:%d:%d: %s" % (fileName, lineNumber, column, message))
+		self.fileName = fileName
+		self.lineNumber = lineNumber
+		self.column = column
+		self.message = message
+
+def failureColumn(line, featureType):
+	# Find the first piece of the definition that does not match and return its 0-based column
+	position = 0
+	for piece in featurePieces[featureType]:
+		m = re.compile(piece).match(line, position)
+		if not m:
+			break
+		position = m.end()
+	return position
+
+def checkUndecoded(rawLine, fileName, lineNumber):
+	# Raise an IfaceError unless a line that did not match its pattern is an unknown feature type
+	line = sanitiseLine(rawLine)
+	featureType = line[:3]
+	if featureType in featurePieces and line[3:4] in whiteSpace:
+		column = failureColumn(line, featureType)
+		leading = len(rawLine) - len(rawLine.lstrip())
+		raise IfaceError(fileName, lineNumber, leading + column + 1,
+			"can not decode %s definition at '%s'" % (featureType, line[column:]))
+	if " " not in line:
+		raise IfaceError(fileName, lineNumber, len(rawLine.rstrip()) + 1,
+			"expected feature type followed by definition")
+
+# Names used by the dictionary view of a Feature mapped to its attributes
+dictionaryAttributes = {
+	"FeatureType": "featureType", "ReturnType": "returnType", "Value": "value",
+	"Param1Type": "param1Type", "Param1Name": "param1Name", "Param1Value": "param1Value",
+	"Param2Type": "param2Type", "Param2Name": "param2Name", "Param2Value": "param2Value",
+	"Category": "category", "Comment": "comment",
+}
+
+# Dictionary keys present for each type of feature
+functionKeys = ("FeatureType", "ReturnType", "Value",
+	"Param1Type", "Param1Name", "Param1Value", "Param2Type", "Param2Name", "Param2Value",
+	"Category", "Comment")
+eventKeys = ("FeatureType", "ReturnType", "Value", "Category", "Comment")
+valueKeys = ("FeatureType", "Category", "Value")
+featureKeys = {"fun": functionKeys, "get": functionKeys, "set": functionKeys, "evt": eventKeys}
+
+def numericValue(value):
+	# The value as an integer or None for values like "SCLEX_CPP SCE_C_" that are not numbers
+	try:
+		return int(value, 0)
+	except ValueError:
+		return None
+
+class Feature(object):
+	""" A feature defined in the interface file.
+	Fields are attributes and 'number' is the value as an integer, or None when not numeric.
+	Indexing with the older dictionary keys like "Param1Type" is also supported. """
+	__slots__ = ("name", "featureType", "returnType", "value", "number",
+		"param1Type", "param1Name", "param1Value", "param2Type", "param2Name", "param2Value",
+		"category", "comment")
+
+	def __init__(self, name, featureType, value, category,
+		returnType="", param1=("", "", ""), param2=("", "", ""), comment=None):
+		self.name = name
+		self.featureType = featureType
+		self.returnType = returnType
+		self.value = value
+		self.number = numericValue(value)
+		self.param1Type, self.param1Name, self.param1Value = param1
+		self.param2Type, self.param2Name, self.param2Value = param2
+		self.category = category
+		self.comment = comment
+
+	def __getstate__(self):
+		return tuple(getattr(self, attribute) for attribute in self.__slots__)
+
+	def __setstate__(self, state):
+		for attribute, value in zip(self.__slots__, state):
+			setattr(self, attribute, value)
+
+	def __eq__(self, other):
+		return isinstance(other, Feature) and self.__getstate__() == other.__getstate__()
+
+	def __ne__(self, other):
+		return not self == other
+
+	def __repr__(self):
+		return "Feature(%r, %r, %r)" % (self.name, self.featureType, self.value)
+
+	# Dictionary view for callers written for the original dictionary representation
+
+	def keys(self):
+		return list(featureKeys.get(self.featureType, valueKeys))
+
+	def __iter__(self):
+		return iter(self.keys())
+
+	def __len__(self):
+		return len(self.keys())
+
+	def __contains__(self, key):
+		return key in featureKeys.get(self.featureType, valueKeys)
+
+	def __getitem__(self, key):
+		if key not in self:
+			raise KeyError(key)
+		return getattr(self, dictionaryAttributes[key])
+
+	def __setitem__(self, key, value):
+		if key not in self:
+			raise KeyError(key)
+		setattr(self, dictionaryAttributes[key], value)
+		if key == "Value":
+			self.number = numericValue(value)
+
+	def get(self, key, default=None):
+		if key in self:
+			return self[key]
+		return default
+
+	def items(self):
+		return [(key, self[key]) for key in self.keys()]
+
+	def values(self):
+		return [self[key] for key in self.keys()]
+
+def featuresFromLines(lines, featureTypes=None, categories=None, fileName="<iface>"):
+	""" Generate a Feature for each feature defined in 'lines'.
+	When 'featureTypes' or 'categories' are specified, only features with those types
+	or in those categories are decoded and produced.
+	Raises IfaceError, mentioning 'fileName', for lines that can not be decoded. """
+	currentCategory = ""
+	currentComment = []
+	currentCommentFinished = 0
+	filtered = featureTypes is not None or categories is not None
+	lineNumber = 0
+	for rawLine in lines:
+		lineNumber += 1
+		if filtered:
+			featureType = rawLine.lstrip()[:3]
+			if featureType in featurePieces and featureType != "cat" and \
+				((featureTypes is not None and featureType not in featureTypes) or \
+				(categories is not None and currentCategory not in categories)):
+				currentCommentFinished = 1
+				continue
+		kind = kindsOfFeature.get(rawLine[:3])
+		if kind is None:
+			line = sanitiseLine(rawLine)
+			if not line:
+				continue
+			if line[0] == "#":
+				if line[1:2] == " ":
+					if currentCommentFinished:
+						currentComment = []
+						currentCommentFinished = 0
+					currentComment.append(line[2:])
+				continue
+			kind = kindsOfFeature.get(line[:3])
+		m = kind and linePatterns[kind].match(rawLine)
+		if not m:
+			checkUndecoded(rawLine, fileName, lineNumber)
+			# Unknown feature types are reserved for future use so are ignored
+			currentCommentFinished = 1
+			continue
+		currentCommentFinished = 1
+		if kind == "value":
+			featureType, name, value = m.groups()
+			yield Feature(name, featureType, trimmed(value), currentCategory)
+		elif kind == "function":
+			featureType, retType, name, value, p1Type, p1Name, p1Value, p2Type, p2Name, p2Value = \
+				m.groups("")
+			yield Feature(name, featureType, value, currentCategory, retType,
+				(p1Type, p1Name, p1Value), (p2Type, p2Name, p2Value), currentComment)
+		elif kind == "event":
+			retType, name, value = m.groups()
+			yield Feature(name, "evt", value, currentCategory, retType, comment=currentComment)
+		elif kind == "category":
+			currentCategory = trimmed(m.group(1))
+
+def featuresFromFile(name, featureTypes=None, categories=None):
+	""" Generate features from the interface file 'name' as it is read.
+	See featuresFromLines for the meaning of 'featureTypes' and 'categories'. """
+	with open(name) as f:
+		for feature in featuresFromLines(f, featureTypes, categories, name):
+			yield feature
+
+def readCache(cacheName):
+	# Return the contents of a cache file or None if missing, unreadable or from another version
+	try:
+		with open(cacheName, "rb") as f:
+			cached = pickle.load(f)
+	except Exception:
+		return None
+	if not isinstance(cached, dict) or cached.get("version") != cacheVersion:
+		return None
+	return cached
+
+def writeCache(cacheName, signature, state):
+	cached = {"version": cacheVersion, "state": state}
+	cached.update(signature)
+	try:
+		# Readers never see a partial cache
+		FileGenerator.writeAtomically(cacheName, pickle.dumps(cached, 2))
+	except (IOError, OSError):
+		# Read-only tree or similar so continue without a cache
+		pass
+
+def outputHashes(outputs):
+	# SHA-1 hashes of the files in 'outputs' with None for missing files
+	hashes = {}
+	for output in outputs:
+		try:
+			with open(output, "rb") as f:
+				hashes[os.path.abspath(output)] = hashlib.sha1(f.read()).hexdigest()
+		except IOError:
+			hashes[os.path.abspath(output)] = None
+	return hashes
+
+def readSnapshot(snapshotName, dependencies=(), outputs=()):
+	""" Return the Face saved by writeSnapshot in 'snapshotName' or None when it is missing,
+	unreadable or older than any of the files in 'dependencies', or when any of the files in
+	'outputs' is not as it was when the snapshot was written. """
+	try:
+		snapshotTime = os.path.getmtime(snapshotName)
+		for dependency in dependencies:
+			if os.path.getmtime(dependency) > snapshotTime:
+				return None
+	except OSError:
+		return None
+	cached = readCache(snapshotName)
+	if not cached:
+		return None
+	hashes = outputHashes(outputs)
+	recorded = cached.get("outputs", {})
+	for output in hashes:
+		if hashes[output] is None or recorded.get(output) != hashes[output]:
+			# Edited or removed since generated so generate again
+			return None
+	face = Face()
+	face.setState(cached["state"])
+	return face
+
+def writeSnapshot(snapshotName, face, outputs=()):
+	""" Save 'face' so that a later run can find what changed with readSnapshot and diff.
+	Call after generating 'outputs' from 'face' so their contents are recorded. """
+	writeCache(snapshotName, {"outputs": outputHashes(outputs)}, face.getState())
+
+# Feature attributes that define a feature, as opposed to its comment
+definitionFields = ("featureType", "returnType", "value",
+	"param1Type", "param1Name", "param1Value", "param2Type", "param2Name", "param2Value",
+	"category")
+
+class FaceDifference(object):
+	""" The features added, removed and changed between two Faces, as lists of names, and
+	whether the features in both were reordered. Changes to comments count as changes. """
+
+	def __init__(self, old, new):
+		self.old = old
+		self.new = new
+		self.added = [name for name in new.order if name not in old.features]
+		self.removed = [name for name in old.order if name not in new.features]
+		self.changed = [name for name in new.order
+			if name in old.features and old.features[name] != new.features[name]]
+		self.reordered = [name for name in old.order if name in new.features] != \
+			[name for name in new.order if name in old.features]
+
+	def __bool__(self):
+		return bool(self.added or self.removed or self.changed or self.reordered)
+
+	__nonzero__ = __bool__
+
+	def Affects(self, selector, fields=definitionFields):
+		""" Whether the difference may change output generated from the features for which
+		selector(feature) is true when that output only depends on the attributes in 'fields'. """
+		for name in self.added:
+			if selector(self.new.features[name]):
+				return True
+		for name in self.removed:
+			if selector(self.old.features[name]):
+				return True
+		for name in self.changed:
+			oldFeature = self.old.features[name]
+			newFeature = self.new.features[name]
+			if selector(oldFeature) or selector(newFeature):
+				for field in fields:
+					if getattr(oldFeature, field) != getattr(newFeature, field):
+						return True
+		if self.reordered:
+			oldSelected = [name for name in self.old.order
+				if name in self.new.features and selector(self.old.features[name])]
+			newSelected = [name for name in self.new.order
+				if name in self.old.features and selector(self.new.features[name])]
+			return oldSelected != newSelected
+		return False
+
+def diff(old, new):
+	""" Return a FaceDifference describing how Face 'new' differs from Face 'old'. """
+	return FaceDifference(old, new)
+
+# Indexes built after parsing so that callers can avoid scanning all features:
+#     featuresByType
+#         { featureType: [names in file order] }
+#     featuresByCategory
+#         { category: [names in file order] }
+#     namesByNumber
+#         { message number: name } for fun, get and set features
+#     eventsByNumber
+#         { event number: name } for evt features
+#     properties
+#         { property name: (getter name or None, setter name or None) } for get features
+#         named Get<property> and set features named Set<property>
+#     ordinals
+#         { name: position in order }
+indexNames = ("featuresByType", "featuresByCategory", "namesByNumber", "eventsByNumber",
+	"properties", "ordinals")
+
 class Face:
 
 	def __init__(self):
@@ -44,74 +428,107 @@ class Face:
 		self.features = {}
 		self.values = {}
 		self.events = {}
-		
-	def ReadFromFile(self, name):
-		currentCategory = ""
-		currentComment = []
-		currentCommentFinished = 0
-		file = open(name)
-		for line in file.readlines():
-			line = sanitiseLine(line)
-			if line:
-				if line[0] == "#":
-					if line[1] == " ":
-						if currentCommentFinished:
-							currentComment = []
-							currentCommentFinished = 0
-						currentComment.append(line[2:])
+		self.buildIndexes()
+
+	def buildIndexes(self):
+		self.featuresByType = {}
+		self.featuresByCategory = {}
+		self.namesByNumber = {}
+		self.eventsByNumber = {}
+		self.properties = {}
+		self.ordinals = {}
+		for ordinal, name in enumerate(self.order):
+			feature = self.features[name]
+			featureType = feature.featureType
+			self.ordinals[name] = ordinal
+			self.featuresByType.setdefault(featureType, []).append(name)
+			self.featuresByCategory.setdefault(feature.category, []).append(name)
+			if featureType in ["fun", "get", "set"]:
+				self.namesByNumber[feature.number] = name
+			elif featureType == "evt":
+				self.eventsByNumber[feature.number] = name
+			if (featureType == "get" and name.startswith("Get")) or \
+				(featureType == "set" and name.startswith("Set")):
+				getter, setter = self.properties.get(name[3:], (None, None))
+				if featureType == "get":
+					getter = name
 				else:
-					currentCommentFinished = 1
-					featureType, featureVal = line.split(" ", 1)
-					if featureType in ["fun", "get", "set"]:
-						try:
-							retType, name, value, param1, param2 = decodeFunction(featureVal)
-						except ValueError:
-							print("Failed to decode %s" % line)
-							raise
-						p1 = decodeParam(param1)
-						p2 = decodeParam(param2)
-						self.features[name] = { 
-							"FeatureType": featureType, 
-							"ReturnType": retType,
-							"Value": value, 
-							"Param1Type": p1[0], "Param1Name": p1[1], "Param1Value": p1[2], 
-							"Param2Type": p2[0],	"Param2Name": p2[1], "Param2Value": p2[2],
-							"Category": currentCategory, "Comment": currentComment
-						}
-						if value in self.values:
-							raise Exception("Duplicate value " + value + " " + name)
-						self.values[value] = 1
-						self.order.append(name)
-					elif featureType == "evt":
-						retType, name, value = decodeEvent(featureVal)
-						self.features[name] = { 
-							"FeatureType": featureType, 
-							"ReturnType": retType,
-							"Value": value, 
-							"Category": currentCategory, "Comment": currentComment
-						}
-						if value in self.events:
-							raise Exception("Duplicate event " + value + " " + name)
-						self.events[value] = 1
-						self.order.append(name)
-					elif featureType == "cat":
-						currentCategory = featureVal
-					elif featureType == "val":
-						try:
-							name, value = featureVal.split("=", 1)
-						except ValueError:
-							print("Failure %s" % featureVal)
-							raise Exception()
-						self.features[name] = { 
-							"FeatureType": featureType, 
-							"Category": currentCategory, 
-							"Value": value }
-						self.order.append(name)
-					elif featureType == "enu" or featureType == "lex":
-						name, value = featureVal.split("=", 1)
-						self.features[name] = { 
-							"FeatureType": featureType, 
-							"Category": currentCategory, 
-							"Value": value }
-						self.order.append(name)
+					setter = name
+				self.properties[name[3:]] = (getter, setter)
+
+	def FeatureNames(self, featureTypes=None, category=None, excludeCategory=None):
+		""" Return the names of features, in file order, restricted to those with a type in
+		'featureTypes' and those in 'category' and not in 'excludeCategory' when specified.
+		The result may be an index so should not be modified. """
+		if category is not None:
+			names = self.featuresByCategory.get(category, [])
+		elif featureTypes is None:
+			names = self.order
+		elif len(featureTypes) == 1:
+			names = self.featuresByType.get(featureTypes[0], [])
+		else:
+			names = []
+			for featureType in featureTypes:
+				names.extend(self.featuresByType.get(featureType, []))
+			names.sort(key=self.ordinals.get)
+			featureTypes = None
+		if featureTypes is not None and category is not None:
+			names = [name for name in names if self.features[name].featureType in featureTypes]
+		if excludeCategory is not None:
+			names = [name for name in names if self.features[name].category != excludeCategory]
+		return names
+		
+	def ReadFromFile(self, name, cacheName=None):
+		""" Read the interface definition from 'name', using a cache file when it is
+		valid. 'cacheName' defaults to 'name' + ".cache" and may be False to disable caching. """
+		if cacheName is None:
+			cacheName = name + ".cache"
+		st = os.stat(name)
+		signature = {"size": st.st_size, "mtime": st.st_mtime}
+		cached = None
+		if cacheName:
+			cached = readCache(cacheName)
+			if cached and cached["size"] == st.st_size and cached["mtime"] == st.st_mtime:
+				self.setState(cached["state"])
+				return
+		with open(name, "rb") as f:
+			contents = f.read()
+		signature["hash"] = hashlib.sha1(contents).hexdigest()
+		if cached and cached["hash"] == signature["hash"]:
+			# Touched but not modified so refresh the cached file signature
+			self.setState(cached["state"])
+		else:
+			self.ReadFromLines(contents.decode("utf-8").splitlines(), name)
+		if cacheName:
+			writeCache(cacheName, signature, self.getState())
+
+	def getState(self):
+		state = {"order": self.order, "features": self.features,
+			"values": self.values, "events": self.events}
+		for index in indexNames:
+			state[index] = getattr(self, index)
+		return state
+
+	def setState(self, state):
+		self.order = state["order"]
+		self.features = state["features"]
+		self.values = state["values"]
+		self.events = state["events"]
+		for index in indexNames:
+			setattr(self, index, state[index])
 
+	def ReadFromLines(self, lines, fileName="<iface>"):
+		for feature in featuresFromLines(lines, fileName=fileName):
+			name = feature.name
+			value = feature.value
+			self.features[name] = feature
+			if feature.featureType in ["fun", "get", "set"]:
+				if value in self.values:
+					raise Exception("Duplicate value " + value + " " + name)
+				self.values[value] = 1
+			elif feature.featureType == "evt":
+				if value in self.events:
+					raise Exception("Duplicate event " + value + " " + name)
+				self.events[value] = 1
+			self.order.append(name)
+		self.buildIndexes()
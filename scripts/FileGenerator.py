@@ -10,30 +10,49 @@
 # generated by the CopyWithInsertion function. After the whole string is 
 # instantiated, it is compared with the target file and if different the file 
 # is rewritten.
+# A manifest, .regen-manifest.json, in each directory with generated files records a
+# hash of the inputs to each generated file along with the size, modification time and
+# hash of what was last written. When these match, the file is not generated again.
 
 from __future__ import with_statement
 
-import codecs, os, re, string, sys
+import codecs, hashlib, json, os, re, string, sys, threading
 
 lineEnd = "\r\n" if sys.platform == "win32" else "\n"
 
-def UpdateFile(filename, updated):
-    """ If the file contents are different to updated then copy updated into the
-    file else leave alone so Mercurial and make don't treat it as modified. """
+def writeAtomically(filename, data):
+    """ Write the bytes 'data' to a temporary file then rename it to 'filename' so
+    that 'filename' is never missing or partly written. """
+    temporaryName = filename + ".tmp"
+    with open(temporaryName, "wb") as outfile:
+        outfile.write(data)
+    try:
+        os.replace(temporaryName, filename)
+    except AttributeError:	# Python 2 does not have os.replace
+        if os.path.exists(filename):
+            os.remove(filename)
+        os.rename(temporaryName, filename)
+
+def UpdateBinaryFile(filename, updated):
+    """ If the file contents are different to the bytes updated then copy updated
+    into the file else leave alone so Mercurial and make don't treat it as modified. """
     newOrChanged = "Changed"
     try:
-        with codecs.open(filename, "r", "utf-8") as infile:
+        with open(filename, "rb") as infile:
             original = infile.read()
         if updated == original:
             # Same as before so don't write
             return
-        os.unlink(filename)
     except IOError:	# File is not there yet
         newOrChanged = "New"
-    with codecs.open(filename, "w", "utf-8") as outfile:
-        outfile.write(updated)
+    writeAtomically(filename, updated)
     print("%s %s" % (newOrChanged, filename))
 
+def UpdateFile(filename, updated):
+    """ If the file contents are different to updated then copy updated into the
+    file else leave alone so Mercurial and make don't treat it as modified. """
+    UpdateBinaryFile(filename, updated.encode("utf-8"))
+
 # Automatically generated sections contain start and end comments,
 # a definition line and the results.
 # The results are replaced by regenerating based on the definition line.
@@ -45,13 +64,76 @@ def UpdateFile(filename, updated):
 # \* is replaced by each list item. \t, and \n are tab and newline.
 # If there is no definition line than the first list is copied verbatim.
 # If retainDefs then the comments controlling generation are copied.
+# Definition lines are compiled once into Definition objects which are cached.
+
+class Definition(object):
+    """ A definition line compiled so that it can be expanded for lists of items.
+    """
+
+    def __init__(self, line, commentPrefix):
+        definition = line[len(commentPrefix + "**"):]
+        if (commentPrefix == "<!--") and (" -->" in definition):
+            definition = definition.replace(" -->", "")
+        self.listid = 0
+        if definition[0] in string.digits:
+            self.listid = int(definition[:1])
+            definition = definition[2:]
+        # Hide double slashes as a control character
+        definition = definition.replace("\\\\", "\001")
+        # Do some normal C style transforms
+        definition = definition.replace("\\n", "\n")
+        definition = definition.replace("\\t", "\t")
+        # Get the doubled backslashes back as single backslashes
+        definition = definition.replace("\001", "\\")
+        startRepeat = definition.find("\\(")
+        endRepeat = definition.find("\\)")
+        self.intro = definition[:startRepeat]
+        if self.intro.endswith("\n"):
+            self.introLength = 0
+        else:
+            self.introLength = len(self.intro)
+        self.middle = definition[startRepeat+2:endRepeat]
+        self.outro = definition[endRepeat+2:]
+
+    def Expand(self, items):
+        """ Return the text for 'items' with lines continued before 80 columns.
+        """
+        middle = self.middle
+        pieces = [self.intro]
+        pos = self.introLength
+        for i in items:
+            item = middle.replace("\\*", i)
+            if pos and (pos + len(item) >= 80):
+                pieces.append("\\\n")
+                pos = 0
+            pieces.append(item)
+            pos += len(item)
+            if item.endswith("\n"):
+                pos = 0
+        pieces.append(self.outro)
+        out = "".join(pieces)
+        return out.replace("\n", lineEnd) # correct EOLs in generated content
+
+compiledDefinitions = {}
+
+def CompiledDefinition(line, commentPrefix):
+    key = (line, commentPrefix)
+    definition = compiledDefinitions.get(key)
+    if definition is None:
+        definition = Definition(line, commentPrefix)
+        compiledDefinitions[key] = definition
+    return definition
+
 def CopyWithInsertion(input, commentPrefix, retainDefs, lists):
     copying = 1
     generated = False
-    listid = 0
     output = []
+    startGenerated = commentPrefix + "++Autogenerated"
+    endGenerated = (commentPrefix + "--Autogenerated", commentPrefix + "~~Autogenerated")
+    definitionStart = commentPrefix + "**"
     for line in input.splitlines(0):
-        isStartGenerated = line.lstrip().startswith(commentPrefix + "++Autogenerated")
+        stripped = line.lstrip()
+        isStartGenerated = stripped.startswith(startGenerated)
         if copying and not isStartGenerated:
             output.append(line)
         if isStartGenerated:
@@ -61,70 +143,113 @@ def CopyWithInsertion(input, commentPrefix, retainDefs, lists):
             generated = False
         elif not copying and not generated:
             # Generating
-            if line.startswith(commentPrefix + "**"):
+            if line.startswith(definitionStart):
                 # Pattern to transform input data
                 if retainDefs:
                     output.append(line)
-                definition = line[len(commentPrefix + "**"):]
-                if (commentPrefix == "<!--") and (" -->" in definition):
-                    definition = definition.replace(" -->", "")
-                listid = 0
-                if definition[0] in string.digits:
-                    listid = int(definition[:1])
-                    definition = definition[2:]
-                # Hide double slashes as a control character
-                definition = definition.replace("\\\\", "\001")
-                # Do some normal C style transforms
-                definition = definition.replace("\\n", "\n")
-                definition = definition.replace("\\t", "\t")
-                # Get the doubled backslashes back as single backslashes
-                definition = definition.replace("\001", "\\")
-                startRepeat = definition.find("\\(")
-                endRepeat = definition.find("\\)")
-                intro = definition[:startRepeat]
-                out = ""
-                if intro.endswith("\n"):
-                    pos = 0
-                else:
-                    pos = len(intro)
-                out += intro
-                middle = definition[startRepeat+2:endRepeat]
-                for i in lists[listid]:
-                    item = middle.replace("\\*", i)
-                    if pos and (pos + len(item) >= 80):
-                        out += "\\\n"
-                        pos = 0
-                    out += item
-                    pos += len(item)
-                    if item.endswith("\n"):
-                        pos = 0
-                outro = definition[endRepeat+2:]
-                out += outro
-                out = out.replace("\n", lineEnd) # correct EOLs in generated content
-                output.append(out)
+                definition = CompiledDefinition(line, commentPrefix)
+                output.append(definition.Expand(lists[definition.listid]))
             else:
                 # Simple form with no rule to transform input
                 output.extend(lists[0])
             generated = True
-        if line.lstrip().startswith(commentPrefix + "--Autogenerated") or \
-            line.lstrip().startswith(commentPrefix + "~~Autogenerated"):
+        if stripped.startswith(endGenerated):
             copying = 1
             if retainDefs:
                 output.append(line)
     output = [line.rstrip(" \t") for line in output] # trim trailing whitespace
     return lineEnd.join(output) + lineEnd
 
+manifestName = ".regen-manifest.json"
+# Set to False to always generate files
+useManifest = True
+
+# Manifests are shared by generators running on different threads
+manifestLock = threading.Lock()
+manifests = {}
+
+def readManifest(directory):
+    if directory not in manifests:
+        try:
+            with open(os.path.join(directory, manifestName)) as f:
+                manifests[directory] = json.load(f)
+        except (IOError, ValueError):
+            manifests[directory] = {}
+    return manifests[directory]
+
+def writeManifest(directory):
+    path = os.path.join(directory, manifestName)
+    try:
+        data = json.dumps(manifests[directory], indent=1, sort_keys=True)
+        writeAtomically(path, data.encode("utf-8"))
+    except (IOError, OSError):
+        # The manifest only saves time so failing to write it is not an error
+        pass
+
+def fileHash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+def inputsHash(inpath, outpath, commentPrefix, retainDefs, lists):
+    """ Hash everything that determines the contents generated for 'outpath'. """
+    h = hashlib.sha1()
+    if inpath != outpath:
+        # A separate template is an input but a file generated in place would
+        # change its own hash
+        info = os.stat(inpath)
+        h.update(("%s %d %r\0" % (inpath, info.st_size, info.st_mtime)).encode("utf-8"))
+    h.update(("%s %s\0" % (commentPrefix, retainDefs)).encode("utf-8"))
+    for l in lists:
+        h.update("\0".join(l).encode("utf-8"))
+        h.update(b"\1")
+    return h.hexdigest()
+
+def isUpToDate(outpath, inputs):
+    """ Whether 'outpath' was generated from 'inputs' and has not changed since. """
+    directory, name = os.path.split(os.path.abspath(outpath))
+    with manifestLock:
+        entry = readManifest(directory).get(name)
+    if not entry or entry["inputs"] != inputs:
+        return False
+    try:
+        info = os.stat(outpath)
+    except OSError:
+        return False
+    if info.st_size != entry["size"]:
+        return False
+    if info.st_mtime != entry["mtime"]:
+        # Touched but may not have changed
+        if fileHash(outpath) != entry["contents"]:
+            return False
+        recordOutput(outpath, inputs)
+    return True
+
+def recordOutput(outpath, inputs):
+    directory, name = os.path.split(os.path.abspath(outpath))
+    info = os.stat(outpath)
+    with manifestLock:
+        readManifest(directory)[name] = {"inputs": inputs, "size": info.st_size,
+            "mtime": info.st_mtime, "contents": fileHash(outpath)}
+        writeManifest(directory)
+
 def GenerateFile(inpath, outpath, commentPrefix, retainDefs, *lists):
     """Generate 'outpath' from 'inpath'.
     """
 
     try:
+        inputs = None
+        if useManifest:
+            inputs = inputsHash(inpath, outpath, commentPrefix, retainDefs, lists)
+            if isUpToDate(outpath, inputs):
+                return
         with codecs.open(inpath, "r", "UTF-8") as infile:
             original = infile.read()
         updated = CopyWithInsertion(original, commentPrefix,
             retainDefs, lists)
         UpdateFile(outpath, updated)
-    except IOError:
+        if inputs:
+            recordOutput(outpath, inputs)
+    except (IOError, OSError):
         print("Can not open %s" % inpath)
 
 def Generate(inpath, outpath, commentPrefix, *lists):
@@ -137,22 +262,47 @@ def Regenerate(filename, commentPrefix, *lists):
     """
     Generate(filename, filename, commentPrefix, *lists)
 
-def UpdateLineInFile(path, linePrefix, lineReplace):
-    lines = []
-    updated = False
-    with codecs.open(path, "r", "utf-8") as f:
-        for l in f.readlines():
+# Edits for EditFile which change the contents of a file held as a string.
+
+class LineEdit(object):
+    """ Replace the first line that starts with linePrefix with lineReplace.
+    Trailing white space is removed from every line. """
+    def __init__(self, linePrefix, lineReplace):
+        self.linePrefix = linePrefix
+        self.lineReplace = lineReplace
+
+    def Apply(self, contents):
+        lines = []
+        updated = False
+        for l in contents.splitlines():
             l = l.rstrip()
-            if not updated and l.startswith(linePrefix):
-                lines.append(lineReplace)
+            if not updated and l.startswith(self.linePrefix):
+                lines.append(self.lineReplace)
                 updated = True
             else:
                 lines.append(l)
-    contents = lineEnd.join(lines) + lineEnd
-    UpdateFile(path, contents)
+        return lineEnd.join(lines) + lineEnd
 
-def ReplaceREInFile(path, match, replace):
+class REEdit(object):
+    """ Replace every match of the regular expression match with replace. """
+    def __init__(self, match, replace):
+        self.match = match
+        self.replace = replace
+
+    def Apply(self, contents):
+        return re.sub(self.match, self.replace, contents)
+
+def EditFile(path, edits):
+    """ Apply each of edits in turn to the contents of path then write the result
+    once if it changed. """
     with codecs.open(path, "r", "utf-8") as f:
         contents = f.read()
-    contents = re.sub(match, replace, contents)
+    for edit in edits:
+        contents = edit.Apply(contents)
     UpdateFile(path, contents)
+
+def UpdateLineInFile(path, linePrefix, lineReplace):
+    EditFile(path, [LineEdit(linePrefix, lineReplace)])
+
+def ReplaceREInFile(path, match, replace):
+    EditFile(path, [REEdit(match, replace)])
@@ -1,4 +1,5 @@
 # Script to generate CaseConvert.cxx from Python's Unicode data
+# The case conversions are read from the properties cached by UnicodeProperties.py
 # Should be run rarely when a Python with a new version of Unicode data is available.
 # Requires Python 3.3 or later
 # Should not be run with old versions of Python.
@@ -16,9 +17,18 @@
 # strings with original, folded, upper, and lower separated by '|'.
 # There are 126 complex cases.
 
-import codecs, itertools, os, string, sys, unicodedata
+# Conversions are also written as two-stage tables so they can be found directly
+# from a code point. For each of fold, upper, and lower there is an index from each
+# block of 128 code points to a block of differences between the converted and
+# original code point. Blocks are shared between conversions and repeated blocks,
+# mostly those with no conversions, are stored once. Conversions to more than one
+# character are marked with complexDelta and found in the complex strings.
+
+import codecs, itertools, os, string, sys
 
 from FileGenerator import Regenerate
+import UnicodeProperties
+from UnicodeTables import flatten, valueLines
 
 def contiguousRanges(l, diff):
     # l is s list of lists
@@ -30,35 +40,37 @@ def contiguousRanges(l, diff):
         out[-1].append(s)
     return out
 
-def flatten(listOfLists):
-    "Flatten one level of nesting"
-    return itertools.chain.from_iterable(listOfLists)
-    
-def conversionSets():
+def conversionSets(properties=None):
     # For all Unicode characters, see whether they have case conversions
-    # Return 2 sets: one of simple symmetric conversion cases and another
+    # Return 2 lists: one of simple symmetric conversion cases and another
     # with complex cases.
+    # The conversions are read from properties or, when None, the cached properties.
+    if properties is None:
+        properties = UnicodeProperties.Properties()
     complexes = []
     symmetrics = []
     for ch in range(sys.maxunicode):
+        if not (properties.flags[ch] or properties.uppers[ch] or
+            properties.lowers[ch] or properties.folds[ch]):
+            continue
         if ch >= 0xd800 and ch <= 0xDBFF:
             continue
         if ch >= 0xdc00 and ch <= 0xDFFF:
             continue
         uch = chr(ch)
 
-        fold = uch.casefold()
-        upper = uch.upper()
-        lower = uch.lower()
+        fold = properties.Fold(ch)
+        upper = properties.Upper(ch)
+        lower = properties.Lower(ch)
         symmetric = False
         if uch != upper and len(upper) == 1 and uch == lower and uch == fold:
-            lowerUpper = upper.lower()
-            foldUpper = upper.casefold()
+            lowerUpper = properties.Lower(ord(upper))
+            foldUpper = properties.Fold(ord(upper))
             if lowerUpper == foldUpper and lowerUpper == uch:
                 symmetric = True
                 symmetrics.append((ch, ord(upper), ch - ord(upper)))
         if uch != lower and len(lower) == 1 and uch == upper and lower == fold:
-            upperLower = lower.upper()
+            upperLower = properties.Upper(ord(lower))
             if upperLower == uch:
                 symmetric = True
 
@@ -96,12 +108,64 @@ def groupRanges(symmetrics):
 
     rangeGroups = sorted(longGroups+longOneGroups, key=lambda s: s[0])
 
-    rangeCoverage = list(flatten([range(r[0], r[0]+r[2]*r[3], r[3]) for r in rangeGroups]))
+    rangeCoverage = set(flatten([range(r[0], r[0]+r[2]*r[3], r[3]) for r in rangeGroups]))
     
     nonRanges = [(l, u) for l, u, d in symmetrics if l not in rangeCoverage]
 
     return rangeGroups, nonRanges
 
+caseBlockShift = 7
+caseBlockSize = 1 << caseBlockShift
+
+# Larger than any difference between code points
+complexDelta = 0x110000
+
+def conversionDeltas(pairs, complexes):
+    # Return dictionaries for fold, upper, and lower conversions from each code
+    # point with a conversion to the difference to its converted form.
+    # pairs is a list of (lower, upper) symmetric conversions.
+    folds = {}
+    uppers = {}
+    lowers = {}
+    for lower, upper in pairs:
+        folds[upper] = lower - upper
+        lowers[upper] = lower - upper
+        uppers[lower] = upper - lower
+    for uch, fold, upper, lower in complexes:
+        ch = ord(uch)
+        for deltas, converted in ((folds, fold), (uppers, upper), (lowers, lower)):
+            if len(converted) == 1:
+                deltas[ch] = ord(converted) - ch
+            elif converted:
+                deltas[ch] = complexDelta
+    return folds, uppers, lowers
+
+def caseBlockTables(deltaSets):
+    # Return a block index for each dictionary in deltaSets and the list of unique
+    # blocks that they refer to. Blocks above the last conversion are not included.
+    limit = max(max(deltas) for deltas in deltaSets) + 1
+    blockCount = (limit + caseBlockSize - 1) // caseBlockSize
+    blocks = []
+    blockNumbers = {}
+    indexes = []
+    for deltas in deltaSets:
+        index = []
+        for blockStart in range(0, blockCount * caseBlockSize, caseBlockSize):
+            block = tuple(deltas.get(ch, 0) for ch in range(blockStart, blockStart + caseBlockSize))
+            if block not in blockNumbers:
+                blockNumbers[block] = len(blocks)
+                blocks.append(block)
+            index.append(blockNumbers[block])
+        indexes.append(index)
+    return indexes, blocks
+
+def caseBlockLines(pairs, complexes):
+    # Return lists of lines for the fold, upper, and lower block indexes and for
+    # the blocks of differences.
+    indexes, blocks = caseBlockTables(conversionDeltas(pairs, complexes))
+    print(len(indexes[0]), "blocks indexed,", len(blocks), "unique blocks")
+    return [valueLines(index) for index in indexes] + [valueLines(flatten(blocks))]
+
 def escape(s):
 	return "".join((chr(c) if chr(c) in string.ascii_letters else "\\x%x" % c) for c in s.encode('utf-8'))
 
@@ -121,6 +185,11 @@ def updateCaseConvert():
     complexLines = ['"%s|%s|%s|%s|"' % tuple(escape(t) for t in x) for x in complexes]
     print(len(complexLines), "complex")
 
-    Regenerate("../src/CaseConvert.cxx", "//", rangeLines, nonRangeLines, complexLines)
+    foldBlockLines, upperBlockLines, lowerBlockLines, deltaLines = \
+        caseBlockLines([(l, u) for l, u, d in symmetrics], complexes)
+
+    Regenerate("../src/CaseConvert.cxx", "//", rangeLines, nonRangeLines, complexLines,
+        foldBlockLines, upperBlockLines, lowerBlockLines, deltaLines)
 
-updateCaseConvert()
+if __name__ == "__main__":
+    updateCaseConvert()
@@ -0,0 +1,92 @@
+# Script to generate the UTF-8 word class table in CharClassify.cxx
+# The general categories are read from CharacterCategory.cxx so that word classes are
+# from the same version of Unicode as the categories used by lexers.
+# Should be run after CharacterCategory.cxx is regenerated for a new version of Unicode.
+# Requires Python 3.3 or later
+
+# The table is a state machine that decodes a UTF-8 character a byte at a time
+# and finishes with the word class of the character.
+# The first row has an entry for each lead byte and every other row has an entry for
+# each trail byte 0x80 .. 0xBF. An entry is either a result or the position of the next
+# row less 0x80 so that the next entry is found by adding the next byte.
+# A result is a CharClassify::cc or resultInvalid when the bytes are not a valid
+# character. As in UTF8Classify, surrogates, overlong forms, and non-characters are
+# invalid. Rows are built from the last byte up and repeated rows are only stored once.
+
+import sys
+
+from FileGenerator import Regenerate
+from UnicodeTables import checkedInCategories, valueLines
+
+# Must match CharClassify::cc
+ccSpace, ccNewLine, ccWord, ccPunctuation = range(4)
+# Must match CharClassify::utf8ClassInvalid
+resultInvalid = 4
+
+trailBytes = 0x40
+firstRowLength = 0x100
+
+def wordClass(category):
+    # Letters, numbers, marks, and connector punctuation like '_' form words
+    if category in ("Zl", "Zp"):
+        return ccNewLine
+    if category[0] == "Z" or category[0] == "C":
+        return ccSpace
+    if category[0] in "LNM" or category == "Pc":
+        return ccWord
+    return ccPunctuation
+
+def isNonCharacter(ch):
+    return (ch & 0xFFFE) == 0xFFFE or (ch >= 0xFDD0 and ch <= 0xFDEF)
+
+def isValid(ch):
+    return not (ch >= 0xD800 and ch <= 0xDFFF) and not isNonCharacter(ch)
+
+def characterTree(categories):
+    # Return a tree of dictionaries from bytes to subtrees ending with word classes
+    # for every valid multiple byte character
+    tree = {}
+    for ch in range(0x80, sys.maxunicode + 1):
+        if isValid(ch):
+            node = tree
+            utf8 = chr(ch).encode("utf-8")
+            for byte in utf8[:-1]:
+                node = node.setdefault(byte, {})
+            node[utf8[-1]] = wordClass(categories[ch])
+    return tree
+
+class StateTable(object):
+    """ Rows of the state machine with repeated rows stored once. """
+
+    def __init__(self):
+        self.rows = []
+        self.rowNumbers = {}
+
+    def entry(self, value):
+        if isinstance(value, dict):
+            row = tuple(self.entry(value.get(byte, resultInvalid))
+                for byte in range(0x80, 0x80 + trailBytes))
+            if row not in self.rowNumbers:
+                self.rowNumbers[row] = len(self.rows)
+                self.rows.append(row)
+            # Entries are offsets to a row less 0x80 so a trail byte can be added
+            return firstRowLength + self.rowNumbers[row] * trailBytes - 0x80
+        return value
+
+    def Values(self, tree):
+        first = [self.entry(tree.get(byte, resultInvalid)) for byte in range(firstRowLength)]
+        values = first + [value for row in self.rows for value in row]
+        # Entries are unsigned short
+        assert len(values) < 0x10000
+        return values
+
+def updateCharClassify(filename):
+    version, categories = checkedInCategories("../lexlib/CharacterCategory.cxx")
+    values = StateTable().Values(characterTree(categories))
+    print(len(values) * 2, "bytes in table")
+
+    created = "// Created from CharacterCategory.cxx,  Unicode %s" % version
+    Regenerate(filename, "//", [created] + valueLines(values))
+
+if __name__ == "__main__":
+    updateCharClassify("../src/CharClassify.cxx")
@@ -1,4 +1,5 @@
 # Script to generate CharacterCategory.cxx from Python's Unicode data
+# The categories are read from the properties cached by UnicodeProperties.py
 # Should be run rarely when a Python with a new version of Unicode data is available.
 # Requires Python 3.3 or later
 # Should not be run with old versions of Python.
@@ -6,6 +7,8 @@
 import codecs, os, platform, sys, unicodedata
 
 from FileGenerator import Regenerate
+import UnicodeProperties
+from UnicodeTables import uniqueBlocks, flatten, valueLines
 
 def findCategories(filename):
     with codecs.open(filename, "r", "UTF-8") as infile:
@@ -14,23 +17,63 @@ def findCategories(filename):
     print(values)
     return [v[2:] for v in values]
 
-def updateCharacterCategory(filename):
-    values = ["// Created with Python %s,  Unicode %s" % (
-        platform.python_version(), unicodedata.unidata_version)]
-    category = unicodedata.category(chr(0))
+# The categories of characters below trieLimit are also written as a three stage
+# table. Each block of 16 characters is a block of categories and each block of 32
+# category blocks is an index block. Repeated blocks are only stored once.
+# With Unicode 6.1 the table is about 13K which is close to the run length list.
+# Characters at or above trieLimit are mostly unassigned or private use so are
+# found with a binary search of the run length list.
+trieLimit = 0x30000
+categoryBlockShift = 4
+indexBlockShift = 5
+
+def categoryRuns(properties=None):
+    # Return a list of (start, category number) for each run of characters with the
+    # same category
+    # The categories are read from properties or, when None, the cached properties.
+    if properties is None:
+        properties = UnicodeProperties.Properties()
+    numbers = [categories.index(name) for name in UnicodeProperties.categoryNames]
+    propertyCategories = properties.categories
+    runs = []
+    category = propertyCategories[0]
     startRange = 0
     for ch in range(sys.maxunicode):
-        uch = chr(ch)
-        if unicodedata.category(uch) != category:
-            value = startRange * 32 + categories.index(category)
-            values.append("%d," % value)
-            category = unicodedata.category(uch)
+        if propertyCategories[ch] != category:
+            runs.append((startRange, numbers[category]))
+            category = propertyCategories[ch]
             startRange = ch
-    value = startRange * 32 + categories.index(category)
-    values.append("%d," % value)
+    runs.append((startRange, numbers[category]))
+    return runs
+
+def categoryTrie(runs):
+    # Return the top index, the index blocks, and the category blocks for characters
+    # below trieLimit
+    characterCategories = []
+    for i, (start, category) in enumerate(runs):
+        if start >= trieLimit:
+            break
+        end = runs[i+1][0] if i+1 < len(runs) else trieLimit
+        characterCategories.extend([category] * (min(end, trieLimit) - start))
+    blockIndex, categoryBlocks = uniqueBlocks(characterCategories, 1 << categoryBlockShift)
+    topIndex, indexBlocks = uniqueBlocks(blockIndex, 1 << indexBlockShift)
+    # The top index is unsigned char and index blocks unsigned short
+    assert len(indexBlocks) < 0x100 and len(categoryBlocks) < 0x10000
+    return topIndex, flatten(indexBlocks), flatten(categoryBlocks)
+
+def updateCharacterCategory(filename):
+    values = ["// Created with Python %s,  Unicode %s" % (
+        platform.python_version(), unicodedata.unidata_version)]
+    runs = categoryRuns()
+    values.extend("%d," % (startRange * 32 + category) for startRange, category in runs)
+
+    topIndex, indexBlocks, categoryBlocks = categoryTrie(runs)
+    print(len(topIndex) + len(indexBlocks) * 2 + len(categoryBlocks), "bytes in table")
 
-    Regenerate(filename, "//", values)
+    Regenerate(filename, "//", values,
+        valueLines(topIndex), valueLines(indexBlocks), valueLines(categoryBlocks))
 
 categories = findCategories("../lexlib/CharacterCategory.h")
 
-updateCharacterCategory("../lexlib/CharacterCategory.cxx")
+if __name__ == "__main__":
+    updateCharacterCategory("../lexlib/CharacterCategory.cxx")
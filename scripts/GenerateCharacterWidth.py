@@ -0,0 +1,84 @@
+# Script to generate the character width table in UniConversion.cxx
+# The general categories are read from CharacterCategory.cxx so that the table is from
+# the same version of Unicode as the other tables and East Asian Widths, which do not
+# change for assigned characters, from the cache maintained by UnicodeProperties.py.
+# Should be run after CharacterCategory.cxx is regenerated for a new version of Unicode.
+# Requires Python 3.3 or later
+
+# Each character is classified by how many cells it occupies in a fixed pitch font.
+# Narrow characters have East Asian Width Na or H. Wide characters have East Asian
+# Width W or F and are in one of wideBlocks, for which ViewStyle samples the width.
+# Other wide characters like emoji, Yi, and CJK radicals often come from fallback fonts
+# with their own widths so are measured.
+# Combining marks, format characters, and the Hangul medial vowels and final
+# consonants are zero width. Everything else, including characters with ambiguous
+# width, controls, unassigned code points, and characters from scripts where the width
+# depends on neighbouring characters, has to be measured.
+# The classes are written as a three stage table for characters below trieLimit in
+# the same way as GenerateCharacterCategory.py. Each block of 16 characters is a
+# block of classes and each block of 32 class blocks is an index block.
+# Repeated blocks are only stored once. With Unicode 6.1 the table is about 5K.
+
+from FileGenerator import Regenerate
+import UnicodeProperties
+from UnicodeTables import checkedInCategories, uniqueBlocks, flatten, valueLines
+
+# Must match the CharacterWidth enumeration in UniConversion.h
+cwOther, cwNarrow, cwWide, cwZero = range(4)
+
+# Characters at or above trieLimit are unassigned, private use, or tags and variation
+# selectors which are all measured
+trieLimit = 0x40000
+classBlockShift = 4
+indexBlockShift = 5
+
+# Blocks of wide characters with the character sampled for each in ViewStyle::Refresh
+wideBlocks = [
+    (0x3000, 0x303F),   # CJK Symbols and Punctuation: IDEOGRAPHIC FULL STOP
+    (0x3040, 0x309F),   # Hiragana: HIRAGANA LETTER A
+    (0x30A0, 0x30FF),   # Katakana: KATAKANA LETTER A
+    (0x4E00, 0x9FFF),   # CJK Unified Ideographs: U+4E00
+    (0xAC00, 0xD7AF),   # Hangul Syllables: HANGUL SYLLABLE GA
+    (0xFF00, 0xFFEF),   # Halfwidth and Fullwidth Forms: FULLWIDTH LATIN CAPITAL LETTER A
+]
+
+def inWideBlock(ch):
+    return any(start <= ch <= end for start, end in wideBlocks)
+
+def characterWidth(properties, categories, ch):
+    category = categories[ch]
+    if category in ("Cc", "Cs", "Co", "Cn"):
+        return cwOther
+    if ch == 0xAD:
+        # SOFT HYPHEN is visible in some fonts
+        return cwOther
+    if category in ("Mn", "Me", "Cf") or (ch >= 0x1160 and ch <= 0x11FF):
+        return cwZero
+    eastAsianWidth = properties.EastAsianWidth(ch)
+    if eastAsianWidth in ("W", "F"):
+        return cwWide if inWideBlock(ch) else cwOther
+    if eastAsianWidth in ("Na", "H"):
+        return cwNarrow
+    return cwOther
+
+def widthTrie(widths):
+    # Return the top index, the index blocks, and the class blocks for widths
+    blockIndex, classBlocks = uniqueBlocks(widths, 1 << classBlockShift)
+    topIndex, indexBlocks = uniqueBlocks(blockIndex, 1 << indexBlockShift)
+    # The top index is unsigned char and index blocks unsigned short
+    assert len(indexBlocks) < 0x100 and len(classBlocks) < 0x10000
+    return topIndex, flatten(indexBlocks), flatten(classBlocks)
+
+def updateCharacterWidth(filename):
+    properties = UnicodeProperties.Properties()
+    version, categories = checkedInCategories("../lexlib/CharacterCategory.cxx")
+    widths = [characterWidth(properties, categories, ch) for ch in range(trieLimit)]
+    topIndex, indexBlocks, classBlocks = widthTrie(widths)
+    print(len(topIndex) + len(indexBlocks) * 2 + len(classBlocks), "bytes in table")
+
+    created = "// Created from CharacterCategory.cxx,  Unicode %s" % version
+    Regenerate(filename, "//", [created] + valueLines(topIndex),
+        valueLines(indexBlocks), valueLines(classBlocks))
+
+if __name__ == "__main__":
+    updateCharacterWidth("../src/UniConversion.cxx")
@@ -10,46 +10,70 @@ import Face
 
 from FileGenerator import UpdateFile, Generate, Regenerate, UpdateLineInFile, lineEnd
 
+def isLexicalValue(name):
+	return "SCE_" in name or "SCLEX_" in name
+
+# Which features each header depends upon so that headers are only regenerated when
+# those features change.
+
+def inLexHFile(feature):
+	return feature.featureType == "val" and isLexicalValue(feature.name)
+
+def inHFile(feature):
+	return feature.featureType in ["fun", "get", "set", "evt"] or \
+		(feature.featureType == "val" and not isLexicalValue(feature.name))
+
+# Generated headers also depend on the code that generates them
+generatorPath = os.path.abspath(__file__)
+
 def printLexHFile(f):
 	out = []
-	for name in f.order:
-		v = f.features[name]
-		if v["FeatureType"] in ["val"]:
-			if "SCE_" in name or "SCLEX_" in name:
-				out.append("#define " + name + " " + v["Value"])
+	for name in f.FeatureNames(["val"]):
+		if isLexicalValue(name):
+			out.append("#define " + name + " " + f.features[name].value)
 	return out
 
 def printHFile(f):
 	out = []
 	previousCategory = ""
 	anyProvisional = False
-	for name in f.order:
+	for name in f.FeatureNames(excludeCategory="Deprecated"):
 		v = f.features[name]
-		if v["Category"] != "Deprecated":
-			if v["Category"] == "Provisional" and previousCategory != "Provisional":
-				out.append("#ifndef SCI_DISABLE_PROVISIONAL")
-				anyProvisional = True
-			previousCategory = v["Category"]
-			if v["FeatureType"] in ["fun", "get", "set"]:
-				featureDefineName = "SCI_" + name.upper()
-				out.append("#define " + featureDefineName + " " + v["Value"])
-			elif v["FeatureType"] in ["evt"]:
-				featureDefineName = "SCN_" + name.upper()
-				out.append("#define " + featureDefineName + " " + v["Value"])
-			elif v["FeatureType"] in ["val"]:
-				if not ("SCE_" in name or "SCLEX_" in name):
-					out.append("#define " + name + " " + v["Value"])
+		if v.category == "Provisional" and previousCategory != "Provisional":
+			out.append("#ifndef SCI_DISABLE_PROVISIONAL")
+			anyProvisional = True
+		previousCategory = v.category
+		if v.featureType in ["fun", "get", "set"]:
+			featureDefineName = "SCI_" + name.upper()
+			out.append("#define " + featureDefineName + " " + v.value)
+		elif v.featureType in ["evt"]:
+			featureDefineName = "SCN_" + name.upper()
+			out.append("#define " + featureDefineName + " " + v.value)
+		elif v.featureType in ["val"]:
+			if not isLexicalValue(name):
+				out.append("#define " + name + " " + v.value)
 	if anyProvisional:
 		out.append("#endif")
 	return out
 
-def RegenerateAll(root, showMaxID):
-	f = Face.Face()
-	f.ReadFromFile(root + "include/Scintilla.iface")
-	Regenerate(root + "include/Scintilla.h", "/* ", printHFile(f))
-	Regenerate(root + "include/SciLexer.h", "/* ", printLexHFile(f))
+def RegenerateAll(root, showMaxID, f=None):
+	""" Regenerate the headers from 'f' or, when it is None, from a Face read from the
+	interface file. """
+	if f is None:
+		f = Face.Face()
+		f.ReadFromFile(root + "include/Scintilla.iface")
+	# Compare with the interface the headers were last generated from
+	snapshotName = root + "include/Scintilla.iface.HFacer.cache"
+	headers = [root + "include/Scintilla.h", root + "include/SciLexer.h"]
+	previous = Face.readSnapshot(snapshotName, [generatorPath], headers) or Face.Face()
+	difference = Face.diff(previous, f)
+	if difference.Affects(inHFile):
+		Regenerate(root + "include/Scintilla.h", "/* ", printHFile(f))
+	if difference.Affects(inLexHFile, ["featureType", "value"]):
+		Regenerate(root + "include/SciLexer.h", "/* ", printLexHFile(f))
+	Face.writeSnapshot(snapshotName, f, headers)
 	if showMaxID:
-		valueSet = set(int(x) for x in f.values if int(x) < 3000)
+		valueSet = set(x for x in f.namesByNumber if x < 3000)
 		maximumID = max(valueSet)
 		print("Maximum ID is %d" % maximumID)
 		#~ valuesUnused = sorted(x for x in range(2001,maximumID) if x not in valueSet)
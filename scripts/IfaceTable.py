@@ -0,0 +1,324 @@
+#!/usr/bin/env python
+# IfaceTable.py - generate a binary table of the Scintilla interface from Scintilla.iface
+# and read it through a memory map.
+# Released to the public domain.
+# Requires Python 2.6 or later
+
+# The table lets hosts that do not want to parse Scintilla.iface look up messages, events
+# and constants by number or by name with a binary search over a memory mapped file.
+# Only the information needed to call Scintilla is included: names, numbers, feature types,
+# categories and the types of the return value and parameters. Documentation comments,
+# parameter names, and enu and lex features are omitted.
+#
+# All integers are little-endian. The file starts with a header:
+#     char[4] magic "SIFT"
+#     uint16 version
+#     uint16 size of a record in bytes
+#     uint32 record count, offset of records
+#     uint32 message count, offset of message index
+#     uint32 event count, offset of event index
+#     uint32 offset of name index
+#     uint32 offsets of feature type, category, and parameter type name tables
+#     uint32 offset and size of string pool
+# Records, one for each fun, get, set, evt and val feature in file order:
+#     int64 number
+#     uint32 name offset in string pool
+#     uint16 name length
+#     uint8 feature type, category, return type, parameter 1 type, parameter 2 type
+#         as indexes into the name tables
+#     uint8 padding
+# Indexes are arrays of uint32 record numbers:
+#     message index holds fun, get and set records sorted by number
+#     event index holds evt records sorted by number
+#     name index holds all records sorted by the UTF-8 bytes of their names
+# Name tables are a uint32 count followed by that many (uint32 offset, uint16 length,
+# uint16 padding) entries referring to UTF-8 strings in the string pool.
+
+from __future__ import with_statement
+
+import mmap, os, struct
+
+import Face
+from FileGenerator import UpdateBinaryFile
+
+magic = b"SIFT"
+tableVersion = 1
+
+headerFormat = struct.Struct("<4sHHIIIIIIIIIIII")
+recordFormat = struct.Struct("<qIHBBBBBx")
+indexFormat = struct.Struct("<I")
+nameEntryFormat = struct.Struct("<IHxx")
+
+tableTypes = ["fun", "get", "set", "evt", "val"]
+messageTypes = ["fun", "get", "set"]
+
+def tableFeatures(f):
+	# Names of the features included in the table in file order
+	return [name for name in f.order if f.features[name].featureType in tableTypes and
+		f.features[name].number is not None]
+
+def TableFromFace(f):
+	""" Return the bytes of the table for Face 'f'. """
+	names = tableFeatures(f)
+	strings = []
+	stringOffsets = {}
+	stringsSize = [0]
+	def internString(s):
+		if s not in stringOffsets:
+			encoded = s.encode("utf-8")
+			stringOffsets[s] = (stringsSize[0], len(encoded))
+			strings.append(encoded)
+			stringsSize[0] += len(encoded)
+		return stringOffsets[s]
+
+	categories = []
+	paramTypes = [""]
+	for name in names:
+		feature = f.features[name]
+		if feature.category not in categories:
+			categories.append(feature.category)
+		for paramType in [feature.returnType, feature.param1Type, feature.param2Type]:
+			if paramType not in paramTypes:
+				paramTypes.append(paramType)
+
+	records = []
+	for name in names:
+		feature = f.features[name]
+		nameOffset, nameLength = internString(name)
+		records.append(recordFormat.pack(feature.number, nameOffset, nameLength,
+			tableTypes.index(feature.featureType), categories.index(feature.category),
+			paramTypes.index(feature.returnType), paramTypes.index(feature.param1Type),
+			paramTypes.index(feature.param2Type)))
+
+	def index(positions):
+		return b"".join(indexFormat.pack(position) for position in positions)
+
+	positions = range(len(names))
+	messages = sorted((p for p in positions if f.features[names[p]].featureType in messageTypes),
+		key=lambda p: f.features[names[p]].number)
+	events = sorted((p for p in positions if f.features[names[p]].featureType == "evt"),
+		key=lambda p: f.features[names[p]].number)
+	byName = sorted(positions, key=lambda p: names[p].encode("utf-8"))
+
+	def nameTable(tableNames):
+		return indexFormat.pack(len(tableNames)) + \
+			b"".join(nameEntryFormat.pack(*internString(n)) for n in tableNames)
+
+	sections = [b"".join(records), index(messages), index(events), index(byName),
+		nameTable(tableTypes), nameTable(categories), nameTable(paramTypes)]
+	offsets = []
+	offset = headerFormat.size
+	for section in sections:
+		offsets.append(offset)
+		offset += len(section)
+	stringPool = b"".join(strings)
+	header = headerFormat.pack(magic, tableVersion, recordFormat.size,
+		len(records), offsets[0], len(messages), offsets[1], len(events), offsets[2],
+		offsets[3], offsets[4], offsets[5], offsets[6], offset, len(stringPool))
+	return header + b"".join(sections) + stringPool
+
+class IfaceTable(object):
+	""" Read a table written by TableFromFace through a memory map.
+	Records are identified by their position in the table. """
+
+	def __init__(self, fileName):
+		with open(fileName, "rb") as f:
+			self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+		(fileMagic, version, recordSize,
+			self.recordCount, self.recordsOffset,
+			self.messageCount, self.messageIndexOffset,
+			self.eventCount, self.eventIndexOffset,
+			self.nameIndexOffset,
+			featureTypesOffset, categoriesOffset, paramTypesOffset,
+			self.stringsOffset, stringsSize) = headerFormat.unpack_from(self.data, 0)
+		if fileMagic != magic or version != tableVersion or recordSize != recordFormat.size:
+			self.data.close()
+			raise ValueError("%s is not a version %d interface table" % (fileName, tableVersion))
+		self.featureTypes = self.nameTable(featureTypesOffset)
+		self.categories = self.nameTable(categoriesOffset)
+		self.paramTypes = self.nameTable(paramTypesOffset)
+
+	def close(self):
+		self.data.close()
+
+	def __len__(self):
+		return self.recordCount
+
+	def string(self, offset, length):
+		start = self.stringsOffset + offset
+		return self.data[start:start + length].decode("utf-8")
+
+	def nameTable(self, offset):
+		count = indexFormat.unpack_from(self.data, offset)[0]
+		return [self.string(*nameEntryFormat.unpack_from(self.data,
+			offset + indexFormat.size + i * nameEntryFormat.size)) for i in range(count)]
+
+	def Number(self, position):
+		return recordFormat.unpack_from(self.data,
+			self.recordsOffset + position * recordFormat.size)[0]
+
+	def NameBytes(self, position):
+		number, nameOffset, nameLength = recordFormat.unpack_from(self.data,
+			self.recordsOffset + position * recordFormat.size)[:3]
+		start = self.stringsOffset + nameOffset
+		return self.data[start:start + nameLength]
+
+	def Name(self, position):
+		return self.NameBytes(position).decode("utf-8")
+
+	def Record(self, position):
+		""" Return (name, featureType, number, category, returnType, param1Type, param2Type). """
+		number, nameOffset, nameLength, featureType, category, returnType, param1Type, \
+			param2Type = recordFormat.unpack_from(self.data,
+			self.recordsOffset + position * recordFormat.size)
+		return (self.string(nameOffset, nameLength), self.featureTypes[featureType], number,
+			self.categories[category], self.paramTypes[returnType],
+			self.paramTypes[param1Type], self.paramTypes[param2Type])
+
+	def Feature(self, position):
+		""" Return the record at 'position' as a Face.Feature. """
+		name, featureType, number, category, returnType, param1Type, param2Type = \
+			self.Record(position)
+		return Face.Feature(name, featureType, str(number), category, returnType,
+			(param1Type, "", ""), (param2Type, "", ""))
+
+	def indexed(self, indexOffset, i):
+		return indexFormat.unpack_from(self.data, indexOffset + i * indexFormat.size)[0]
+
+	def findNumber(self, indexOffset, count, number):
+		low = 0
+		high = count
+		while low < high:
+			middle = (low + high) // 2
+			position = self.indexed(indexOffset, middle)
+			middleNumber = self.Number(position)
+			if middleNumber == number:
+				return position
+			elif middleNumber < number:
+				low = middle + 1
+			else:
+				high = middle
+		return -1
+
+	def FindMessage(self, number):
+		""" Return the position of the fun, get or set record for 'number' or -1. """
+		return self.findNumber(self.messageIndexOffset, self.messageCount, number)
+
+	def FindEvent(self, number):
+		""" Return the position of the evt record for 'number' or -1. """
+		return self.findNumber(self.eventIndexOffset, self.eventCount, number)
+
+	def FindName(self, name):
+		""" Return the position of the record called 'name' or -1. """
+		key = name.encode("utf-8")
+		low = 0
+		high = self.recordCount
+		while low < high:
+			middle = (low + high) // 2
+			position = self.indexed(self.nameIndexOffset, middle)
+			middleName = self.NameBytes(position)
+			if middleName == key:
+				return position
+			elif middleName < key:
+				low = middle + 1
+			else:
+				high = middle
+		return -1
+
+class TableFeatures(object):
+	""" Read-only mapping from names to Face.Feature objects backed by an IfaceTable.
+	Features are created when first accessed. """
+
+	def __init__(self, table):
+		self.table = table
+		self.created = {}
+
+	def __contains__(self, name):
+		return name in self.created or self.table.FindName(name) >= 0
+
+	def __getitem__(self, name):
+		if name not in self.created:
+			position = self.table.FindName(name)
+			if position < 0:
+				raise KeyError(name)
+			self.created[name] = self.table.Feature(position)
+		return self.created[name]
+
+	def get(self, name, default=None):
+		if name in self:
+			return self[name]
+		return default
+
+	def __len__(self):
+		return len(self.table)
+
+	def __iter__(self):
+		for position in range(len(self.table)):
+			yield self.table.Name(position)
+
+	def keys(self):
+		return list(self)
+
+class TableProperties(object):
+	""" Read-only mapping from property names to (getter name or None, setter name or None)
+	like Face.properties but backed by an IfaceTable. """
+
+	def __init__(self, features):
+		self.features = features
+
+	def accessor(self, name, featureType):
+		feature = self.features.get(name)
+		if feature is not None and feature.featureType == featureType:
+			return name
+		return None
+
+	def get(self, name, default=None):
+		accessors = (self.accessor("Get" + name, "get"), self.accessor("Set" + name, "set"))
+		if accessors == (None, None):
+			return default
+		return accessors
+
+	def __contains__(self, name):
+		return self.get(name) is not None
+
+	def __getitem__(self, name):
+		accessors = self.get(name)
+		if accessors is None:
+			raise KeyError(name)
+		return accessors
+
+class TableFace(object):
+	""" The parts of the Face interface used to call Scintilla, backed by an IfaceTable. """
+
+	def __init__(self, fileName):
+		self.table = IfaceTable(fileName)
+		self.features = TableFeatures(self.table)
+		self.properties = TableProperties(self.features)
+
+	def close(self):
+		self.table.close()
+
+def tableName(ifaceName):
+	return os.path.splitext(ifaceName)[0] + ".ifacetable"
+
+def ReadInterface(ifaceName):
+	""" Return a TableFace for 'ifaceName' when its table is up to date, otherwise a Face
+	read from 'ifaceName' without a cache so that test applications do not write one. """
+	tableFileName = tableName(ifaceName)
+	try:
+		if os.path.getmtime(tableFileName) >= os.path.getmtime(ifaceName):
+			return TableFace(tableFileName)
+	except (OSError, ValueError):
+		pass
+	f = Face.Face()
+	f.ReadFromFile(ifaceName, False)
+	return f
+
+def RegenerateAll(root):
+	ifaceName = root + "include/Scintilla.iface"
+	f = Face.Face()
+	f.ReadFromFile(ifaceName)
+	UpdateBinaryFile(tableName(ifaceName), TableFromFace(f))
+
+if __name__ == "__main__":
+	RegenerateAll("../")
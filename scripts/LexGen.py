@@ -4,51 +4,184 @@
 
 # Regenerate the Scintilla source files that list all the lexers.
 # Should be run whenever a new lexer is added or removed.
-# Requires Python 2.5 or later
+# Requires Python 2.6 or later
 # Files are regenerated in place with templates stored in comments.
 # The format of generation comments is documented in FileGenerator.py.
 
-from FileGenerator import Regenerate, UpdateLineInFile, ReplaceREInFile
+# The interface and the lexers are read once and the files that depend on them are
+# generated concurrently. Run with --qt to also generate the Qt bindings.
+# Run with --watch to keep running and regenerate whenever the interface, lexers or
+# version change.
+
+import os, sys, time
+from multiprocessing.pool import ThreadPool
+
+from FileGenerator import Regenerate, UpdateLineInFile, EditFile, LineEdit, REEdit
+import Face
 import ScintillaData
 import HFacer
+import WatchFiles
 
 def UpdateVersionNumbers(sci, root):
-    UpdateLineInFile(root + "win32/ScintRes.rc", "#define VERSION_SCINTILLA",
-        "#define VERSION_SCINTILLA \"" + sci.versionDotted + "\"")
-    UpdateLineInFile(root + "win32/ScintRes.rc", "#define VERSION_WORDS",
-        "#define VERSION_WORDS " + sci.versionCommad)
+    EditFile(root + "win32/ScintRes.rc", [
+        LineEdit("#define VERSION_SCINTILLA",
+            "#define VERSION_SCINTILLA \"" + sci.versionDotted + "\""),
+        LineEdit("#define VERSION_WORDS",
+            "#define VERSION_WORDS " + sci.versionCommad)])
     UpdateLineInFile(root + "qt/ScintillaEditBase/ScintillaEditBase.pro",
         "VERSION =",
         "VERSION = " + sci.versionDotted)
     UpdateLineInFile(root + "qt/ScintillaEdit/ScintillaEdit.pro",
         "VERSION =",
         "VERSION = " + sci.versionDotted)
-    UpdateLineInFile(root + "doc/ScintillaDownload.html", "       Release",
-        "       Release " + sci.versionDotted)
-    ReplaceREInFile(root + "doc/ScintillaDownload.html",
-        r"/www.scintilla.org/([a-zA-Z]+)\d\d\d",
-        r"/www.scintilla.org/\g<1>" +  sci.version)
-    UpdateLineInFile(root + "doc/index.html",
-        '          <font color="#FFCC99" size="3"> Release version',
-        '          <font color="#FFCC99" size="3"> Release version ' +\
-        sci.versionDotted + '<br />')
-    UpdateLineInFile(root + "doc/index.html",
-        '           Site last modified',
-        '           Site last modified ' + sci.mdyModified + '</font>')
+    EditFile(root + "doc/ScintillaDownload.html", [
+        LineEdit("       Release",
+            "       Release " + sci.versionDotted),
+        REEdit(r"/www.scintilla.org/([a-zA-Z]+)\d\d\d",
+            r"/www.scintilla.org/\g<1>" +  sci.version)])
+    EditFile(root + "doc/index.html", [
+        LineEdit('          <font color="#FFCC99" size="3"> Release version',
+            '          <font color="#FFCC99" size="3"> Release version ' +\
+            sci.versionDotted + '<br />'),
+        LineEdit('           Site last modified',
+            '           Site last modified ' + sci.mdyModified + '</font>')])
     UpdateLineInFile(root + "doc/ScintillaHistory.html",
         '	Released ',
         '	Released ' + sci.dmyModified + '.')
 
-def RegenerateAll(root):
-    
-    sci = ScintillaData.ScintillaData(root)
+def readFace(ifaceName):
+    f = Face.Face()
+    f.ReadFromFile(ifaceName)
+    return f
+
+def timed(job):
+    name, generate = job
+    start = time.time()
+    generate()
+    return name, time.time() - start
+
+def printTimings(timings):
+    print("Regeneration times:")
+    for name, seconds in timings:
+        print("    %-40s %6.3f seconds" % (name, seconds))
+
+# Kinds of input that outputs depend upon
+ifaceInput = "iface"
+lexersInput = "lexers"
+versionInput = "version"
+
+def generationJobs(root, f, sci, qt):
+    """ Return (name, inputs, generate) for each output.
+    Each job writes to files that no other job writes so they can run together. """
+    jobs = [
+        ("src/Catalogue.cxx", [lexersInput],
+            lambda: Regenerate(root + "src/Catalogue.cxx", "//", sci.lexerModules)),
+        ("win32/scintilla.mak", [lexersInput],
+            lambda: Regenerate(root + "win32/scintilla.mak", "#", sci.lexFiles)),
+        ("version numbers", [versionInput], lambda: UpdateVersionNumbers(sci, root)),
+        ("include/Scintilla.h, SciLexer.h", [ifaceInput],
+            lambda: HFacer.RegenerateAll(root, False, f)),
+    ]
+    if qt:
+        sys.path.append(root + "qt/ScintillaEdit")
+        import WidgetGen
+        jobs.append(("qt/ScintillaEdit", [ifaceInput], lambda: WidgetGen.RegenerateAll(root, f)))
+    return jobs
 
-    Regenerate(root + "src/Catalogue.cxx", "//", sci.lexerModules)
-    Regenerate(root + "win32/scintilla.mak", "#", sci.lexFiles)
+def scanLexers(root, previous=None):
+    # ScintillaData reads lazily so scan the lexers now to include them in the timings
+    sci = ScintillaData.ScintillaData(root, previous)
+    sci.lexScans
+    return sci
 
-    UpdateVersionNumbers(sci, root)
-    
-    HFacer.RegenerateAll(root, False)
+def buildModel(timings, name, build):
+    start = time.time()
+    result = build()
+    timings.append((name, time.time() - start))
+    return result
+
+def runJobs(jobs, timings):
+    start = time.time()
+    pool = ThreadPool(len(jobs))
+    try:
+        timings.extend(pool.map(timed, [(name, generate) for name, inputs, generate in jobs]))
+    finally:
+        pool.close()
+        pool.join()
+    timings.append(("generation", time.time() - start))
+
+def RegenerateAll(root, qt=False):
+    timings = []
+    f = buildModel(timings, "include/Scintilla.iface",
+        lambda: readFace(root + "include/Scintilla.iface"))
+    sci = buildModel(timings, "lexers", lambda: scanLexers(root))
+    runJobs(generationJobs(root, f, sci, qt), timings)
+    printTimings(timings)
+
+def inputKind(path):
+    name = os.path.basename(path)
+    if name == "Scintilla.iface":
+        return ifaceInput
+    elif name.startswith("Lex") and name.endswith(".cxx"):
+        return lexersInput
+    elif name in ["version.txt", "index.html"]:
+        return versionInput
+    return None
+
+def modificationTime(path):
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+def Watch(root, qt=False):
+    """ Regenerate everything then keep the interface and lexer scans in memory and
+    regenerate the outputs that depend on inputs as they change. """
+    ifaceName = root + "include/Scintilla.iface"
+    f = readFace(ifaceName)
+    sci = ScintillaData.ScintillaData(root)
+    runJobs(generationJobs(root, f, sci, qt), [])
+    watcher = WatchFiles.Watcher([root, root + "include", root + "lexers", root + "doc"])
+    print("Watching for changes with %s, interrupt to stop" % watcher.__class__.__name__)
+    # Modification times of inputs when last used so that files written by generation
+    # are not treated as changed
+    seen = {}
+    for path in [ifaceName, root + "version.txt", root + "doc/index.html"] + \
+        list(sci.lexScans.keys()):
+        seen[os.path.normpath(path)] = modificationTime(path)
+    try:
+        while True:
+            changed = set()
+            for path in watcher.Wait():
+                path = os.path.normpath(path)
+                kind = inputKind(path)
+                if kind and modificationTime(path) != seen.get(path):
+                    changed.add(kind)
+                    seen[path] = modificationTime(path)
+            if not changed:
+                continue
+            timings = []
+            try:
+                if ifaceInput in changed:
+                    f = buildModel(timings, "include/Scintilla.iface", lambda: readFace(ifaceName))
+                if lexersInput in changed or versionInput in changed:
+                    sci = buildModel(timings, "lexers", lambda: scanLexers(root, sci))
+                runJobs([job for job in generationJobs(root, f, sci, qt)
+                    if changed.intersection(job[1])], timings)
+            except Exception as e:
+                # Keep watching so the error can be fixed and saved again
+                print("Regeneration failed: %s" % e)
+                continue
+            for path in [root + "doc/index.html"]:
+                seen[os.path.normpath(path)] = modificationTime(path)
+            printTimings(timings)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
 
 if __name__=="__main__":
-    RegenerateAll("../")
+    if "--watch" in sys.argv[1:]:
+        Watch("../", "--qt" in sys.argv[1:])
+    else:
+        RegenerateAll("../", "--qt" in sys.argv[1:])
@@ -0,0 +1,404 @@
+#!/usr/bin/env python
+# LexerCatalogue.py - generate a catalogue of lexers from the lexer sources and
+# Scintilla.iface and look lexers up in it.
+# Released to the public domain.
+
+# Each lexer module in the catalogue has:
+#     module         name of the LexerModule object such as "lmPython"
+#     file           lexer file without extension such as "LexPython"
+#     lexer          lexer constant such as "SCLEX_PYTHON"
+#     id             value of the lexer constant or -1 if not in Scintilla.iface
+#     language       language name passed to LexerModule such as "python"
+#     iface          name of the lex feature in Scintilla.iface such as "Python"
+#     stylePrefixes  prefixes of the style constants such as ["SCE_P_"]
+#     styles         [style constant, value] for each style constant with those prefixes
+#     keywordSets    descriptions of the keyword sets
+#     properties     properties read by the lexer's file
+# Properties have their documentation and the modules of the lexers that read them.
+#
+# The catalogue is written as JSON to include/LexerCatalogue.json and in a binary form
+# to include/LexerCatalogue.lexcat. The binary form can be used through a memory map
+# without reading the whole file. All integers are little-endian. It starts with a header:
+#     char[4] magic "SLXC"
+#     uint16 version
+#     uint16 padding
+#     uint32 lexer count, offset of lexers, offset of id index, offset of language index
+#     uint32 property count, offset of properties
+#     uint32 offset of references
+#     uint32 style count, offset of styles
+#     uint32 string count, offset of string table, offset and size of string pool
+# Strings are referred to by their number in the string table which has a
+# (uint32 offset, uint16 length, uint16 padding) entry for each UTF-8 string in the pool.
+# Lists are stored as a range (uint32 first, uint32 count) of an array.
+# References are an array of uint32 used for lists of strings, properties and lexers.
+# Lexers, in the same order as the JSON catalogue:
+#     int32 id
+#     uint32 strings for module, file, lexer, language, iface
+#     range of references to strings for style prefixes
+#     range of styles
+#     range of references to strings for keyword sets
+#     range of references to properties
+# Styles are (uint32 string for name, int32 value).
+# Properties, sorted by the bytes of their names:
+#     uint32 strings for name and documentation
+#     range of references to lexers
+# The id index and language index are arrays of uint32 lexer numbers sorted by id and
+# by the bytes of the language name.
+# Requires Python 2.6 or later
+
+from __future__ import with_statement
+
+import codecs, json, mmap, os, re, struct
+
+import Face
+import ScintillaData
+from FileGenerator import UpdateFile, UpdateBinaryFile
+
+catalogueVersion = 1
+
+lexerModuleDeclaration = re.compile(r"^LexerModule\s+(\w+)\s*\((.*?)\)\s*;", re.M | re.S)
+stringArray = re.compile(r"(\w+)\s*\[[^\]]*\]\s*=\s*\{(.*?)\}", re.S)
+stringLiteral = re.compile(r'"((?:[^"\\]|\\.)*)"')
+comment = re.compile(r"//[^\n]*|/\*.*?\*/", re.S)
+
+def readSource(lexFile):
+    with open(lexFile, "rb") as f:
+        return ScintillaData.decodeText(f.read())
+
+def lexerModules(source):
+    """ Return (module, lexer, language, keyword sets) for each LexerModule in source. """
+    source = comment.sub("", source)
+    arrays = dict((name, stringLiteral.findall(body)) for name, body in
+        stringArray.findall(source))
+    modules = []
+    for module, arguments in lexerModuleDeclaration.findall(source):
+        arguments = [a.strip() for a in arguments.split(",")]
+        language = arguments[2].strip('"') if len(arguments) > 2 else ""
+        keywordSets = []
+        for argument in arguments[3:]:
+            if argument in arrays:
+                keywordSets = arrays[argument]
+        modules.append((module, arguments[0], language, keywordSets))
+    return modules
+
+def CatalogueFromSources(f, sci):
+    """ Return the catalogue as a dictionary built from Face 'f' and ScintillaData 'sci'. """
+    lexFeatures = {}
+    for name in f.FeatureNames(["lex"]):
+        values = f.features[name].value.split()
+        lexFeatures[values[0]] = (name, values[1:])
+    styleNames = f.FeatureNames(["val"])
+
+    lexers = []
+    properties = {}
+    for lexFile in sorted(sci.lexScans.keys(), key=ScintillaData.ciKey):
+        modules, fileProperties, documents = sci.lexScans[lexFile][1]
+        fileName = os.path.basename(lexFile)[:-4]
+        for module, lexer, language, keywordSets in lexerModules(readSource(lexFile)):
+            iface, prefixes = lexFeatures.get(lexer, ("", []))
+            lexerFeature = f.features.get(lexer)
+            styles = [[name, f.features[name].number] for name in styleNames
+                if any(name.startswith(prefix) for prefix in prefixes)]
+            propertyNames = sorted(fileProperties.keys())
+            lexers.append({
+                "module": module,
+                "file": fileName,
+                "lexer": lexer,
+                "id": lexerFeature.number if lexerFeature else -1,
+                "language": language,
+                "iface": iface,
+                "stylePrefixes": prefixes,
+                "styles": styles,
+                "keywordSets": keywordSets,
+                "properties": propertyNames,
+            })
+            for name in propertyNames:
+                if name not in properties:
+                    properties[name] = {
+                        "documentation": sci.propertyDocuments.get(name, ""),
+                        "lexers": []}
+                properties[name]["lexers"].append(module)
+    return {"version": catalogueVersion, "lexers": lexers, "properties": properties}
+
+def indexed(catalogue):
+    # Add indexes so that lookups do not need to search
+    lexers = catalogue["lexers"]
+    index = {"id": {}, "language": {}, "module": {}}
+    for position, lexer in enumerate(lexers):
+        # The first lexer for an id or language wins as with Scintilla's catalogue
+        index["id"].setdefault(str(lexer["id"]), position)
+        index["language"].setdefault(lexer["language"], position)
+        index["module"][lexer["module"]] = position
+    catalogue["index"] = index
+    return catalogue
+
+class Catalogue(object):
+    """ Query a catalogue read from JSON. """
+
+    def __init__(self, catalogue):
+        if "index" not in catalogue:
+            catalogue = indexed(catalogue)
+        self.catalogue = catalogue
+        self.lexers = catalogue["lexers"]
+        self.index = catalogue["index"]
+
+    def lexer(self, indexName, key):
+        position = self.index[indexName].get(key)
+        if position is None:
+            return None
+        return self.lexers[position]
+
+    def LexerById(self, lexerId):
+        return self.lexer("id", str(lexerId))
+
+    def LexerByLanguage(self, language):
+        return self.lexer("language", language)
+
+    def LexerByModule(self, module):
+        return self.lexer("module", module)
+
+    def PropertyDocumentation(self, name):
+        """ Return the documentation of property 'name' or None when it is not known. """
+        prop = self.catalogue["properties"].get(name)
+        return prop["documentation"] if prop else None
+
+    def LexersForProperty(self, name):
+        """ Return the lexers that read property 'name'. """
+        prop = self.catalogue["properties"].get(name)
+        if not prop:
+            return []
+        return [self.LexerByModule(module) for module in prop["lexers"]]
+
+magic = b"SLXC"
+
+headerFormat = struct.Struct("<4sHxxIIIIIIIIIIIII")
+lexerFormat = struct.Struct("<iIIIIIIIIIIIII")
+propertyFormat = struct.Struct("<IIII")
+styleFormat = struct.Struct("<Ii")
+referenceFormat = struct.Struct("<I")
+stringFormat = struct.Struct("<IHxx")
+
+lexerStrings = ["module", "file", "lexer", "language", "iface"]
+
+def BinaryFromCatalogue(catalogue):
+    """ Return the bytes of the binary form of 'catalogue'. """
+    strings = []
+    stringNumbers = {}
+    def string(s):
+        if s not in stringNumbers:
+            stringNumbers[s] = len(strings)
+            strings.append(s.encode("utf-8"))
+        return stringNumbers[s]
+
+    references = []
+    def referenceRange(numbers):
+        first = len(references)
+        references.extend(numbers)
+        return first, len(numbers)
+
+    lexers = catalogue["lexers"]
+    propertyNames = sorted(catalogue["properties"].keys(), key=lambda n: n.encode("utf-8"))
+    propertyNumbers = dict((name, i) for i, name in enumerate(propertyNames))
+    lexerNumbers = dict((lexer["module"], i) for i, lexer in enumerate(lexers))
+
+    styles = []
+    lexerRecords = []
+    for lexer in lexers:
+        firstStyle = len(styles)
+        styles.extend(styleFormat.pack(string(name), value) for name, value in lexer["styles"])
+        fields = [lexer["id"]] + [string(lexer[key]) for key in lexerStrings]
+        fields.extend(referenceRange([string(p) for p in lexer["stylePrefixes"]]))
+        fields.extend([firstStyle, len(lexer["styles"])])
+        fields.extend(referenceRange([string(k) for k in lexer["keywordSets"]]))
+        fields.extend(referenceRange([propertyNumbers[p] for p in lexer["properties"]]))
+        lexerRecords.append(lexerFormat.pack(*fields))
+
+    propertyRecords = []
+    for name in propertyNames:
+        prop = catalogue["properties"][name]
+        first, count = referenceRange([lexerNumbers[m] for m in prop["lexers"]])
+        propertyRecords.append(propertyFormat.pack(string(name),
+            string(prop["documentation"]), first, count))
+
+    positions = range(len(lexers))
+    idIndex = sorted(positions, key=lambda p: lexers[p]["id"])
+    languageIndex = sorted(positions, key=lambda p: lexers[p]["language"].encode("utf-8"))
+
+    def array(numbers):
+        return b"".join(referenceFormat.pack(n) for n in numbers)
+
+    stringTable = []
+    offset = 0
+    for s in strings:
+        stringTable.append(stringFormat.pack(offset, len(s)))
+        offset += len(s)
+
+    sections = [b"".join(lexerRecords), array(idIndex), array(languageIndex),
+        b"".join(propertyRecords), array(references), b"".join(styles), b"".join(stringTable)]
+    offsets = []
+    offset = headerFormat.size
+    for section in sections:
+        offsets.append(offset)
+        offset += len(section)
+    stringPool = b"".join(strings)
+    header = headerFormat.pack(magic, catalogueVersion,
+        len(lexers), offsets[0], offsets[1], offsets[2],
+        len(propertyNames), offsets[3],
+        offsets[4],
+        len(styles), offsets[5],
+        len(strings), offsets[6], offset, len(stringPool))
+    return header + b"".join(sections) + stringPool
+
+class BinaryCatalogue(object):
+    """ Query the binary form of a catalogue through a memory map.
+    Lexers are returned as dictionaries like those in the JSON form. """
+
+    def __init__(self, fileName):
+        with open(fileName, "rb") as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (fileMagic, version,
+            self.lexerCount, self.lexersOffset, self.idIndexOffset, self.languageIndexOffset,
+            self.propertyCount, self.propertiesOffset,
+            self.referencesOffset,
+            styleCount, self.stylesOffset,
+            stringCount, self.stringTableOffset, self.stringPoolOffset,
+            stringPoolSize) = headerFormat.unpack_from(self.data, 0)
+        if fileMagic != magic or version != catalogueVersion:
+            self.data.close()
+            raise ValueError("%s is not a version %d lexer catalogue" %
+                (fileName, catalogueVersion))
+
+    def close(self):
+        self.data.close()
+
+    def stringBytes(self, number):
+        offset, length = stringFormat.unpack_from(self.data,
+            self.stringTableOffset + number * stringFormat.size)
+        start = self.stringPoolOffset + offset
+        return self.data[start:start + length]
+
+    def string(self, number):
+        return self.stringBytes(number).decode("utf-8")
+
+    def reference(self, offset, i):
+        return referenceFormat.unpack_from(self.data, offset + i * referenceFormat.size)[0]
+
+    def references(self, first, count):
+        return [self.reference(self.referencesOffset, i) for i in range(first, first + count)]
+
+    def lexerRecord(self, position):
+        return lexerFormat.unpack_from(self.data, self.lexersOffset + position * lexerFormat.size)
+
+    def propertyRecord(self, position):
+        return propertyFormat.unpack_from(self.data,
+            self.propertiesOffset + position * propertyFormat.size)
+
+    def Lexer(self, position):
+        """ Return lexer number 'position' as a dictionary. """
+        record = self.lexerRecord(position)
+        lexer = {"id": record[0]}
+        for key, number in zip(lexerStrings, record[1:6]):
+            lexer[key] = self.string(number)
+        prefixFirst, prefixCount, styleFirst, styleCount, keywordFirst, keywordCount, \
+            propertyFirst, propertyCount = record[6:]
+        lexer["stylePrefixes"] = [self.string(n) for n in
+            self.references(prefixFirst, prefixCount)]
+        lexer["styles"] = []
+        for i in range(styleFirst, styleFirst + styleCount):
+            name, value = styleFormat.unpack_from(self.data,
+                self.stylesOffset + i * styleFormat.size)
+            lexer["styles"].append([self.string(name), value])
+        lexer["keywordSets"] = [self.string(n) for n in
+            self.references(keywordFirst, keywordCount)]
+        lexer["properties"] = [self.string(self.propertyRecord(n)[0]) for n in
+            self.references(propertyFirst, propertyCount)]
+        return lexer
+
+    def search(self, indexOffset, count, key, keyOf):
+        # Return the first position in the index with a key of 'key' or -1
+        low = 0
+        high = count
+        while low < high:
+            middle = (low + high) // 2
+            if keyOf(self.reference(indexOffset, middle)) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < count:
+            position = self.reference(indexOffset, low)
+            if keyOf(position) == key:
+                return position
+        return -1
+
+    def lexerAt(self, position):
+        if position < 0:
+            return None
+        return self.Lexer(position)
+
+    def LexerById(self, lexerId):
+        return self.lexerAt(self.search(self.idIndexOffset, self.lexerCount, lexerId,
+            lambda p: self.lexerRecord(p)[0]))
+
+    def LexerByLanguage(self, language):
+        return self.lexerAt(self.search(self.languageIndexOffset, self.lexerCount,
+            language.encode("utf-8"), lambda p: self.stringBytes(self.lexerRecord(p)[4])))
+
+    def LexerByModule(self, module):
+        # Modules are not indexed in the binary form so search every lexer
+        for position in range(self.lexerCount):
+            if self.string(self.lexerRecord(position)[1]) == module:
+                return self.Lexer(position)
+        return None
+
+    def findProperty(self, name):
+        key = name.encode("utf-8")
+        low = 0
+        high = self.propertyCount
+        while low < high:
+            middle = (low + high) // 2
+            middleName = self.stringBytes(self.propertyRecord(middle)[0])
+            if middleName == key:
+                return middle
+            elif middleName < key:
+                low = middle + 1
+            else:
+                high = middle
+        return -1
+
+    def PropertyDocumentation(self, name):
+        """ Return the documentation of property 'name' or None when it is not known. """
+        position = self.findProperty(name)
+        if position < 0:
+            return None
+        return self.string(self.propertyRecord(position)[1])
+
+    def LexersForProperty(self, name):
+        """ Return the lexers that read property 'name'. """
+        position = self.findProperty(name)
+        if position < 0:
+            return []
+        nameNumber, documentation, first, count = self.propertyRecord(position)
+        return [self.Lexer(n) for n in self.references(first, count)]
+
+def ReadCatalogue(fileName):
+    """ Return a Catalogue or BinaryCatalogue depending on the contents of 'fileName'. """
+    with open(fileName, "rb") as f:
+        isBinary = f.read(len(magic)) == magic
+    if isBinary:
+        return BinaryCatalogue(fileName)
+    with codecs.open(fileName, "r", "utf-8") as f:
+        return Catalogue(json.load(f))
+
+def RegenerateAll(root, f=None, sci=None):
+    if f is None:
+        f = Face.Face()
+        f.ReadFromFile(root + "include/Scintilla.iface")
+    if sci is None:
+        sci = ScintillaData.ScintillaData(root)
+    catalogue = indexed(CatalogueFromSources(f, sci))
+    UpdateFile(root + "include/LexerCatalogue.json",
+        json.dumps(catalogue, indent=1, sort_keys=True) + "\n")
+    UpdateBinaryFile(root + "include/LexerCatalogue.lexcat", BinaryFromCatalogue(catalogue))
+
+if __name__ == "__main__":
+    RegenerateAll("../")
@@ -24,13 +24,19 @@
 #         sorted list of lexer properties
 #     propertyDocuments
 #         dictionary of property documentation { name: document string }
+#
+# Credits from doc/ScintillaHistory.html
+#     credits
+#
+# Each group of properties is only read when one of its properties is first used.
 
 # This file can be run to see the data it provides.
-# Requires Python 2.5 or later
+# Requires Python 2.6 or later
 
 from __future__ import with_statement
 
-import codecs, datetime, glob, os, sys, textwrap
+import codecs, datetime, glob, hashlib, mmap, multiprocessing, os, pickle, re, sys, textwrap
+import threading
 
 import FileGenerator
 
@@ -119,12 +125,13 @@ def FindCredits(historyFile):
     credits = []
     stage = 0
     with codecs.open(historyFile, "r", "utf-8") as f:
-        for l in f.readlines():
+        # Read lines as needed as the credits are near the start of a large file
+        for l in f:
             l = l.strip()
             if stage == 0 and l == "<table>":
                 stage = 1
             elif stage == 1 and l == "</table>":
-                stage = 2
+                break
             if stage == 1 and l.startswith("<td>"):
                 credit = l[4:-5]
                 if "<a" in l:
@@ -151,18 +158,218 @@ def SortListInsensitive(l):
     except TypeError:    # Earlier version of Python, so use comparison function
         l.sort(ciCompare)
 
-class ScintillaData:
-    def __init__(self, scintillaRoot):
+# ScanLexFile finds the same information as FindModules, FindProperties and
+# FindPropertyDocumentation with a single pass over a memory mapped file.
+# A regular expression finds the lines that may be interesting and only those
+# lines, along with the lines following a property documentation line, are examined.
+scanCandidates = re.compile(br"LexerModule|GetProperty|DefineProperty|// property ")
+
+def decodeText(b):
+    # Lexers are mostly ASCII with some in UTF-8 and some in Latin-1
+    try:
+        return b.decode("utf-8")
+    except UnicodeDecodeError:
+        return b.decode("latin-1")
+
+def mappedContents(path):
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+def scanLexData(data):
+    modules = []
+    properties = {}
+    documents = {}
+    name = b""
+    pos = 0
+    end = len(data)
+    while pos < end:
+        if name:
+            # Documentation may continue on the next line
+            lineStart = pos
+        else:
+            m = scanCandidates.search(data, pos)
+            if not m:
+                break
+            lineStart = data.rfind(b"\n", 0, m.start()) + 1
+        lineEnd = data.find(b"\n", lineStart)
+        if lineEnd < 0:
+            lineEnd = end
+        pos = lineEnd + 1
+        line = data[lineStart:lineEnd]
+
+        if line.startswith(b"LexerModule"):
+            modules.append(decodeText(line.replace(b"(", b" ").split()[1]))
+
+        l = line.strip()
+        if (b"GetProperty" in l or b"DefineProperty" in l) and b"\"" in l:
+            if not l.startswith(b"//"):	# Drop comments
+                propertyName = l.split(b"\"")[1]
+                if propertyName.lower() == propertyName:
+                    # Only allow lower case property names
+                    propertyName = decodeText(propertyName)
+                    if propertyName in knownIrregularProperties or \
+                        propertyName.startswith("fold.") or \
+                        propertyName.startswith("lexer."):
+                        properties[propertyName] = 1
+
+        if b"// property " in l:
+            propertyName = l.split()[2]
+            if propertyName.lower() == propertyName:
+                # Only allow lower case property names
+                name = propertyName
+                documents[name] = b""
+        elif b"DefineProperty" in l and b"\"" in l:
+            propertyName = l.split(b"\"")[1]
+            if propertyName.lower() == propertyName:
+                # Only allow lower case property names
+                name = propertyName
+                documents[name] = b""
+        elif name:
+            if l.startswith(b"//"):
+                if documents[name]:
+                    documents[name] += b" "
+                documents[name] += l[2:].strip()
+            elif l.startswith(b"\""):
+                l = l[1:].strip()
+                if l.endswith(b";"):
+                    l = l[:-1].strip()
+                if l.endswith(b")"):
+                    l = l[:-1].strip()
+                if l.endswith(b"\""):
+                    l = l[:-1]
+                # Fix escaped double quotes
+                l = l.replace(b"\\\"", b"\"")
+                documents[name] += l
+            else:
+                name = b""
+    documents = dict((decodeText(k), decodeText(v)) for k, v in documents.items() if v)
+    return modules, properties, documents
+
+def scanAndHash(lexFile):
+    # Return a hash of the contents of lexFile along with the results of scanning it
+    data = mappedContents(lexFile)
+    try:
+        return hashlib.sha1(data).hexdigest(), scanLexData(data)
+    finally:
+        if isinstance(data, mmap.mmap):
+            data.close()
+
+def ScanLexFile(lexFile):
+    """ Return the modules, properties and property documentation defined in lexFile. """
+    return scanAndHash(lexFile)[1]
+
+# Lexer files are scanned by a pool of processes when there are more than this many
+# files to scan and more than one processor. Starting the pool costs about as much as
+# scanning 100 files.
+parallelScanThreshold = 300
+
+def ScanLexFiles(lexFiles, parallel=None):
+    """ Return (hash of contents, results of ScanLexFile) for each of lexFiles in the same
+    order. When parallel is None, a process pool is used if there are enough files. """
+    if parallel is None:
+        parallel = len(lexFiles) > parallelScanThreshold and \
+            multiprocessing.cpu_count() > 1
+    if parallel:
+        try:
+            pool = multiprocessing.Pool()
+        except (ImportError, OSError, NotImplementedError):
+            # Some platforms can not start processes
+            pool = None
+        if pool:
+            try:
+                chunkSize = max(1, len(lexFiles) // (4 * multiprocessing.cpu_count()))
+                return pool.map(scanAndHash, lexFiles, chunkSize)
+            finally:
+                pool.close()
+                pool.join()
+    return [scanAndHash(lexFile) for lexFile in lexFiles]
+
+# Scan results are saved in a cache file between runs as
+# { "version": scanCacheVersion, "scans": { file name: (signature, results) } }
+# where signature is (modification time, size, hash of contents).
+# Increment scanCacheVersion when the results of scanning change.
+scanCacheVersion = 1
+
+def readScanCache(cacheName):
+    try:
+        # The cache is out of date when the code that made it has changed
+        if os.path.getmtime(os.path.abspath(__file__)) > os.path.getmtime(cacheName):
+            return {}
+        with open(cacheName, "rb") as f:
+            cached = pickle.load(f)
+    except Exception:
+        return {}
+    if not isinstance(cached, dict) or cached.get("version") != scanCacheVersion:
+        return {}
+    return cached["scans"]
+
+def writeScanCache(cacheName, scans):
+    try:
+        # Readers never see a partial cache
+        data = pickle.dumps({"version": scanCacheVersion, "scans": scans}, 2)
+        FileGenerator.writeAtomically(cacheName, data)
+    except (IOError, OSError):
+        # Read-only tree or similar so continue without a cache
+        pass
+
+def isUnchanged(signature, info, lexFile):
+    # Whether a file with stat info was scanned with signature
+    modified, size, contentHash = signature
+    if size != info.st_size:
+        return False
+    if modified == info.st_mtime:
+        return True
+    # Touched but may not have changed
+    with open(lexFile, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest() == contentHash
+
+class ScintillaData(object):
+    def __init__(self, scintillaRoot, previous=None, parallel=None, cacheName=None):
+        # Lexer files that have not changed since they were last scanned are not scanned
+        # again. Scan results are taken from previous, when it is a ScintillaData that has
+        # scanned the lexers, and from a cache file which defaults to
+        # lexers/ScintillaData.cache and which is not used if cacheName is False.
+        # parallel is passed to ScanLexFiles.
+        self.scintillaRoot = scintillaRoot
+        self.previousScans = previous.__dict__.get("lexScans") if previous else None
+        self.parallel = parallel
+        self.cacheName = cacheName
+        # Generators may use properties from several threads
+        self.lock = threading.RLock()
+
+    groups = {
+        "readVersion": ["version", "versionDotted", "versionCommad"],
+        "readDates": ["dateModified", "yearModified", "mdyModified", "dmyModified",
+            "myModified"],
+        "scanLexers": ["lexFiles", "lexerModules", "lexerProperties", "propertyDocuments",
+            "lexScans"],
+        "readCredits": ["credits"],
+    }
+    loaders = dict((name, loader) for loader, names in groups.items() for name in names)
+
+    def __getattr__(self, name):
+        # Only called when name has not been set so find its group
+        if name not in ScintillaData.loaders:
+            raise AttributeError(name)
+        with self.lock:
+            if name not in self.__dict__:
+                getattr(self, ScintillaData.loaders[name])()
+        return self.__dict__[name]
+
+    def readVersion(self):
         # Discover verion information
-        with open(scintillaRoot + "version.txt") as f:
+        with open(self.scintillaRoot + "version.txt") as f:
             self.version = f.read().strip()
         self.versionDotted = self.version[0] + '.' + self.version[1] + '.' + \
             self.version[2]
         self.versionCommad = self.version[0] + ', ' + self.version[1] + ', ' + \
             self.version[2] + ', 0'
 
-        with open(scintillaRoot + "doc/index.html") as f:
-            self.dateModified = [l for l in f.readlines() if "Date.Modified" in l]\
+    def readDates(self):
+        with open(self.scintillaRoot + "doc/index.html") as f:
+            self.dateModified = [l for l in f if "Date.Modified" in l]\
                 [0].split('\"')[3]
             # 20130602
             # index.html, SciTE.html
@@ -178,26 +385,65 @@ class ScintillaData:
             # ScintillaHistory.html -- only first should change
             self.myModified = monthModified + " " + self.yearModified
 
+    def scanLexers(self):
+        scintillaRoot = self.scintillaRoot
+        parallel = self.parallel
+        cacheName = self.cacheName
         # Find all the lexer source code files
         lexFilePaths = glob.glob(scintillaRoot + "lexers/Lex*.cxx")
         SortListInsensitive(lexFilePaths)
-        self.lexFiles = [os.path.basename(f)[:-4] for f in lexFilePaths]
-        self.lexerModules = []
+        lexFiles = [os.path.basename(f)[:-4] for f in lexFilePaths]
+        lexerModules = []
         lexerProperties = set()
-        self.propertyDocuments = {}
+        propertyDocuments = {}
+        # Scan results for each lexer file { path: (signature, results) }
+        lexScans = {}
+        if cacheName is None:
+            cacheName = scintillaRoot + "lexers/ScintillaData.cache"
+        cached = readScanCache(cacheName) if cacheName else {}
+        known = dict(cached)
+        if self.previousScans:
+            for lexFile, scan in self.previousScans.items():
+                known[os.path.basename(lexFile)] = scan
+        toScan = []
+        for lexFile in lexFilePaths:
+            info = os.stat(lexFile)
+            scan = known.get(os.path.basename(lexFile))
+            if scan and isUnchanged(scan[0], info, lexFile):
+                lexScans[lexFile] = ((info.st_mtime, info.st_size, scan[0][2]), scan[1])
+            else:
+                toScan.append((lexFile, info))
+        scans = ScanLexFiles([lexFile for lexFile, info in toScan], parallel)
+        for (lexFile, info), (contentHash, results) in zip(toScan, scans):
+            lexScans[lexFile] = ((info.st_mtime, info.st_size, contentHash), results)
+        if cacheName:
+            scans = dict((os.path.basename(lexFile), scan) for lexFile, scan in
+                lexScans.items())
+            if scans != cached:
+                writeScanCache(cacheName, scans)
+        # Merge in file order so the first documentation found for a property is kept
         for lexFile in lexFilePaths:
-            self.lexerModules.extend(FindModules(lexFile))
-            for k in FindProperties(lexFile).keys():
+            modules, properties, documents = lexScans[lexFile][1]
+            lexerModules.extend(modules)
+            for k in properties.keys():
                 lexerProperties.add(k)
-            documents = FindPropertyDocumentation(lexFile)
             for k in documents.keys():
-                if k not in self.propertyDocuments:
-                    self.propertyDocuments[k] = documents[k]
-        SortListInsensitive(self.lexerModules)
-        self.lexerProperties = list(lexerProperties)
-        SortListInsensitive(self.lexerProperties)
+                if k not in propertyDocuments:
+                    propertyDocuments[k] = documents[k]
+        SortListInsensitive(lexerModules)
+        lexerProperties = list(lexerProperties)
+        SortListInsensitive(lexerProperties)
+
+        # Set together at the end so other threads never see partial results
+        self.lexFiles = lexFiles
+        self.lexerModules = lexerModules
+        self.lexerProperties = lexerProperties
+        self.propertyDocuments = propertyDocuments
+        self.lexScans = lexScans
+        self.previousScans = None
 
-        self.credits = FindCredits(scintillaRoot + "doc/ScintillaHistory.html")
+    def readCredits(self):
+        self.credits = FindCredits(self.scintillaRoot + "doc/ScintillaHistory.html")
 
 def printWrapped(text):
     print(textwrap.fill(text, subsequent_indent="    "))
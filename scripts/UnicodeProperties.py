@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# UnicodeProperties.py - find the Unicode properties of every code point once and
+# cache them for the scripts that generate Unicode tables.
+# Released to the public domain.
+# Requires Python 3.3 or later
+
+# Finding the properties of all 1.1 million code points with unicodedata and the str
+# case methods takes seconds, so it is performed once for each version of Python and
+# Unicode and the results stored in UnicodeProperties.cache.
+#
+# GenerateCharClassify.py and GenerateCharacterWidth.py take general categories from
+# CharacterCategory.cxx rather than from here so that their tables are from the same
+# version of Unicode as the checked-in categories whatever version Python has.
+#
+# For each code point there is:
+#     category: index into categoryNames of its general category
+#     eastAsianWidth: index into eastAsianWidthNames of its East Asian Width
+#     upper, lower, fold: the difference between the code point and its simple upper
+#         case, lower case, or folded form or 0 when the form is the same
+#     flags: multipleUpper, multipleLower, or multipleFold when that form is more
+#         than one character; the form is then in the multiples dictionary
+#
+# The cache file starts with a line identifying the versions it was made with, then
+# the category, East Asian Width, and flags arrays as bytes, the upper, lower, and fold arrays as 32-bit
+# integers in native byte order, and a JSON list of [flag, code point, form] for
+# the multiples.
+
+import array, json, multiprocessing, os, platform, sys, unicodedata
+
+# Increment when the cache contents change
+cacheVersion = 2
+
+cacheName = os.path.join(os.path.dirname(os.path.abspath(__file__)), "UnicodeProperties.cache")
+
+categoryNames = [
+    "Lu", "Ll", "Lt", "Lm", "Lo",
+    "Mn", "Mc", "Me",
+    "Nd", "Nl", "No",
+    "Pc", "Pd", "Ps", "Pe", "Pi", "Pf", "Po",
+    "Sm", "Sc", "Sk", "So",
+    "Zs", "Zl", "Zp",
+    "Cc", "Cf", "Cs", "Co", "Cn"
+]
+categoryNumbers = dict((name, i) for i, name in enumerate(categoryNames))
+
+eastAsianWidthNames = ["N", "Na", "H", "W", "F", "A"]
+eastAsianWidthNumbers = dict((name, i) for i, name in enumerate(eastAsianWidthNames))
+
+multipleUpper = 1
+multipleLower = 2
+multipleFold = 4
+
+codePoints = sys.maxunicode + 1
+
+# Code points are examined in blocks as most blocks have no case conversions
+# and that can be checked by converting the whole block at once.
+blockSize = 256
+
+# Code points are divided into this many shards to be examined by a pool of processes
+shardCount = 16
+
+def hasConversions(block):
+    return block.casefold() != block or block.upper() != block or block.lower() != block
+
+def propertiesShard(bounds):
+    # Return the arrays and multiples for the code points in the range bounds
+    start, end = bounds
+    categories = array.array("B", (categoryNumbers[unicodedata.category(chr(ch))]
+        for ch in range(start, end)))
+    eastAsianWidths = array.array("B", (eastAsianWidthNumbers[unicodedata.east_asian_width(chr(ch))]
+        for ch in range(start, end)))
+    flags = array.array("B", [0]) * (end - start)
+    uppers = array.array("i", [0]) * (end - start)
+    lowers = array.array("i", [0]) * (end - start)
+    folds = array.array("i", [0]) * (end - start)
+    multiples = {}
+    for blockStart in range(start, end, blockSize):
+        blockEnd = min(blockStart + blockSize, end)
+        if not hasConversions("".join(chr(ch) for ch in range(blockStart, blockEnd))):
+            continue
+        for ch in range(blockStart, blockEnd):
+            uch = chr(ch)
+            for converted, deltas, flag in ((uch.upper(), uppers, multipleUpper),
+                (uch.lower(), lowers, multipleLower), (uch.casefold(), folds, multipleFold)):
+                if len(converted) == 1:
+                    deltas[ch - start] = ord(converted) - ch
+                else:
+                    flags[ch - start] |= flag
+                    multiples[(flag, ch)] = converted
+    return categories, eastAsianWidths, flags, uppers, lowers, folds, multiples
+
+class UnicodeProperties(object):
+    """ Properties of every code point as arrays indexed by code point. """
+
+    def __init__(self, categories, eastAsianWidths, flags, uppers, lowers, folds, multiples):
+        self.categories = categories
+        self.eastAsianWidths = eastAsianWidths
+        self.flags = flags
+        self.uppers = uppers
+        self.lowers = lowers
+        self.folds = folds
+        self.multiples = multiples
+
+    def Category(self, ch):
+        return categoryNames[self.categories[ch]]
+
+    def EastAsianWidth(self, ch):
+        return eastAsianWidthNames[self.eastAsianWidths[ch]]
+
+    def converted(self, ch, deltas, flag):
+        if self.flags[ch] & flag:
+            return self.multiples[(flag, ch)]
+        return chr(ch + deltas[ch])
+
+    def Upper(self, ch):
+        """ Return the upper case form of code point ch as a string like str.upper. """
+        return self.converted(ch, self.uppers, multipleUpper)
+
+    def Lower(self, ch):
+        """ Return the lower case form of code point ch as a string like str.lower. """
+        return self.converted(ch, self.lowers, multipleLower)
+
+    def Fold(self, ch):
+        """ Return the folded form of code point ch as a string like str.casefold. """
+        return self.converted(ch, self.folds, multipleFold)
+
+def Sweep(parallel=None):
+    """ Find the properties of every code point with unicodedata and str methods.
+    Shards are examined by a pool of processes when parallel is True or, when it
+    is None, if there is more than one processor. """
+    shardSize = (codePoints + shardCount - 1) // shardCount
+    shards = [(start, min(start + shardSize, codePoints))
+        for start in range(0, codePoints, shardSize)]
+    if parallel is None:
+        parallel = multiprocessing.cpu_count() > 1
+    if parallel:
+        with multiprocessing.Pool() as pool:
+            results = pool.map(propertiesShard, shards)
+    else:
+        results = [propertiesShard(shard) for shard in shards]
+    arrays = []
+    for i in range(6):
+        combined = array.array(results[0][i].typecode)
+        for result in results:
+            combined.extend(result[i])
+        arrays.append(combined)
+    multiples = {}
+    for result in results:
+        multiples.update(result[6])
+    return UnicodeProperties(*(arrays + [multiples]))
+
+def versionLine():
+    return "UnicodeProperties %d Python %s Unicode %s %d\n" % (cacheVersion,
+        platform.python_version(), unicodedata.unidata_version, codePoints)
+
+def readCache(fileName):
+    # Return the UnicodeProperties in fileName or None if it is missing or was made
+    # with different versions
+    try:
+        with open(fileName, "rb") as f:
+            if f.readline().decode("utf-8") != versionLine():
+                return None
+            arrays = []
+            for typecode in "BBBiii":
+                values = array.array(typecode)
+                values.fromfile(f, codePoints)
+                arrays.append(values)
+            multiples = dict(((flag, ch), converted)
+                for flag, ch, converted in json.loads(f.read().decode("utf-8")))
+            return UnicodeProperties(*(arrays + [multiples]))
+    except (IOError, OSError, EOFError, ValueError):
+        return None
+
+def writeCache(fileName, properties):
+    # Written to a temporary file then renamed so a partial cache is never read
+    tempName = fileName + ".tmp"
+    with open(tempName, "wb") as f:
+        f.write(versionLine().encode("utf-8"))
+        for values in (properties.categories, properties.eastAsianWidths, properties.flags,
+            properties.uppers, properties.lowers, properties.folds):
+            values.tofile(f)
+        multiples = [[flag, ch, converted]
+            for (flag, ch), converted in sorted(properties.multiples.items())]
+        f.write(json.dumps(multiples).encode("utf-8"))
+    os.replace(tempName, fileName)
+
+# Properties already read in this process
+readProperties = {}
+
+def Properties(fileName=cacheName):
+    """ Return the UnicodeProperties for this version of Python, reading them from the
+    cache when possible and otherwise performing a sweep and writing the cache. """
+    if fileName not in readProperties:
+        properties = readCache(fileName)
+        if properties is None:
+            properties = Sweep()
+            try:
+                writeCache(fileName, properties)
+            except (IOError, OSError):
+                pass
+        readProperties[fileName] = properties
+    return readProperties[fileName]
+
+if __name__ == "__main__":
+    properties = Properties()
+    print("Properties of %d code points for Unicode %s" % (len(properties.categories),
+        unicodedata.unidata_version))
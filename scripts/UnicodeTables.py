@@ -0,0 +1,45 @@
+# UnicodeTables.py - shared by the scripts that write Unicode tables into C++ sources.
+# Released to the public domain.
+
+import codecs, os, re
+
+# Tables are written as lines of comma separated numbers
+valuesPerLine = 16
+
+def uniqueBlocks(values, blockSize):
+    # Return an index of values divided into blocks and the list of unique blocks
+    blocks = []
+    blockNumbers = {}
+    index = []
+    for start in range(0, len(values), blockSize):
+        block = tuple(values[start:start+blockSize])
+        if block not in blockNumbers:
+            blockNumbers[block] = len(blocks)
+            blocks.append(block)
+        index.append(blockNumbers[block])
+    return index, blocks
+
+def flatten(listOfLists):
+    return [x for l in listOfLists for x in l]
+
+def valueLines(values):
+    return [",".join(str(v) for v in values[i:i+valuesPerLine]) + ","
+        for i in range(0, len(values), valuesPerLine)]
+
+def checkedInCategories(filename):
+    # Return the Unicode version and a list of the general category name of every code
+    # point read from the catRanges list in CharacterCategory.cxx so that other tables
+    # can be built from the same version of Unicode as the checked-in categories
+    header = os.path.splitext(filename)[0] + ".h"
+    with codecs.open(header, "r", "UTF-8") as f:
+        names = re.findall(r"\bcc(\w\w)\b", f.read())
+    with codecs.open(filename, "r", "UTF-8") as f:
+        text = f.read()
+    section = text[text.index("//++Autogenerated"):text.index("//--Autogenerated")]
+    version = re.search(r"Unicode ([\d.]+)", section).group(1)
+    runs = [int(value) for value in re.findall(r"^(\d+),$", section, re.M)]
+    categories = []
+    for i, value in enumerate(runs):
+        end = runs[i+1] >> 5 if i+1 < len(runs) else 0x110000
+        categories.extend([names[value & 0x1F]] * (end - (value >> 5)))
+    return version, categories
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# WatchFiles.py - wait for files in a set of directories to change.
+# Released to the public domain.
+
+# On Linux, inotify is used through ctypes so changes are seen as soon as they are
+# written. Elsewhere, or if inotify can not be used, the directories are polled.
+# Directories are not watched recursively.
+# Requires Python 2.6 or later
+
+from __future__ import with_statement
+
+import ctypes, ctypes.util, errno, os, select, struct, sys, time
+
+# Changes closely following a change are reported together as editors often write
+# a file in several steps
+settleTime = 0.05
+
+class PollingWatcher(object):
+    """ Find changes by comparing the size and modification time of each file. """
+
+    def __init__(self, directories, interval=0.5):
+        self.directories = directories
+        self.interval = interval
+        self.state = self.scan()
+
+    def scan(self):
+        state = {}
+        for directory in self.directories:
+            try:
+                names = os.listdir(directory)
+            except OSError:
+                continue
+            for name in names:
+                path = os.path.join(directory, name)
+                try:
+                    info = os.stat(path)
+                except OSError:
+                    continue
+                state[path] = (info.st_size, info.st_mtime)
+        return state
+
+    def changes(self):
+        state = self.scan()
+        changed = set(path for path in state if self.state.get(path) != state[path])
+        changed.update(path for path in self.state if path not in state)
+        self.state = state
+        return changed
+
+    def Wait(self):
+        """ Return the set of paths that changed, waiting until there are some. """
+        while True:
+            changed = self.changes()
+            if changed:
+                return changed
+            time.sleep(self.interval)
+
+    def close(self):
+        pass
+
+# Values from <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_CLOEXEC = 0o2000000
+
+watchedEvents = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+# struct inotify_event { int wd; uint32_t mask; uint32_t cookie; uint32_t len; char name[]; }
+eventHeader = struct.Struct("iIII")
+
+class InotifyWatcher(object):
+    """ Find changes with Linux inotify. Raises OSError when inotify is not available. """
+
+    def __init__(self, directories):
+        if not sys.platform.startswith("linux"):
+            raise OSError(errno.ENOSYS, "inotify is only available on Linux")
+        libcName = ctypes.util.find_library("c")
+        self.libc = ctypes.CDLL(libcName, use_errno=True)
+        self.fd = self.libc.inotify_init1(IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.directories = {}
+        try:
+            for directory in directories:
+                wd = self.libc.inotify_add_watch(self.fd,
+                    os.path.abspath(directory).encode(sys.getfilesystemencoding()),
+                    watchedEvents)
+                if wd < 0:
+                    raise OSError(ctypes.get_errno(), "inotify_add_watch failed for " + directory)
+                self.directories[wd] = directory
+        except:
+            self.close()
+            raise
+
+    def events(self, timeout):
+        changed = set()
+        readable, writable, exceptional = select.select([self.fd], [], [], timeout)
+        if readable:
+            data = os.read(self.fd, 65536)
+            pos = 0
+            while pos < len(data):
+                wd, mask, cookie, length = eventHeader.unpack_from(data, pos)
+                pos += eventHeader.size
+                name = data[pos:pos + length].rstrip(b"\0").decode(sys.getfilesystemencoding())
+                pos += length
+                if wd in self.directories and name:
+                    changed.add(os.path.join(self.directories[wd], name))
+        return changed
+
+    def Wait(self):
+        """ Return the set of paths that changed, waiting until there are some. """
+        changed = set()
+        while not changed:
+            changed = self.events(None)
+        while True:
+            more = self.events(settleTime)
+            if not more:
+                return changed
+            changed.update(more)
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+def Watcher(directories):
+    """ Return an InotifyWatcher if possible otherwise a PollingWatcher. """
+    try:
+        return InotifyWatcher(directories)
+    except (OSError, AttributeError):
+        return PollingWatcher(directories)
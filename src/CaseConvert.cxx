@@ -364,6 +364,696 @@ const char *complexCaseConversions =
 //--Autogenerated -- end of section automatically generated
 ;
 
+// The conversions above are also stored as two-stage tables so that a conversion to
+// a single character can be found directly from a code point.
+// For each conversion there is a block index with an element for each block of
+// caseBlockSize code points. This selects a block in caseDeltas which contains the
+// difference between the converted and original code point or 0 when there is no
+// conversion. Characters that convert to more than one character have complexDelta
+// and are found in complexCaseConversions.
+// caseBlockShift and complexDelta must match scripts/GenerateCaseConvert.py.
+
+enum { caseBlockShift=7, caseBlockSize=1<<caseBlockShift };
+const int complexDelta = 0x110000;
+
+const unsigned short caseFoldBlocks[] = {
+//++Autogenerated -- start of section automatically generated
+//**3 \(\*\n\)
+0,1,2,3,4,5,6,7,8,9,10,11,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,12,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,13,14,15,16,
+5,5,17,18,5,5,5,5,5,19,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,20,21,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,22,23,24,25,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,26,5,5,5,5,5,5,5,27,5,
+5,5,5,5,5,5,5,5,28,
+
+//--Autogenerated -- end of section automatically generated
+};
+
+const unsigned short caseUpperBlocks[] = {
+//++Autogenerated -- start of section automatically generated
+//**4 \(\*\n\)
+29,30,31,32,33,34,35,36,37,38,39,40,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,41,5,42,43,44,45,
+5,5,46,47,5,5,5,5,5,48,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,49,50,51,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,52,53,54,55,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,26,5,5,5,5,5,5,5,56,5,
+5,5,5,5,5,5,5,5,57,
+
+//--Autogenerated -- end of section automatically generated
+};
+
+const unsigned short caseLowerBlocks[] = {
+//++Autogenerated -- start of section automatically generated
+//**5 \(\*\n\)
+0,58,59,60,4,5,61,62,8,9,10,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,12,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,13,63,64,65,
+5,5,17,18,5,5,5,5,5,19,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,20,21,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,22,23,24,25,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,
+5,5,5,5,5,5,5,5,5,5,5,5,5,5,27,5,
+5,5,5,5,5,5,5,5,28,
+
+//--Autogenerated -- end of section automatically generated
+};
+
+const int caseDeltas[] = {
+//++Autogenerated -- start of section automatically generated
+//**6 \(\*\n\)
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,
+32,32,32,32,32,32,32,32,32,32,32,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,775,0,0,0,0,0,0,0,0,0,0,
+32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,
+32,32,32,32,32,32,32,0,32,32,32,32,32,32,32,1114112,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1114112,0,1,0,1,0,1,0,0,1,0,1,0,1,0,1,
+0,1,0,1,0,1,0,1,0,1114112,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,-121,1,0,1,0,1,0,-268,
+0,210,1,0,1,0,206,1,0,205,205,1,0,0,79,202,
+203,1,0,205,207,0,211,209,1,0,0,0,211,213,0,214,
+1,0,1,0,1,0,218,1,0,218,0,0,1,0,218,1,
+0,217,217,1,0,1,0,219,1,0,0,0,1,0,0,0,
+0,0,0,0,2,1,0,2,1,0,2,1,0,1,0,1,
+0,1,0,1,0,1,0,1,0,1,0,1,0,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1114112,2,1,0,1,0,-97,-56,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+-130,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,0,0,0,0,0,0,10795,1,0,-163,10792,0,
+0,1,0,-195,69,71,1,0,1,0,1,0,1,0,1,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,116,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+1,0,1,0,0,0,1,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,38,0,37,37,37,0,64,0,63,63,
+1114112,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,
+32,32,0,32,32,32,32,32,32,32,32,32,0,0,0,0,
+1114112,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,8,
+-30,-25,0,0,0,-15,-22,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+-54,-48,0,0,-60,-64,0,1,0,-7,1,0,0,-130,-130,-130,
+80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,
+32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,
+32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,0,0,0,0,0,0,0,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+15,1,0,1,0,1,0,1,0,1,0,1,0,1,0,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,0,0,0,0,0,0,0,0,
+0,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,
+48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,
+48,48,48,48,48,48,48,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,1114112,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+7264,7264,7264,7264,7264,7264,7264,7264,7264,7264,7264,7264,7264,7264,7264,7264,
+7264,7264,7264,7264,7264,7264,7264,7264,7264,7264,7264,7264,7264,7264,7264,7264,
+7264,7264,7264,7264,7264,7264,0,7264,0,0,0,0,0,7264,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1114112,1114112,1114112,1114112,1114112,-58,0,0,1114112,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+0,0,0,0,0,0,0,0,-8,-8,-8,-8,-8,-8,-8,-8,
+0,0,0,0,0,0,0,0,-8,-8,-8,-8,-8,-8,0,0,
+0,0,0,0,0,0,0,0,-8,-8,-8,-8,-8,-8,-8,-8,
+0,0,0,0,0,0,0,0,-8,-8,-8,-8,-8,-8,-8,-8,
+0,0,0,0,0,0,0,0,-8,-8,-8,-8,-8,-8,0,0,
+1114112,0,1114112,0,1114112,0,1114112,0,0,-8,0,-8,0,-8,0,-8,
+0,0,0,0,0,0,0,0,-8,-8,-8,-8,-8,-8,-8,-8,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,
+1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,
+1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,
+0,0,1114112,1114112,1114112,0,1114112,1114112,-8,-8,-74,-74,1114112,0,-7173,0,
+0,0,1114112,1114112,1114112,0,1114112,1114112,-86,-86,-86,-86,1114112,0,0,0,
+0,0,1114112,1114112,0,0,1114112,1114112,-8,-8,-100,-100,0,0,0,0,
+0,0,1114112,1114112,1114112,0,1114112,1114112,-8,-8,-112,-112,-7,0,0,0,
+0,0,1114112,1114112,1114112,0,1114112,1114112,-128,-128,-126,-126,1114112,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,-7517,0,0,0,-8383,-8262,0,0,0,0,
+0,0,28,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,26,26,26,26,26,26,26,26,26,26,
+26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,
+48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,
+48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+1,0,-10743,-3814,-10727,0,0,1,0,1,0,1,0,-10780,-10749,-10783,
+-10782,0,1,0,0,1,0,0,0,0,0,0,0,0,-10815,-10815,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,0,0,0,0,0,0,0,1,0,1,0,0,
+0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+0,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+0,0,0,0,0,0,0,0,0,1,0,1,0,-35332,1,0,
+1,0,1,0,1,0,1,0,0,0,0,1,0,-42280,0,0,
+1,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,
+1,0,1,0,1,0,1,0,1,0,-42308,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+1114112,1114112,1114112,1114112,1114112,1114112,1114112,0,0,0,0,0,0,0,0,0,
+0,0,0,1114112,1114112,1114112,1114112,1114112,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,
+32,32,32,32,32,32,32,32,32,32,32,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,
+40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,
+40,40,40,40,40,40,40,40,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,
+-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,743,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1114112,
+-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,
+-32,-32,-32,-32,-32,-32,-32,0,-32,-32,-32,-32,-32,-32,-32,121,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-232,0,-1,0,-1,0,-1,0,0,-1,0,-1,0,-1,0,
+-1,0,-1,0,-1,0,-1,0,-1,1114112,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,0,-1,0,-1,0,-1,-300,
+195,0,0,-1,0,-1,0,0,-1,0,0,0,-1,0,0,0,
+0,0,-1,0,0,97,0,0,0,-1,163,0,0,0,130,0,
+0,-1,0,-1,0,-1,0,0,-1,0,0,0,0,-1,0,0,
+-1,0,0,0,-1,0,-1,0,0,-1,0,0,0,-1,0,56,
+0,0,0,0,0,-1,-2,0,-1,-2,0,-1,-2,0,-1,0,
+-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,-79,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+1114112,0,-1,-2,0,-1,0,0,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,0,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,0,0,0,0,0,0,0,-1,0,0,10815,
+10815,0,-1,0,0,0,0,-1,0,-1,0,-1,0,-1,0,-1,
+10783,10780,10782,-210,-206,0,-205,-205,0,-202,0,-203,0,0,0,0,
+-205,0,0,-207,0,42280,42308,0,-209,-211,0,10743,0,0,0,-211,
+0,10749,-213,0,0,-214,0,0,0,0,0,0,0,10727,0,0,
+-218,0,0,-218,0,0,0,0,-218,-69,-217,-217,-71,0,0,0,
+0,0,-219,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,84,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,-1,0,-1,0,0,0,-1,0,0,0,130,130,130,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+1114112,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,-38,-37,-37,-37,
+1114112,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,
+-32,-32,-31,-32,-32,-32,-32,-32,-32,-32,-32,-32,-64,-63,-63,0,
+-62,-57,0,0,0,-47,-54,-8,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+-86,-80,7,0,0,-96,0,0,-1,0,0,-1,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,
+-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,
+-80,-80,-80,-80,-80,-80,-80,-80,-80,-80,-80,-80,-80,-80,-80,-80,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,0,0,0,0,0,0,0,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,-15,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,
+-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,
+-48,-48,-48,-48,-48,-48,-48,1114112,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,35332,0,0,0,3814,0,0,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,1114112,1114112,1114112,1114112,1114112,-59,0,0,0,0,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+8,8,8,8,8,8,8,8,0,0,0,0,0,0,0,0,
+8,8,8,8,8,8,0,0,0,0,0,0,0,0,0,0,
+8,8,8,8,8,8,8,8,0,0,0,0,0,0,0,0,
+8,8,8,8,8,8,8,8,0,0,0,0,0,0,0,0,
+8,8,8,8,8,8,0,0,0,0,0,0,0,0,0,0,
+1114112,8,1114112,8,1114112,8,1114112,8,0,0,0,0,0,0,0,0,
+8,8,8,8,8,8,8,8,0,0,0,0,0,0,0,0,
+74,74,86,86,86,86,100,100,128,128,112,112,126,126,0,0,
+1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,
+1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,
+1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,1114112,
+8,8,1114112,1114112,1114112,0,1114112,1114112,0,0,0,0,1114112,0,-7205,0,
+0,0,1114112,1114112,1114112,0,1114112,1114112,0,0,0,0,1114112,0,0,0,
+8,8,1114112,1114112,0,0,1114112,1114112,0,0,0,0,0,0,0,0,
+8,8,1114112,1114112,1114112,7,1114112,1114112,0,0,0,0,0,0,0,0,
+0,0,1114112,1114112,1114112,0,1114112,1114112,0,0,0,0,1114112,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,-28,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+-16,-16,-16,-16,-16,-16,-16,-16,-16,-16,-16,-16,-16,-16,-16,-16,
+0,0,0,0,-1,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+-26,-26,-26,-26,-26,-26,-26,-26,-26,-26,-26,-26,-26,-26,-26,-26,
+-26,-26,-26,-26,-26,-26,-26,-26,-26,-26,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,
+-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,
+-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,0,
+0,-1,0,0,0,-10795,-10792,0,-1,0,-1,0,-1,0,0,0,
+0,0,0,-1,0,0,-1,0,0,0,0,0,0,0,0,0,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,0,0,0,0,0,0,0,-1,0,-1,0,
+0,0,0,-1,0,0,0,0,0,0,0,0,0,0,0,0,
+-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,
+-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,
+-7264,-7264,-7264,-7264,-7264,-7264,0,-7264,0,0,0,0,0,-7264,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,0,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,0,-1,
+0,0,0,0,0,0,0,0,0,0,-1,0,-1,0,0,-1,
+0,-1,0,-1,0,-1,0,-1,0,0,0,0,-1,0,0,0,
+0,-1,0,-1,0,0,0,0,0,0,0,0,0,0,0,0,
+0,-1,0,-1,0,-1,0,-1,0,-1,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,
+-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,-40,-40,-40,-40,-40,-40,-40,-40,
+-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,
+-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,
+32,32,32,32,32,32,32,0,32,32,32,32,32,32,32,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1114112,0,1,0,1,0,1,0,0,1,0,1,0,1,0,1,
+0,1,0,1,0,1,0,1,0,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,-121,1,0,1,0,1,0,0,
+0,210,1,0,1,0,206,1,0,205,205,1,0,0,79,202,
+203,1,0,205,207,0,211,209,1,0,0,0,211,213,0,214,
+1,0,1,0,1,0,218,1,0,218,0,0,1,0,218,1,
+0,217,217,1,0,1,0,219,1,0,0,0,1,0,0,0,
+0,0,0,0,2,1,0,2,1,0,2,1,0,1,0,1,
+0,1,0,1,0,1,0,1,0,1,0,1,0,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+0,2,1,0,1,0,-97,-56,1,0,1,0,1,0,1,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+1,0,1,0,0,0,1,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,38,0,37,37,37,0,64,0,63,63,
+0,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,
+32,32,0,32,32,32,32,32,32,32,32,32,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,
+0,0,0,0,0,0,0,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+0,0,0,0,-60,0,0,1,0,-7,1,0,0,-130,-130,-130,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,0,0,0,0,0,0,0,0,-7615,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
+0,0,0,0,0,0,0,0,-8,-8,-8,-8,-8,-8,-8,-8,
+0,0,0,0,0,0,0,0,-8,-8,-8,-8,-8,-8,0,0,
+0,0,0,0,0,0,0,0,-8,-8,-8,-8,-8,-8,-8,-8,
+0,0,0,0,0,0,0,0,-8,-8,-8,-8,-8,-8,-8,-8,
+0,0,0,0,0,0,0,0,-8,-8,-8,-8,-8,-8,0,0,
+0,0,0,0,0,0,0,0,0,-8,0,-8,0,-8,0,-8,
+0,0,0,0,0,0,0,0,-8,-8,-8,-8,-8,-8,-8,-8,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,-8,-8,-8,-8,-8,-8,-8,-8,
+0,0,0,0,0,0,0,0,-8,-8,-8,-8,-8,-8,-8,-8,
+0,0,0,0,0,0,0,0,-8,-8,-8,-8,-8,-8,-8,-8,
+0,0,0,0,0,0,0,0,-8,-8,-74,-74,-9,0,0,0,
+0,0,0,0,0,0,0,0,-86,-86,-86,-86,-9,0,0,0,
+0,0,0,0,0,0,0,0,-8,-8,-100,-100,0,0,0,0,
+0,0,0,0,0,0,0,0,-8,-8,-112,-112,-7,0,0,0,
+0,0,0,0,0,0,0,0,-128,-128,-126,-126,-9,0,0,0,
+
+//--Autogenerated -- end of section automatically generated
+};
+
+// Code points at or above this have no conversions
+const int caseBlocksLimit = static_cast<int>(ELEMENTS(caseFoldBlocks)) << caseBlockShift;
+
+void UTF8FromUTF32Character(int uch, char *putf) {
+	size_t k = 0;
+	if (uch < 0x80) {
+		putf[k++] = static_cast<char>(uch);
+	} else if (uch < 0x800) {
+		putf[k++] = static_cast<char>(0xC0 | (uch >> 6));
+		putf[k++] = static_cast<char>(0x80 | (uch & 0x3f));
+	} else if (uch < 0x10000) {
+		putf[k++] = static_cast<char>(0xE0 | (uch >> 12));
+		putf[k++] = static_cast<char>(0x80 | ((uch >> 6) & 0x3f));
+		putf[k++] = static_cast<char>(0x80 | (uch & 0x3f));
+	} else {
+		putf[k++] = static_cast<char>(0xF0 | (uch >> 18));
+		putf[k++] = static_cast<char>(0x80 | ((uch >> 12) & 0x3f));
+		putf[k++] = static_cast<char>(0x80 | ((uch >> 6) & 0x3f));
+		putf[k++] = static_cast<char>(0x80 | (uch & 0x3f));
+	}
+	putf[k] = 0;
+}
+
 class CaseConverter : public ICaseConverter {
 	// Maximum length of a case conversion result is 6 bytes in UTF-8
 	enum { maxConversionLength=6 };
@@ -390,9 +1080,15 @@ class CaseConverter : public ICaseConverter {
 	// The parallel arrays
 	std::vector<int> characters;
 	std::vector<ConversionString> conversions;
+	// When there is a block index, conversions to a single character are found from it
+	// and only complex conversions need to be added.
+	const unsigned short *blockIndex;
 
 public:
-	CaseConverter() {
+	explicit CaseConverter(const unsigned short *blockIndex_=0) : blockIndex(blockIndex_) {
+	}
+	bool HasBlockIndex() const {
+		return blockIndex != 0;
 	}
 	bool Initialised() const {
 		return characters.size() > 0;
@@ -409,16 +1105,33 @@ public:
 		else
 			return 0;
 	}
+	// Returns the conversion of character as a UTF-8 string or 0 when there is no conversion.
+	// Conversions found from the block index are written into simple.
+	const char *Conversion(int character, char *simple) {
+		if (!blockIndex)
+			return Find(character);
+		if (character >= caseBlocksLimit)
+			return 0;
+		const int delta = caseDeltas[(blockIndex[character >> caseBlockShift] << caseBlockShift) +
+			(character & (caseBlockSize - 1))];
+		if (delta == 0)
+			return 0;
+		if (delta == complexDelta)
+			return Find(character);
+		UTF8FromUTF32Character(character + delta, simple);
+		return simple;
+	}
 	size_t CaseConvertString(char *converted, size_t sizeConverted, const char *mixed, size_t lenMixed) {
 		size_t lenConverted = 0;
 		size_t mixedPos = 0;
 		unsigned char bytes[UTF8MaxBytes + 1];
+		char simple[UTF8MaxBytes + 1];
 		while (mixedPos < lenMixed) {
 			const unsigned char leadByte = static_cast<unsigned char>(mixed[mixedPos]);
 			const char *caseConverted = 0;
 			size_t lenMixedChar = 1;
 			if (UTF8IsAscii(leadByte)) {
-				caseConverted = Find(leadByte);
+				caseConverted = Conversion(leadByte, simple);
 			} else {
 				bytes[0] = leadByte;
 				const int widthCharBytes = UTF8BytesOfLead[leadByte];
@@ -430,7 +1143,7 @@ public:
 					// valid UTF-8
 					lenMixedChar = classified & UTF8MaskWidth;
 					int character = UnicodeFromUTF8(bytes);
-					caseConverted = Find(character);
+					caseConverted = Conversion(character, simple);
 				}
 			}
 			if (caseConverted) {
@@ -465,31 +1178,17 @@ public:
 	}
 };
 
-CaseConverter caseConvFold;
-CaseConverter caseConvUp;
-CaseConverter caseConvLow;
+// Converters for strings use the block indexes so only hold complex conversions
+CaseConverter caseConvFold(caseFoldBlocks);
+CaseConverter caseConvUp(caseUpperBlocks);
+CaseConverter caseConvLow(caseLowerBlocks);
 
-void UTF8FromUTF32Character(int uch, char *putf) {
-	size_t k = 0;
-	if (uch < 0x80) {
-		putf[k++] = static_cast<char>(uch);
-	} else if (uch < 0x800) {
-		putf[k++] = static_cast<char>(0xC0 | (uch >> 6));
-		putf[k++] = static_cast<char>(0x80 | (uch & 0x3f));
-	} else if (uch < 0x10000) {
-		putf[k++] = static_cast<char>(0xE0 | (uch >> 12));
-		putf[k++] = static_cast<char>(0x80 | ((uch >> 6) & 0x3f));
-		putf[k++] = static_cast<char>(0x80 | (uch & 0x3f));
-	} else {
-		putf[k++] = static_cast<char>(0xF0 | (uch >> 18));
-		putf[k++] = static_cast<char>(0x80 | ((uch >> 12) & 0x3f));
-		putf[k++] = static_cast<char>(0x80 | ((uch >> 6) & 0x3f));
-		putf[k++] = static_cast<char>(0x80 | (uch & 0x3f));
-	}
-	putf[k] = 0;
-}
+// CaseConvert returns a string for a single character so holds all conversions
+CaseConverter characterConvFold;
+CaseConverter characterConvUp;
+CaseConverter characterConvLow;
 
-void AddSymmetric(enum CaseConversion conversion, int lower,int upper) {
+void AddSymmetric(CaseConverter &converter, enum CaseConversion conversion, int lower,int upper) {
 	char lowerUTF8[UTF8MaxBytes+1];
 	UTF8FromUTF32Character(lower, lowerUTF8);
 	char upperUTF8[UTF8MaxBytes+1];
@@ -497,18 +1196,18 @@ void AddSymmetric(enum CaseConversion conversion, int lower,int upper) {
 
 	switch (conversion) {
 	case CaseConversionFold:
-		caseConvFold.Add(upper, lowerUTF8);
+		converter.Add(upper, lowerUTF8);
 		break;
 	case CaseConversionUpper:
-		caseConvUp.Add(lower, upperUTF8);
+		converter.Add(lower, upperUTF8);
 		break;
 	case CaseConversionLower:
-		caseConvLow.Add(upper, lowerUTF8);
+		converter.Add(upper, lowerUTF8);
 		break;
 	}
 }
 
-void SetupConversions(enum CaseConversion conversion) {
+void AddSymmetricConversions(CaseConverter &converter, enum CaseConversion conversion) {
 	// First initialize for the symmetric ranges
 	for (size_t i=0; i<ELEMENTS(symmetricCaseConversionRanges);) {
 		int lower = symmetricCaseConversionRanges[i++];
@@ -516,16 +1215,18 @@ void SetupConversions(enum CaseConversion conversion) {
 		int length = symmetricCaseConversionRanges[i++];
 		int pitch = symmetricCaseConversionRanges[i++];
 		for (int j=0; j<length*pitch; j+=pitch) {
-			AddSymmetric(conversion, lower+j, upper+j);
+			AddSymmetric(converter, conversion, lower+j, upper+j);
 		}
 	}
 	// Add the symmetric singletons
 	for (size_t i=0; i<ELEMENTS(symmetricCaseConversions);) {
 		int lower = symmetricCaseConversions[i++];
 		int upper = symmetricCaseConversions[i++];
-		AddSymmetric(conversion, lower, upper);
+		AddSymmetric(converter, conversion, lower, upper);
 	}
-	// Add the complex cases
+}
+
+void AddComplexConversions(CaseConverter &converter, enum CaseConversion conversion) {
 	const char *sComplex = complexCaseConversions;
 	while (*sComplex) {
 		// Longest ligature is 3 character so 5 for safety
@@ -566,41 +1267,60 @@ void SetupConversions(enum CaseConversion conversion) {
 		int character = UnicodeFromUTF8(reinterpret_cast<unsigned char *>(originUTF8));
 
 		if (conversion == CaseConversionFold && foldedUTF8[0]) {
-			caseConvFold.Add(character, foldedUTF8);
+			converter.Add(character, foldedUTF8);
 		}
 
 		if (conversion == CaseConversionUpper && upperUTF8[0]) {
-			caseConvUp.Add(character, upperUTF8);
+			converter.Add(character, upperUTF8);
 		}
 
 		if (conversion == CaseConversionLower && lowerUTF8[0]) {
-			caseConvLow.Add(character, lowerUTF8);
+			converter.Add(character, lowerUTF8);
 		}
 	}
+}
+
+void SetupConversions(CaseConverter &converter, enum CaseConversion conversion) {
+	if (!converter.HasBlockIndex())
+		AddSymmetricConversions(converter, conversion);
+	AddComplexConversions(converter, conversion);
+	converter.FinishedAdding();
+}
 
+CaseConverter *ConverterForConversion(enum CaseConversion conversion) {
+	CaseConverter *pCaseConv = 0;
 	switch (conversion) {
 	case CaseConversionFold:
-		caseConvFold.FinishedAdding();
+		pCaseConv = &caseConvFold;
 		break;
 	case CaseConversionUpper:
-		caseConvUp.FinishedAdding();
+		pCaseConv = &caseConvUp;
 		break;
 	case CaseConversionLower:
-		caseConvLow.FinishedAdding();
+		pCaseConv = &caseConvLow;
 		break;
 	}
+	if (pCaseConv && !pCaseConv->Initialised())
+		SetupConversions(*pCaseConv, conversion);
+	return pCaseConv;
 }
 
-CaseConverter *ConverterForConversion(enum CaseConversion conversion) {
+CaseConverter *CharacterConverterForConversion(enum CaseConversion conversion) {
+	CaseConverter *pCaseConv = 0;
 	switch (conversion) {
 	case CaseConversionFold:
-		return &caseConvFold;
+		pCaseConv = &characterConvFold;
+		break;
 	case CaseConversionUpper:
-		return &caseConvUp;
+		pCaseConv = &characterConvUp;
+		break;
 	case CaseConversionLower:
-		return &caseConvLow;
+		pCaseConv = &characterConvLow;
+		break;
 	}
-	return 0;
+	if (pCaseConv && !pCaseConv->Initialised())
+		SetupConversions(*pCaseConv, conversion);
+	return pCaseConv;
 }
 
 }
@@ -610,23 +1330,16 @@ namespace Scintilla {
 #endif
 
 ICaseConverter *ConverterFor(enum CaseConversion conversion) {
-	CaseConverter *pCaseConv = ConverterForConversion(conversion);
-	if (!pCaseConv->Initialised())
-		SetupConversions(conversion);
-	return pCaseConv;
+	return ConverterForConversion(conversion);
 }
 
 const char *CaseConvert(int character, enum CaseConversion conversion) {
-	CaseConverter *pCaseConv = ConverterForConversion(conversion);
-	if (!pCaseConv->Initialised())
-		SetupConversions(conversion);
+	CaseConverter *pCaseConv = CharacterConverterForConversion(conversion);
 	return pCaseConv->Find(character);
 }
 
 size_t CaseConvertString(char *converted, size_t sizeConverted, const char *mixed, size_t lenMixed, enum CaseConversion conversion) {
 	CaseConverter *pCaseConv = ConverterForConversion(conversion);
-	if (!pCaseConv->Initialised())
-		SetupConversions(conversion);
 	return pCaseConv->CaseConvertString(converted, sizeConverted, mixed, lenMixed);
 }
 
@@ -22,10 +22,32 @@ public:
 	int GetCharsOfClass(cc charClass, unsigned char *buffer);
 	cc GetClass(unsigned char ch) const { return static_cast<cc>(charClass[ch]);}
 	bool IsWord(unsigned char ch) const { return static_cast<cc>(charClass[ch]) == ccWord;}
+	// UTF-8 characters are classified by utf8ClassTable until SetCharClasses is given bytes
+	// from 0x80 so an application can then classify UTF-8 bytes as in other encodings.
+	bool ClassifiesUTF8() const { return !highBytesSet; }
+
+	// UTF-8 characters are classified by walking utf8ClassTable a byte at a time.
+	// Each step results in a cc, utf8ClassInvalid when the bytes do not start a valid
+	// character, or a state to continue with the next byte.
+	enum { utf8ClassInvalid=4 };
+	static int UTF8ClassStart(unsigned char lead) {
+		return utf8ClassTable[lead];
+	}
+	static int UTF8ClassNext(int state, unsigned char trail) {
+		if ((trail & 0xC0) != 0x80)
+			return utf8ClassInvalid;
+		return utf8ClassTable[state + trail];
+	}
+	static bool UTF8Classified(int state) {
+		return state <= utf8ClassInvalid;
+	}
+	static int ClassifyUTF8(const unsigned char *us, int len, int &width);
 
 private:
 	enum { maxChar=256 };
 	unsigned char charClass[maxChar];    // not type cc to save space
+	bool highBytesSet;
+	static const unsigned short utf8ClassTable[];
 };
 
 #ifdef SCI_NAMESPACE
@@ -1487,27 +1487,77 @@ int Document::ParaDown(int pos) const {
 }
 
 CharClassify::cc Document::WordCharClass(unsigned char ch) const {
-	if ((SC_CP_UTF8 == dbcsCodePage) && (!UTF8IsAscii(ch)))
+	if ((SC_CP_UTF8 == dbcsCodePage) && (!UTF8IsAscii(ch)) && charClass.ClassifiesUTF8())
 		return CharClassify::ccWord;
 	return charClass.GetClass(ch);
 }
 
+/**
+ * Classify the character starting at pos and set width to its length in bytes.
+ * In UTF-8 documents the bytes of a character are classified together by walking the
+ * table generated by scripts/GenerateCharClassify.py. Bytes that do not form a valid
+ * character, and all bytes once the application has set classes for bytes from 0x80,
+ * are classified one at a time by WordCharClass.
+ */
+CharClassify::cc Document::WordCharClassAfter(int pos, int &width) const {
+	const unsigned char leadByte = static_cast<unsigned char>(cb.CharAt(pos));
+	width = 1;
+	if ((SC_CP_UTF8 == dbcsCodePage) && (!UTF8IsAscii(leadByte)) && charClass.ClassifiesUTF8()) {
+		const int length = Length();
+		int state = CharClassify::UTF8ClassStart(leadByte);
+		int end = pos + 1;
+		while (!CharClassify::UTF8Classified(state) && (end < length)) {
+			state = CharClassify::UTF8ClassNext(state, static_cast<unsigned char>(cb.CharAt(end)));
+			end++;
+		}
+		if (CharClassify::UTF8Classified(state) && (state != CharClassify::utf8ClassInvalid)) {
+			width = end - pos;
+			return static_cast<CharClassify::cc>(state);
+		}
+	}
+	return WordCharClass(leadByte);
+}
+
+/**
+ * Classify the character ending at pos and set width to its length in bytes.
+ */
+CharClassify::cc Document::WordCharClassBefore(int pos, int &width) const {
+	const unsigned char lastByte = static_cast<unsigned char>(cb.CharAt(pos-1));
+	width = 1;
+	if ((SC_CP_UTF8 == dbcsCodePage) && UTF8IsTrailByte(lastByte) && charClass.ClassifiesUTF8()) {
+		// Step back over trail bytes to a possible lead byte then check that the
+		// character starting there ends at pos.
+		int start = pos - 1;
+		while ((start > 0) && (pos - start < UTF8MaxBytes) &&
+			UTF8IsTrailByte(static_cast<unsigned char>(cb.CharAt(start))))
+			start--;
+		int widthAfter = 1;
+		const CharClassify::cc ccAfter = WordCharClassAfter(start, widthAfter);
+		if (start + widthAfter == pos) {
+			width = widthAfter;
+			return ccAfter;
+		}
+	}
+	return WordCharClass(lastByte);
+}
+
 /**
  * Used by commmands that want to select whole words.
  * Finds the start of word at pos when delta < 0 or the end of the word when delta >= 0.
  */
 int Document::ExtendWordSelect(int pos, int delta, bool onlyWordCharacters) {
 	CharClassify::cc ccStart = CharClassify::ccWord;
+	int width = 1;
 	if (delta < 0) {
 		if (!onlyWordCharacters)
-			ccStart = WordCharClass(cb.CharAt(pos-1));
-		while (pos > 0 && (WordCharClass(cb.CharAt(pos - 1)) == ccStart))
-			pos--;
+			ccStart = WordCharClassBefore(pos, width);
+		while (pos > 0 && (WordCharClassBefore(pos, width) == ccStart))
+			pos -= width;
 	} else {
 		if (!onlyWordCharacters && pos < Length())
-			ccStart = WordCharClass(cb.CharAt(pos));
-		while (pos < (Length()) && (WordCharClass(cb.CharAt(pos)) == ccStart))
-			pos++;
+			ccStart = WordCharClassAfter(pos, width);
+		while (pos < (Length()) && (WordCharClassAfter(pos, width) == ccStart))
+			pos += width;
 	}
 	return MovePositionOutsideChar(pos, delta, true);
 }
@@ -1520,21 +1570,22 @@ int Document::ExtendWordSelect(int pos, int delta, bool onlyWordCharacters) {
  * Used by cursor movement by word commands.
  */
 int Document::NextWordStart(int pos, int delta) {
+	int width = 1;
 	if (delta < 0) {
-		while (pos > 0 && (WordCharClass(cb.CharAt(pos - 1)) == CharClassify::ccSpace))
-			pos--;
+		while (pos > 0 && (WordCharClassBefore(pos, width) == CharClassify::ccSpace))
+			pos -= width;
 		if (pos > 0) {
-			CharClassify::cc ccStart = WordCharClass(cb.CharAt(pos-1));
-			while (pos > 0 && (WordCharClass(cb.CharAt(pos - 1)) == ccStart)) {
-				pos--;
+			CharClassify::cc ccStart = WordCharClassBefore(pos, width);
+			while (pos > 0 && (WordCharClassBefore(pos, width) == ccStart)) {
+				pos -= width;
 			}
 		}
 	} else {
-		CharClassify::cc ccStart = WordCharClass(cb.CharAt(pos));
-		while (pos < (Length()) && (WordCharClass(cb.CharAt(pos)) == ccStart))
-			pos++;
-		while (pos < (Length()) && (WordCharClass(cb.CharAt(pos)) == CharClassify::ccSpace))
-			pos++;
+		CharClassify::cc ccStart = WordCharClassAfter(pos, width);
+		while (pos < (Length()) && (WordCharClassAfter(pos, width) == ccStart))
+			pos += width;
+		while (pos < (Length()) && (WordCharClassAfter(pos, width) == CharClassify::ccSpace))
+			pos += width;
 	}
 	return pos;
 }
@@ -1547,26 +1598,27 @@ int Document::NextWordStart(int pos, int delta) {
  * Used by cursor movement by word commands.
  */
 int Document::NextWordEnd(int pos, int delta) {
+	int width = 1;
 	if (delta < 0) {
 		if (pos > 0) {
-			CharClassify::cc ccStart = WordCharClass(cb.CharAt(pos-1));
+			CharClassify::cc ccStart = WordCharClassBefore(pos, width);
 			if (ccStart != CharClassify::ccSpace) {
-				while (pos > 0 && WordCharClass(cb.CharAt(pos - 1)) == ccStart) {
-					pos--;
+				while (pos > 0 && WordCharClassBefore(pos, width) == ccStart) {
+					pos -= width;
 				}
 			}
-			while (pos > 0 && WordCharClass(cb.CharAt(pos - 1)) == CharClassify::ccSpace) {
-				pos--;
+			while (pos > 0 && WordCharClassBefore(pos, width) == CharClassify::ccSpace) {
+				pos -= width;
 			}
 		}
 	} else {
-		while (pos < Length() && WordCharClass(cb.CharAt(pos)) == CharClassify::ccSpace) {
-			pos++;
+		while (pos < Length() && WordCharClassAfter(pos, width) == CharClassify::ccSpace) {
+			pos += width;
 		}
 		if (pos < Length()) {
-			CharClassify::cc ccStart = WordCharClass(cb.CharAt(pos));
-			while (pos < Length() && WordCharClass(cb.CharAt(pos)) == ccStart) {
-				pos++;
+			CharClassify::cc ccStart = WordCharClassAfter(pos, width);
+			while (pos < Length() && WordCharClassAfter(pos, width) == ccStart) {
+				pos += width;
 			}
 		}
 	}
@@ -1579,9 +1631,10 @@ int Document::NextWordEnd(int pos, int delta) {
  */
 bool Document::IsWordStartAt(int pos) const {
 	if (pos > 0) {
-		CharClassify::cc ccPos = WordCharClass(CharAt(pos));
+		int width = 1;
+		CharClassify::cc ccPos = WordCharClassAfter(pos, width);
 		return (ccPos == CharClassify::ccWord || ccPos == CharClassify::ccPunctuation) &&
-			(ccPos != WordCharClass(CharAt(pos - 1)));
+			(ccPos != WordCharClassBefore(pos, width));
 	}
 	return true;
 }
@@ -1592,9 +1645,10 @@ bool Document::IsWordStartAt(int pos) const {
  */
 bool Document::IsWordEndAt(int pos) const {
 	if (pos < Length()) {
-		CharClassify::cc ccPrev = WordCharClass(CharAt(pos-1));
+		int width = 1;
+		CharClassify::cc ccPrev = WordCharClassBefore(pos, width);
 		return (ccPrev == CharClassify::ccWord || ccPrev == CharClassify::ccPunctuation) &&
-			(ccPrev != WordCharClass(CharAt(pos)));
+			(ccPrev != WordCharClassAfter(pos, width));
 	}
 	return true;
 }
@@ -2308,6 +2362,20 @@ public:
 		else
 			return pdoc->CharAt(index);
 	}
+
+	virtual int WordClassAfter(int index, int &width) {
+		width = 1;
+		if ((index < 0) || (index >= end) || (SC_CP_UTF8 != pdoc->dbcsCodePage))
+			return -1;
+		// A position inside a character has the class of the whole character
+		const int start = pdoc->MovePositionOutsideChar(index, -1, false);
+		int widthChar = 1;
+		const CharClassify::cc ccChar = pdoc->WordCharClassAfter(start, widthChar);
+		if ((start + widthChar <= index) || (start + widthChar > end))
+			return -1;
+		width = start + widthChar - index;
+		return ccChar;
+	}
 };
 
 #ifdef CXX11_REGEX
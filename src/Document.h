@@ -430,6 +430,8 @@ public:
 	bool RemoveWatcher(DocWatcher *watcher, void *userData);
 
 	CharClassify::cc WordCharClass(unsigned char ch) const;
+	CharClassify::cc WordCharClassAfter(int pos, int &width) const;
+	CharClassify::cc WordCharClassBefore(int pos, int &width) const;
 	bool IsWordPartSeparator(char ch) const;
 	int WordPartLeft(int pos);
 	int WordPartRight(int pos);
@@ -5084,6 +5084,7 @@ void Editor::SetAnnotationHeights(int start, int end) {
 
 void Editor::SetDocPointer(Document *document) {
 	//Platform::DebugPrintf("** %x setdoc to %x\n", pdoc, document);
+	const int codePagePrevious = CodePage();
 	pdoc->RemoveWatcher(this, 0);
 	pdoc->Release();
 	if (document == NULL) {
@@ -5118,6 +5119,10 @@ void Editor::SetDocPointer(Document *document) {
 	view.ClearAllTabstops();
 
 	pdoc->AddWatcher(this, 0);
+	if (CodePage() != codePagePrevious) {
+		// Fonts are measured and positions cached in the encoding of the document
+		InvalidateStyleData();
+	}
 	SetScrollBars();
 	Redraw();
 }
@@ -646,9 +646,48 @@ void PositionCache::SetSize(size_t size_) {
 	pces.resize(size_);
 }
 
+// In a fixed pitch font, the positions of text made of narrow and wide characters can be
+// calculated without measuring. Returns false if there are any other characters.
+static bool FixedPitchPositions(const FontMeasurements &fm, const char *s, unsigned int len,
+	XYPOSITION *positions, const Document *pdoc) {
+	const bool wideKnown = (pdoc->dbcsCodePage == SC_CP_UTF8) && (fm.wideWidth > 0);
+	XYPOSITION x = 0;
+	unsigned int i = 0;
+	while (i < len) {
+		const unsigned char ch = static_cast<unsigned char>(s[i]);
+		if ((ch >= ' ') && (ch < 0x7f)) {
+			x += fm.narrowWidth;
+			positions[i++] = x;
+		} else if (wideKnown && !UTF8IsAscii(ch)) {
+			const int utf8Status = UTF8Classify(reinterpret_cast<const unsigned char *>(s + i), len - i);
+			if (utf8Status & UTF8MaskInvalid)
+				return false;
+			const unsigned int lenChar = utf8Status & UTF8MaskWidth;
+			unsigned int character = 0;
+			UTF32FromUTF8(s + i, lenChar, &character, 1);
+			// Only wide characters use a sampled width: narrowWidth is sampled from ASCII so
+			// non-ASCII narrow and halfwidth characters like U+FF71 and U+00A3 are measured.
+			if (ClassifyWidth(character) != cwWide)
+				return false;
+			x += fm.wideWidth;
+			for (unsigned int b = 0; b < lenChar; b++) {
+				positions[i++] = x;
+			}
+		} else {
+			return false;
+		}
+	}
+	return true;
+}
+
 void PositionCache::MeasureWidths(Surface *surface, const ViewStyle &vstyle, unsigned int styleNumber,
 	const char *s, unsigned int len, XYPOSITION *positions, Document *pdoc) {
 
+	if (vstyle.styles[styleNumber].FixedPitch() &&
+		FixedPitchPositions(vstyle.styles[styleNumber], s, len, positions, pdoc)) {
+		return;
+	}
+
 	allClear = false;
 	size_t probe = pces.size();	// Out of bounds
 	if ((!pces.empty()) && (len < 30)) {
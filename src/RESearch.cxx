@@ -127,6 +127,8 @@
  *                      A-Z a-z 0-9 and _. Scintilla extends this definition
  *                      by user setting. The word must also be preceded and/or
  *                      followed by any character outside those mentioned.
+ *                      Characters of more than one byte are classified as
+ *                      the document classifies them for word selection.
  *
  *      [11]    \l      a backslash followed by d, D, s, S, w or W,
  *                      becomes a character class (both inside and
@@ -137,6 +139,8 @@
  *                        S: any char except whitespace (see above)
  *                        w: alphanumeric & underscore (changed by user setting)
  *                        W: any char except alphanumeric & underscore (see above)
+ *                      Outside sets, \w and \W match whole characters classified
+ *                      as for [10]. Inside sets they only hold single bytes.
  *
  *      [12]    \xHH    a backslash followed by x and two hexa digits,
  *                      becomes the character whose Ascii code is equal
@@ -230,6 +234,8 @@ using namespace Scintilla;
 #define CLO     11
 #define CLQ     12 /* 0 to 1 closure */
 #define LCLO    13 /* lazy closure */
+#define WRD     14 /* word character */
+#define NWRD    15 /* non-word character */
 
 #define END     0
 
@@ -635,6 +641,12 @@ const char *RESearch::Compile(const char *pattern, int length, bool caseSensitiv
 					return badpat("Null pattern inside \\<\\>");
 				*mp++ = EOW;
 				break;
+			case 'w':
+				*mp++ = WRD;
+				break;
+			case 'W':
+				*mp++ = NWRD;
+				break;
 			case '1':
 			case '2':
 			case '3':
@@ -843,6 +855,34 @@ extern void re_fail(char *,char);
 #define ANYSKIP 2 	/* [CLO] ANY END          */
 #define CHRSKIP 3	/* [CLO] CHR chr END      */
 #define CCLSKIP 34	/* [CLO] CCL 32 bytes END */
+#define WRDSKIP 2	/* [CLO] WRD END          */
+
+/*
+ * Word operators ask the indexer for the class of the character containing lp so
+ * that characters of more than one byte are classified as a whole, falling back to
+ * the class of the byte.
+ */
+bool RESearch::IsWordAfter(CharacterIndexer &ci, int lp, int &width) const {
+	const int characterClass = ci.WordClassAfter(lp, width);
+	if (characterClass < 0)
+		return iswordc(static_cast<unsigned char>(ci.CharAt(lp)));
+	return characterClass == CharClassify::ccWord;
+}
+
+bool RESearch::IsWordBefore(CharacterIndexer &ci, int lp) const {
+	int width = 1;
+	return IsWordAfter(ci, lp-1, width);
+}
+
+/*
+ * Whether lp is at the start of a character as stepped over by WRD, that is the
+ * character containing the previous byte ends there.
+ */
+bool RESearch::IsCharacterStart(CharacterIndexer &ci, int lp) const {
+	int width = 1;
+	ci.WordClassAfter(lp-1, width);
+	return width <= 1;
+}
 
 int RESearch::PMatch(CharacterIndexer &ci, int lp, int endp, char *ap) {
 	int op, c, n;
@@ -851,6 +891,8 @@ int RESearch::PMatch(CharacterIndexer &ci, int lp, int endp, char *ap) {
 	int ep;		/* ending of subpat...    */
 	int are;	/* to save the line ptr.  */
 	int llp;	/* lazy lp for LCLO       */
+	int width;	/* bytes in a WRD char    */
+	bool byChar;	/* closure over WRD chars */
 
 	while ((op = *ap++) != END)
 		switch (op) {
@@ -886,13 +928,19 @@ int RESearch::PMatch(CharacterIndexer &ci, int lp, int endp, char *ap) {
 			eopat[static_cast<int>(*ap++)] = lp;
 			break;
 		case BOW:
-			if ((lp!=bol && iswordc(ci.CharAt(lp-1))) || !iswordc(ci.CharAt(lp)))
+			if ((lp!=bol && IsWordBefore(ci, lp)) || !IsWordAfter(ci, lp, width))
 				return NOTFOUND;
 			break;
 		case EOW:
-			if (lp==bol || !iswordc(ci.CharAt(lp-1)) || iswordc(ci.CharAt(lp)))
+			if (lp==bol || !IsWordBefore(ci, lp) || IsWordAfter(ci, lp, width))
 				return NOTFOUND;
 			break;
+		case WRD:
+		case NWRD:
+			if (lp >= endp || IsWordAfter(ci, lp, width) != (op == WRD))
+				return NOTFOUND;
+			lp += width;
+			break;
 		case REF:
 			n = *ap++;
 			bp = bopat[n];
@@ -905,6 +953,7 @@ int RESearch::PMatch(CharacterIndexer &ci, int lp, int endp, char *ap) {
 		case CLQ:
 		case CLO:
 			are = lp;
+			byChar = false;
 			switch (*ap) {
 
 			case ANY:
@@ -930,6 +979,17 @@ int RESearch::PMatch(CharacterIndexer &ci, int lp, int endp, char *ap) {
 					lp++;
 				n = CCLSKIP;
 				break;
+			case WRD:
+			case NWRD:
+				c = *ap;
+				if (op == CLO || op == LCLO)
+					while ((lp < endp) && (IsWordAfter(ci, lp, width) == (c == WRD)))
+						lp += width;
+				else if ((lp < endp) && (IsWordAfter(ci, lp, width) == (c == WRD)))
+					lp += width;
+				byChar = true;
+				n = WRDSKIP;
+				break;
 			default:
 				failure = true;
 				//re_fail("closure: bad nfa.", *ap);
@@ -948,6 +1008,9 @@ int RESearch::PMatch(CharacterIndexer &ci, int lp, int endp, char *ap) {
 				}
 				if (*ap == END) return e;
 				--llp;
+				// The closure stepped over whole characters so back up over them too
+				while (byChar && (llp > are) && !IsCharacterStart(ci, llp))
+					--llp;
 			}
 			if (*ap == EOT)
 				PMatch(ci, lp, endp, ap);
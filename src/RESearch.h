@@ -24,6 +24,12 @@ namespace Scintilla {
 class CharacterIndexer {
 public:
 	virtual char CharAt(int index)=0;
+	// The CharClassify::cc of the character containing index and the number of its bytes
+	// from index so that word operators match the owner's words. -1 classifies the byte.
+	virtual int WordClassAfter(int, int &width) {
+		width = 1;
+		return -1;
+	}
 	virtual ~CharacterIndexer() {
 	}
 };
@@ -63,6 +69,9 @@ private:
 	bool iswordc(unsigned char x) const {
 		return charClass->IsWord(x);
 	}
+	bool IsWordAfter(CharacterIndexer &ci, int lp, int &width) const;
+	bool IsWordBefore(CharacterIndexer &ci, int lp) const;
+	bool IsCharacterStart(CharacterIndexer &ci, int lp) const;
 };
 
 #ifdef SCI_NAMESPACE
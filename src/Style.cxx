@@ -72,6 +72,8 @@ void FontMeasurements::Clear() {
 	descent = 1;
 	aveCharWidth = 1;
 	spaceWidth = 1;
+	narrowWidth = 0;
+	wideWidth = 0;
 	sizeZoomed = 2;
 }
 
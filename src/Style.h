@@ -48,9 +48,16 @@ struct FontMeasurements {
 	unsigned int descent;
 	XYPOSITION aveCharWidth;
 	XYPOSITION spaceWidth;
+	// Width of every narrow character when the font is fixed pitch, otherwise 0
+	XYPOSITION narrowWidth;
+	// Width of every wide character when they are the same in a fixed pitch font, otherwise 0
+	XYPOSITION wideWidth;
 	int sizeZoomed;
 	FontMeasurements();
 	void Clear();
+	bool FixedPitch() const {
+		return narrowWidth > 0;
+	}
 };
 
 /**
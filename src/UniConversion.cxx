@@ -1,6 +1,7 @@
 // Scintilla source code edit control
 /** @file UniConversion.cxx
  ** Functions to handle UTF-8 and UTF-16 strings.
+ ** Character width table automatically regenerated by scripts/GenerateCharacterWidth.py
  **/
 // Copyright 1998-2001 by Neil Hodgson <neilh@scintilla.org>
 // The License.txt file describes the conditions under which this software may be distributed.
@@ -308,6 +309,274 @@ int UTF8DrawBytes(const unsigned char *us, int len) {
 	return (utf8StatusNext & UTF8MaskInvalid) ? 1 : (utf8StatusNext & UTF8MaskWidth);
 }
 
+// Widths of characters below widthTrieLimit are in a three stage table.
+// The top bits of a character select a block of widthTrieIndex from widthTrieTop,
+// the middle bits select a block of widthTrieClasses from that, and the low bits
+// select the CharacterWidth. Repeated blocks are only stored once.
+// widthClassBlockShift and widthIndexBlockShift must match
+// scripts/GenerateCharacterWidth.py.
+
+enum { widthClassBlockShift=4, widthIndexBlockShift=5 };
+
+static const unsigned char widthTrieTop[] = {
+//++Autogenerated -- start of section automatically generated
+//**\(\*\n\)
+// Created from CharacterCategory.cxx,  Unicode 6.1.0
+0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,10,
+15,10,10,16,17,10,18,10,19,10,10,10,10,10,10,10,
+10,10,10,10,10,10,10,20,20,20,20,20,20,20,20,20,
+20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,
+20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,21,
+10,10,10,22,23,24,20,20,20,20,20,20,20,20,20,20,
+20,20,20,20,20,20,20,20,20,20,20,25,10,10,10,10,
+10,10,10,10,10,10,10,10,10,10,10,10,10,26,10,27,
+28,10,10,10,10,29,10,10,30,10,10,31,10,10,10,10,
+10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,
+10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,
+10,10,10,10,10,10,10,32,10,10,10,10,10,10,10,10,
+10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,
+10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,
+10,10,10,10,10,10,10,10,33,34,10,10,10,10,10,10,
+10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,
+10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,
+10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,
+10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,
+10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,
+10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,
+10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,
+10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,
+10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,
+10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,
+10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,
+10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,
+10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,
+10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,
+10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,
+10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,
+10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,
+
+//--Autogenerated -- end of section automatically generated
+};
+
+static const unsigned short widthTrieIndex[] = {
+//++Autogenerated -- start of section automatically generated
+//**1 \(\*\n\)
+0,0,1,1,1,1,1,2,0,0,3,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+4,4,4,4,4,4,4,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,5,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,6,4,7,8,0,0,0,
+9,10,0,0,11,4,0,12,0,0,0,0,0,13,14,0,
+15,16,0,4,10,0,0,0,0,0,17,12,0,0,11,18,
+0,19,20,0,0,21,0,0,0,0,0,0,0,0,22,23,
+24,0,0,25,26,27,28,0,16,0,0,29,30,0,28,0,
+31,0,0,29,32,16,0,33,31,0,0,29,34,0,28,0,
+16,0,0,35,30,36,28,0,37,0,0,0,38,0,0,0,
+0,0,0,39,40,41,28,0,0,0,0,35,42,0,28,0,
+0,0,0,0,30,0,28,0,0,0,0,0,43,44,0,0,
+0,0,0,45,46,0,0,0,0,0,0,47,48,0,0,0,
+0,49,0,50,0,0,0,51,52,53,4,54,36,0,0,0,
+0,0,55,56,0,57,12,58,59,60,0,0,0,0,0,0,
+0,0,0,0,0,0,4,4,4,4,4,4,4,4,4,4,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,55,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,61,0,61,0,28,0,28,0,0,0,62,63,64,0,0,
+65,0,0,0,0,0,0,0,0,0,66,0,0,0,0,0,
+0,0,67,68,0,0,0,0,0,0,0,0,0,0,0,0,
+0,69,0,0,0,70,71,72,0,0,0,0,0,0,0,0,
+18,0,0,73,37,0,11,18,74,0,75,0,0,0,76,74,
+0,0,77,78,0,0,0,0,0,0,0,0,0,79,80,81,
+0,0,0,0,0,0,0,0,0,0,0,0,4,4,82,77,
+11,0,83,0,0,0,84,0,0,0,85,0,0,4,4,12,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,86,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,87,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,15,74,
+0,0,0,0,0,0,0,15,0,0,0,0,0,0,4,4,
+88,88,89,90,91,88,88,88,88,92,88,88,88,88,88,88,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,
+88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,
+88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,
+88,88,88,88,88,88,88,88,88,88,88,88,93,0,0,0,
+0,0,0,0,0,0,15,94,0,15,0,0,0,0,0,74,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+95,0,41,0,0,0,0,0,0,0,0,0,81,0,4,74,
+0,0,96,0,97,74,0,0,24,0,0,98,0,0,0,0,
+0,0,99,100,101,0,0,0,0,0,0,102,16,0,103,36,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,104,0,
+88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,
+88,88,88,88,88,88,88,88,88,88,105,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,106,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+4,0,82,0,0,0,0,0,0,0,0,0,0,0,0,15,
+91,88,88,88,88,88,107,1,1,1,1,2,108,109,110,21,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,60,
+111,0,0,112,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+16,0,0,113,82,0,0,0,74,0,0,114,0,0,0,0,
+24,0,115,9,0,0,0,0,74,0,0,116,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,117,118,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,15,24,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,119,120,121,0,122,0,0,0,0,0,
+0,0,0,0,61,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+
+//--Autogenerated -- end of section automatically generated
+};
+
+static const unsigned char widthTrieClasses[] = {
+//++Autogenerated -- start of section automatically generated
+//**2 \(\*\n\)
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
+1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,
+0,0,1,1,0,1,1,0,0,0,0,0,1,0,0,1,
+3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,
+0,0,0,3,3,3,3,3,3,3,0,0,0,0,0,0,
+0,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,
+3,3,3,3,3,3,3,3,3,3,3,3,3,3,0,3,
+0,3,3,0,3,3,0,3,0,0,0,0,0,0,0,0,
+3,3,3,3,3,0,0,0,0,0,0,0,0,0,0,0,
+3,3,3,3,3,3,3,3,3,3,3,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,3,3,3,3,3,
+3,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,3,3,3,3,3,3,3,3,0,3,
+3,3,3,3,3,0,0,3,3,0,3,3,3,3,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,3,
+0,3,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,3,3,3,3,3,3,3,3,3,3,
+3,3,3,3,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,3,3,3,3,0,3,3,3,3,3,
+3,3,3,3,0,3,3,3,0,3,3,3,3,3,0,0,
+0,0,0,0,0,0,0,0,0,3,3,3,0,0,0,0,
+0,0,0,0,3,3,3,3,3,3,3,3,3,3,3,3,
+3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,0,
+3,3,3,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,3,0,3,0,0,0,
+0,3,3,3,3,3,3,3,3,0,0,0,0,3,0,0,
+0,3,3,3,3,3,3,3,0,0,0,0,0,0,0,0,
+0,0,3,3,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,3,0,0,0,
+0,3,3,3,3,0,0,0,0,0,0,0,0,3,0,0,
+0,3,3,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,3,3,0,0,0,0,3,3,0,0,3,3,3,0,0,
+3,3,0,0,0,3,0,0,0,0,0,0,0,0,0,0,
+0,3,3,3,3,3,0,3,3,0,0,0,0,3,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,3,0,0,3,
+0,0,0,0,0,0,3,0,0,0,0,0,0,0,0,0,
+0,0,3,0,0,0,0,0,0,0,0,0,0,0,0,0,
+3,0,0,0,0,0,0,0,0,0,0,0,0,3,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,3,3,
+3,0,0,0,0,0,3,3,3,0,3,3,3,3,0,0,
+0,0,0,0,0,3,3,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,3,0,0,0,0,0,3,3,0,0,
+0,0,0,0,0,0,0,0,0,0,3,0,0,0,0,0,
+0,0,3,3,3,0,3,0,0,0,0,0,0,0,0,0,
+0,3,0,0,3,3,3,3,3,3,3,0,0,0,0,0,
+0,0,0,0,0,0,0,3,3,3,3,3,3,3,3,0,
+0,3,0,0,3,3,3,3,3,3,0,3,3,0,0,0,
+0,0,0,0,0,0,0,0,3,3,3,3,3,3,0,0,
+0,0,0,0,0,0,0,0,3,3,0,0,0,0,0,0,
+0,0,0,0,0,3,0,3,0,3,0,0,0,0,0,0,
+0,3,3,3,3,3,3,3,3,3,3,3,3,3,3,0,
+3,3,3,3,3,0,3,3,0,0,0,0,0,3,3,3,
+3,3,3,3,3,3,3,3,0,3,3,3,3,3,3,3,
+3,3,3,3,3,3,3,3,3,3,3,3,3,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,3,3,3,
+3,0,3,3,3,3,3,3,0,3,3,0,0,3,3,0,
+0,0,0,0,0,0,0,0,3,3,0,0,0,0,3,3,
+0,3,3,3,3,0,0,0,0,0,0,0,0,0,0,0,
+0,0,3,0,0,3,3,0,0,0,0,0,0,3,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,3,0,0,
+0,0,3,3,3,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,3,3,0,3,3,3,3,3,3,3,0,0,
+0,0,0,0,0,0,3,0,0,3,3,3,3,3,3,3,
+3,3,3,3,0,0,0,0,0,0,0,0,0,3,0,0,
+0,0,0,0,0,0,0,0,0,0,0,3,3,3,0,0,
+0,0,0,0,0,0,0,0,0,3,0,0,0,0,0,0,
+3,3,3,0,0,0,0,3,3,0,0,0,0,0,0,0,
+0,0,3,0,0,0,0,0,0,3,3,3,0,0,0,0,
+0,0,0,0,0,0,0,3,3,0,0,0,0,0,0,0,
+0,0,0,0,0,0,3,0,3,3,3,3,3,3,3,0,
+3,0,3,0,0,3,3,3,3,3,3,3,3,0,0,0,
+0,0,0,3,3,3,3,3,3,3,3,3,3,0,0,3,
+0,0,0,0,3,0,3,3,3,3,3,0,3,0,0,0,
+3,3,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,3,3,3,3,0,0,3,3,0,3,0,0,0,0,
+0,0,0,0,0,0,3,0,3,3,0,0,0,3,0,3,
+0,0,0,0,0,0,0,0,0,0,0,0,3,3,3,3,
+3,3,3,3,0,0,3,3,0,0,0,0,0,0,0,0,
+3,3,3,0,3,3,3,3,3,3,3,3,3,3,3,3,
+3,0,3,3,3,3,3,3,3,0,0,0,0,3,0,0,
+0,0,0,0,3,0,0,0,0,0,0,0,0,0,0,0,
+3,3,3,3,3,3,3,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,3,3,3,3,3,0,
+3,3,3,3,3,0,0,0,0,0,3,3,3,3,3,3,
+0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,
+0,0,0,0,0,0,1,1,1,1,1,1,1,1,0,0,
+0,0,0,0,0,1,1,0,0,0,0,0,0,0,0,0,
+2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,
+2,2,2,2,2,2,2,2,2,2,3,3,3,3,2,2,
+2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,
+0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,
+2,2,2,2,2,2,2,0,0,3,3,2,2,2,2,2,
+2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,
+3,3,3,0,3,3,3,3,3,3,3,3,3,3,0,0,
+0,0,3,0,0,0,3,0,0,0,0,3,0,0,0,0,
+0,0,0,0,0,0,3,3,3,3,3,3,3,3,0,0,
+0,0,0,0,0,0,0,3,3,3,3,3,3,3,3,3,
+0,0,0,3,0,0,3,3,3,3,0,0,3,0,0,0,
+0,0,0,0,0,0,0,0,0,3,3,3,3,3,3,0,
+0,3,3,0,0,3,3,0,0,0,0,0,0,0,0,0,
+0,0,0,3,0,0,0,0,0,0,0,0,3,0,0,0,
+3,0,3,3,3,0,0,3,3,0,0,0,0,0,3,3,
+0,0,0,0,0,0,0,0,0,0,0,0,3,3,0,0,
+0,0,0,0,0,3,0,0,3,0,0,0,0,3,0,0,
+2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,0,0,0,0,3,0,
+2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
+0,0,1,1,1,1,1,1,0,0,1,1,1,1,1,1,
+0,0,1,1,1,1,1,1,0,0,1,1,1,0,0,0,
+2,2,2,2,2,2,2,0,1,1,1,1,1,1,1,0,
+0,3,3,3,0,3,3,0,0,0,0,0,3,3,3,3,
+0,0,0,0,0,0,0,0,3,3,3,0,0,0,0,3,
+0,0,0,0,0,0,0,0,3,3,3,3,3,3,3,3,
+0,0,0,3,3,3,3,0,0,3,3,0,0,3,0,0,
+0,0,0,0,0,0,0,3,3,3,3,3,0,3,3,3,
+0,0,0,0,0,0,3,3,3,3,3,3,3,3,3,0,
+0,0,0,0,0,0,0,0,0,0,0,3,0,3,0,0,
+3,3,3,3,3,3,0,3,0,0,0,0,0,0,0,0,
+0,0,0,0,0,0,0,3,3,3,0,0,0,0,0,0,
+0,0,0,3,3,3,3,3,3,3,3,3,3,3,3,3,
+3,3,3,0,0,3,3,3,3,3,3,3,0,0,0,0,
+0,0,0,0,0,0,0,0,0,0,3,3,3,3,0,0,
+
+//--Autogenerated -- end of section automatically generated
+};
+
+static const int widthTrieLimit = static_cast<int>(sizeof(widthTrieTop)) << (widthClassBlockShift + widthIndexBlockShift);
+
+CharacterWidth ClassifyWidth(int character) {
+	if (character < 0 || character >= widthTrieLimit)
+		return cwOther;
+	const int indexBlock = widthTrieTop[character >> (widthClassBlockShift + widthIndexBlockShift)];
+	const int classBlock = widthTrieIndex[(indexBlock << widthIndexBlockShift) +
+		((character >> widthClassBlockShift) & ((1 << widthIndexBlockShift) - 1))];
+	return static_cast<CharacterWidth>(widthTrieClasses[(classBlock << widthClassBlockShift) +
+		(character & ((1 << widthClassBlockShift) - 1))]);
+}
+
 #ifdef SCI_NAMESPACE
 }
 #endif
@@ -55,6 +55,12 @@ inline bool UTF8IsNEL(const unsigned char *us) {
 	return (us[0] == 0xc2) && (us[1] == 0x85);
 }
 
+// The number of cells a character occupies in a fixed pitch font.
+// cwOther characters, including those with ambiguous East Asian Width and those
+// from scripts where the width depends on neighbouring characters, must be measured.
+enum CharacterWidth { cwOther, cwNarrow, cwWide, cwZero };
+CharacterWidth ClassifyWidth(int character);
+
 enum { SURROGATE_LEAD_FIRST = 0xD800 };
 enum { SURROGATE_LEAD_LAST = 0xDBFF };
 inline unsigned int UTF16CharLength(wchar_t uch) {
@@ -6,6 +6,7 @@
 // The License.txt file describes the conditions under which this software may be distributed.
 
 #include <string.h>
+#include <math.h>
 #include <assert.h>
 
 #include <stdexcept>
@@ -67,6 +68,24 @@ const char *FontNames::Save(const char *name) {
 FontRealised::FontRealised() {
 }
 
+// Returns the width of each character in sample when they are all the same width, otherwise 0.
+// Each character in sample is charBytes long. Only the position after the last byte of each
+// character is checked as platforms differ in how they position the other bytes.
+static XYPOSITION EqualWidth(Surface &surface, Font &font, const char *sample, int charBytes) {
+	const int lenSample = static_cast<int>(strlen(sample));
+	std::vector<XYPOSITION> positions(lenSample);
+	surface.MeasureWidths(font, sample, lenSample, &positions[0]);
+	const XYPOSITION width = positions[charBytes - 1];
+	if (width <= 0)
+		return 0;
+	for (int i = charBytes - 1; i < lenSample; i += charBytes) {
+		const XYPOSITION expected = width * (i / charBytes + 1);
+		if (fabs(positions[i] - expected) > 0.01)
+			return 0;
+	}
+	return width;
+}
+
 FontRealised::~FontRealised() {
 	font.Release();
 }
@@ -85,6 +104,20 @@ void FontRealised::Realise(Surface &surface, int zoomLevel, int technology, cons
 	descent = static_cast<unsigned int>(surface.Descent(font));
 	aveCharWidth = surface.AverageCharWidth(font);
 	spaceWidth = surface.WidthChar(font, ' ');
+
+	// Text in fixed pitch fonts can be laid out without measuring, see PositionCache.
+	// Wide characters often come from a different font so are checked separately.
+	// The sample is UTF-8 so is only meaningful when the surface is in Unicode mode and
+	// PositionCache only uses wideWidth for UTF-8 documents.
+	narrowWidth = EqualWidth(surface, font, " !.0:@AIMW_ilmw|~", 1);
+	wideWidth = 0;
+	if (narrowWidth > 0) {
+		// One character from each block that ClassifyWidth treats as wide, see wideBlocks in
+		// scripts/GenerateCharacterWidth.py: CJK punctuation, hiragana, katakana, CJK ideograph,
+		// hangul syllable, and fullwidth forms
+		wideWidth = EqualWidth(surface, font,
+			"\xe3\x80\x82\xe3\x81\x82\xe3\x82\xa2\xe4\xb8\x80\xea\xb0\x80\xef\xbc\xa1", 3);
+	}
 }
 
 ViewStyle::ViewStyle() {
@@ -2,7 +2,7 @@
 
 from __future__ import unicode_literals
 
-import ctypes, os, sys
+import ctypes, json, os, sys, timeit
 
 from ctypes import c_int, c_ulong, c_char_p, c_wchar_p, c_ushort, c_uint, c_long
 
@@ -22,6 +22,12 @@ class FINDTEXT(ctypes.Structure):
 		('cpMaxText', c_long),
 	)
 
+def charPointer(value):
+	# ctypes.cast is slow so integers, the most common arguments, are converted directly
+	if type(value) is int:
+		return c_char_p(value)
+	return ctypes.cast(value, c_char_p)
+
 class SciCall:
 	def __init__(self, fn, ptr, msg, stringResult=False):
 		self._fn = fn
@@ -29,7 +35,7 @@ class SciCall:
 		self._msg = msg
 		self._stringResult = stringResult
 	def __call__(self, w=0, l=0):
-		ww = ctypes.cast(w, c_char_p)
+		ww = charPointer(w)
 		if self._stringResult:
 			lengthBytes = self._fn(self._ptr, self._msg, ww, None)
 			if lengthBytes == 0:
@@ -39,82 +45,252 @@ class SciCall:
 			assert lengthBytes == lengthBytes2
 			return bytearray(result)[:lengthBytes]
 		else:
-			ll = ctypes.cast(l, c_char_p)
+			ll = charPointer(l)
 			return self._fn(self._ptr, self._msg, ww, ll)
 
+def stringLength(value):
+	# Bytes in a string argument or result or 0 for other values
+	if isinstance(value, (bytes, bytearray)):
+		return len(value)
+	return 0
+
+class MessageProfile(object):
+	__slots__ = ("count", "total", "longest", "stringBytes")
+	def __init__(self):
+		self.count = 0
+		self.total = 0.0
+		self.longest = 0.0
+		self.stringBytes = 0
+
+class CallProfile(object):
+	""" Count and time calls and total the size of string arguments by message name.
+	Pass to ScintillaCallable.Instrument to start recording. """
+	def __init__(self, timer=timeit.default_timer):
+		self.timer = timer
+		self.messages = {}
+	def Record(self, name, seconds, stringBytes):
+		message = self.messages.get(name)
+		if message is None:
+			message = self.messages[name] = MessageProfile()
+		message.count += 1
+		message.total += seconds
+		if seconds > message.longest:
+			message.longest = seconds
+		message.stringBytes += stringBytes
+	def Clear(self):
+		self.messages = {}
+	def Sorted(self, key="total"):
+		""" Return (name, MessageProfile) pairs with the largest key first. """
+		return sorted(self.messages.items(),
+			key=lambda item: (-getattr(item[1], key), item[0]))
+	def JSON(self):
+		return json.dumps(dict((name, {"count": message.count, "total": message.total,
+			"longest": message.longest, "stringBytes": message.stringBytes})
+			for name, message in self.messages.items()), indent=1, sort_keys=True)
+	def Table(self, key="total"):
+		lines = ["%-32s %8s %12s %12s %12s" % ("Message", "Calls", "Total ms", "Longest ms", "String bytes")]
+		for name, message in self.Sorted(key):
+			lines.append("%-32s %8d %12.3f %12.3f %12d" % (name, message.count,
+				message.total * 1000.0, message.longest * 1000.0, message.stringBytes))
+		return "\n".join(lines)
+
+class ProfiledSciCall(SciCall):
+	def __init__(self, fn, ptr, msg, stringResult, name, profile):
+		SciCall.__init__(self, fn, ptr, msg, stringResult)
+		self._name = name
+		self._profile = profile
+	def __call__(self, w=0, l=0):
+		timer = self._profile.timer
+		start = timer()
+		result = SciCall.__call__(self, w, l)
+		seconds = timer() - start
+		self._profile.Record(self._name, seconds,
+			stringLength(w) + stringLength(l) + stringLength(result))
+		return result
+
+def profiledCall(profile, name, function):
+	# Wrap a property function to record its calls in profile
+	def call(*args):
+		start = profile.timer()
+		result = function(*args)
+		seconds = profile.timer() - start
+		profile.Record(name, seconds, sum(stringLength(arg) for arg in args))
+		return result
+	return call
+
 sciFX = ctypes.CFUNCTYPE(c_long, c_char_p, c_int, c_char_p, c_char_p)
 
-class ScintillaCallable:
+# GetText, GetLine, and GetCurLine have a stringresult but are called with a buffer
+bufferResults = ["GetText", "GetLine", "GetCurLine"]
+
+class Property(object):
+	# Installed in a subclass of ScintillaCallable made for each face for properties that
+	# can be read so reading them does not need the failed lookup that leads to __getattr__
+	def __init__(self, name):
+		self.name = name
+	def __get__(self, ed, owner=None):
+		if ed is None:
+			return self
+		getterName, getValue = ed._getters.get(self.name, (None, None))
+		if not getValue:
+			# Let __getattr__ decide
+			raise AttributeError(self.name)
+		ed.used.add(getterName)
+		return getValue()
+
+# The subclass of ScintillaCallable with the Property descriptors for each face by id.
+# The face is kept with its class so that its id is not reused.
+faceClasses = {}
+
+class ScintillaCallable(object):
+	# Calls and properties are looked up in tables made once from the face.
+	# Each SciCall and constant is installed in the instance when first accessed so
+	# later accesses are ordinary attribute lookups.
 	def __init__(self, face, scifn, sciptr):
 		self.__dict__["face"] = face
 		self.__dict__["used"] = set()
-		self.__dict__["all"] = set()
-		# The k member is for accessing constants as a dictionary
-		self.__dict__["k"] = {}
-		for f in face.features:
-			self.all.add(f)
-			if face.features[f]["FeatureType"] == "val":
-				self.k[f] = int(self.face.features[f]["Value"], 0)
-			elif face.features[f]["FeatureType"] == "evt":
-				self.k["SCN_"+f] = int(self.face.features[f]["Value"], 0)
+		self.__dict__["all"] = set(face.features)
 		scifn = sciFX(scifn)
 		self.__dict__["_scifn"] = scifn
 		self.__dict__["_sciptr"] = sciptr
+		# Calls are not recorded until Instrument is called with a CallProfile
+		self.__dict__["profile"] = None
+		self.makeTables()
+		object.__setattr__(self, "__class__", self.faceClass())
+	def faceClass(self):
+		# Properties depend only on the face so instances with the same face share a class
+		face = self.face
+		faceAndClass = faceClasses.get(id(face))
+		if faceAndClass is None or faceAndClass[0] is not face:
+			properties = {}
+			for name, (getterName, getValue) in self._getters.items():
+				if getValue and name not in self._calls and \
+					name not in ScintillaCallable.__dict__ and \
+					(name not in face.features or face.features[name].featureType != "val"):
+					properties[name] = Property(name)
+			faceAndClass = (face, type(ScintillaCallable.__name__, (ScintillaCallable,), properties))
+			faceClasses[id(face)] = faceAndClass
+		return faceAndClass[1]
+	def makeTables(self):
+		face = self.face
+		# Messages and whether they have a string result by name
+		calls = {}
+		# Functions and the feature they call by property name
+		getters = {}
+		setters = {}
+		# Faces from IfaceTable only support lookup and iteration by name
+		propertyNames = set()
+		for name in face.features:
+			feature = face.features[name]
+			if feature.featureType in ["fun", "get", "set"]:
+				calls[name] = (feature.number,
+					feature.param2Type == "stringresult" and name not in bufferResults)
+			if (feature.featureType == "get" and name.startswith("Get")) or \
+				(feature.featureType == "set" and name.startswith("Set")):
+				propertyNames.add(name[3:])
+		for name in propertyNames:
+			getter, setter = face.properties.get(name, (None, None))
+			if getter:
+				feature = face.features[getter]
+				if not name.startswith("Get") and \
+					not feature.param1Type and \
+					not feature.param2Type and \
+					feature.returnType in ["bool", "int", "position"]:
+					getters[name] = (getter, self.profiled(getter, self.getterCall(feature.number)))
+				else:
+					getters[name] = (getter, None)
+			if setter:
+				feature = face.features[setter]
+				setters[name] = (setter, self.profiled(setter, self.setterCall(name, feature)))
+		self.__dict__["_calls"] = calls
+		self.__dict__["_getters"] = getters
+		self.__dict__["_setters"] = setters
+	def Instrument(self, profile):
+		""" Record calls in profile or stop recording when profile is None.
+		When not recording, calls are made without any instrumentation. """
+		self.__dict__["profile"] = profile
+		# Remove installed SciCalls so they are made again with or without recording
+		for name in self._calls:
+			self.__dict__.pop(name, None)
+		self.makeTables()
+	def profiled(self, name, function):
+		if self.profile is None or function is None:
+			return function
+		return profiledCall(self.profile, name, function)
+	def getterCall(self, msg):
+		scifn = self._scifn
+		sciptr = self._sciptr
+		def getValue():
+			return scifn(sciptr, msg, None, None)
+		return getValue
+	def setterCall(self, name, feature):
+		scifn = self._scifn
+		sciptr = self._sciptr
+		msg = feature.number
+		if name.startswith("Set"):
+			return None
+		if feature.param1Type in ["bool", "int", "position"]:
+			def setValue(val):
+				return scifn(sciptr, msg, c_char_p(val), None)
+			return setValue
+		elif feature.param2Type in ["string"]:
+			def setValue(val):
+				return scifn(sciptr, msg, None, c_char_p(val))
+			return setValue
+		return None
 	def __getattr__(self, name):
-		if name in self.face.features:
+		# Only called for names not yet installed in the instance
+		call = self._calls.get(name)
+		if call:
 			self.used.add(name)
-			feature = self.face.features[name]
-			value = int(feature["Value"], 0)
-			#~ print("Feature", name, feature)
-			if feature["FeatureType"] == "val":
-				self.__dict__[name] = value
-				return value
+			msg, stringResult = call
+			if self.profile is None:
+				sciCall = SciCall(self._scifn, self._sciptr, msg, stringResult)
 			else:
-				if feature["Param2Type"] == "stringresult" and \
-					name not in ["GetText", "GetLine", "GetCurLine"]:
-					return SciCall(self._scifn, self._sciptr, value, True)
-				else:
-					return SciCall(self._scifn, self._sciptr, value)
-		elif ("Get" + name) in self.face.features:
-			self.used.add("Get" + name)
-			feature = self.face.features["Get" + name]
-			value = int(feature["Value"], 0)
-			if feature["FeatureType"] == "get" and \
-				not name.startswith("Get") and \
-				not feature["Param1Type"] and \
-				not feature["Param2Type"] and \
-				feature["ReturnType"] in ["bool", "int", "position"]:
-				#~ print("property", feature)
-				return self._scifn(self._sciptr, value, None, None)
+				sciCall = ProfiledSciCall(self._scifn, self._sciptr, msg, stringResult,
+					name, self.profile)
+			self.__dict__[name] = sciCall
+			return sciCall
+		elif name in self.face.features and self.face.features[name].featureType == "val":
+			# Constants
+			self.used.add(name)
+			value = self.face.features[name].number
+			self.__dict__[name] = value
+			return value
+		getter = self._getters.get(name)
+		if getter:
+			getterName, getValue = getter
+			self.used.add(getterName)
+			if getValue:
+				return getValue()
 		elif name.startswith("SCN_") and name in self.k:
 			self.used.add(name)
-			feature = self.face.features[name[4:]]
-			value = int(feature["Value"], 0)
-			#~ print("Feature", name, feature)
-			if feature["FeatureType"] == "val":
-				return value
+			return self.k[name]
+		elif name == "k":
+			# The k member is for accessing constants as a dictionary
+			k = {}
+			for f in self.face.features:
+				feature = self.face.features[f]
+				if feature.featureType == "val":
+					k[f] = feature.number
+				elif feature.featureType == "evt":
+					k["SCN_"+f] = feature.number
+			self.__dict__["k"] = k
+			return k
 		raise AttributeError(name)
 	def __setattr__(self, name, val):
-		if ("Set" + name) in self.face.features:
-			self.used.add("Set" + name)
-			feature = self.face.features["Set" + name]
-			value = int(feature["Value"], 0)
-			#~ print("setproperty", feature)
-			if feature["FeatureType"] == "set" and not name.startswith("Set"):
-				if feature["Param1Type"] in ["bool", "int", "position"]:
-					return self._scifn(self._sciptr, value, c_char_p(val), None)
-				elif feature["Param2Type"] in ["string"]:
-					return self._scifn(self._sciptr, value, None, c_char_p(val))
-				raise AttributeError(name)
+		setter = self._setters.get(name)
+		if setter:
+			setterName, setValue = setter
+			self.used.add(setterName)
+			if setValue:
+				return setValue(val)
 		raise AttributeError(name)
 	def getvalue(self, name):
 		if name in self.face.features:
 			feature = self.face.features[name]
-			if feature["FeatureType"] != "evt":
-				try:
-					return int(feature["Value"], 0)
-				except ValueError:
-					return -1
+			if feature.featureType != "evt" and feature.number is not None:
+				return feature.number
 		return -1
 
 
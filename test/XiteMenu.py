@@ -12,6 +12,7 @@ MenuStructure = [
 		["Save &As...", "<control><shift>S"],
 		["Test", ""],
 		["Exercised", ""],
+		["Profile", ""],
 		["Uncalled", ""],
 		["-", ""],
 		["&Exit", ""]]],
@@ -15,7 +15,7 @@ scintillaDirectory = ".."
 scintillaIncludeDirectory = os.path.join(scintillaDirectory, "include")
 scintillaScriptsDirectory = os.path.join(scintillaDirectory, "scripts")
 sys.path.append(scintillaScriptsDirectory)
-import Face
+import IfaceTable
 
 class Form(QDialog):
 
@@ -27,8 +27,7 @@ class Form(QDialog):
 
 class XiteWin():
 	def __init__(self, test=""):
-		self.face = Face.Face()
-		self.face.ReadFromFile(os.path.join(scintillaIncludeDirectory, "Scintilla.iface"))
+		self.face = IfaceTable.ReadInterface(os.path.join(scintillaIncludeDirectory, "Scintilla.iface"))
 
 		self.test = test
 
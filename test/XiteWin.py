@@ -22,7 +22,7 @@ scintillaDirectory = ".."
 scintillaIncludeDirectory = os.path.join(scintillaDirectory, "include")
 scintillaScriptsDirectory = os.path.join(scintillaDirectory, "scripts")
 sys.path.append(scintillaScriptsDirectory)
-import Face
+import IfaceTable
 
 scintillaBinDirectory = os.path.join(scintillaDirectory, "bin")
 os.environ['PATH'] = os.environ['PATH']  + ";" + scintillaBinDirectory
@@ -141,8 +141,7 @@ def RegisterClass(name, func, background = 0):
 
 class XiteWin():
 	def __init__(self, test=""):
-		self.face = Face.Face()
-		self.face.ReadFromFile(os.path.join(scintillaIncludeDirectory, "Scintilla.iface"))
+		self.face = IfaceTable.ReadInterface(os.path.join(scintillaIncludeDirectory, "Scintilla.iface"))
 
 		self.titleDirty = True
 		self.fullPath = ""
@@ -488,6 +487,17 @@ class XiteWin():
 		print("Used", len(self.ed.used))
 		print()
 		print("\n".join(sorted(self.ed.used)))
+		if self.ed.profile:
+			print()
+			print(self.ed.profile.Table())
+
+	def CmdProfile(self):
+		# Switch recording of calls on and off with results shown by Exercised
+		if self.ed.profile:
+			self.ed.Instrument(None)
+		else:
+			self.ed.Instrument(ScintillaCallable.CallProfile())
+		self.CheckMenuItem("Profile", self.ed.profile is not None)
 
 	def Uncalled(self):
 		print("")
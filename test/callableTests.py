@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+# Tests for ScintillaCallable that call a recording function instead of Scintilla
+# so they can be run without building Scintilla.
+# Requires Python 2.7 or later
+
+from __future__ import unicode_literals
+
+import ctypes, os, shutil, sys, tempfile, unittest
+
+import ScintillaCallable
+
+scintillaDirectory = ".."
+scintillaIncludeDirectory = os.path.join(scintillaDirectory, "include")
+scintillaScriptsDirectory = os.path.join(scintillaDirectory, "scripts")
+sys.path.append(scintillaScriptsDirectory)
+import Face
+import IfaceTable
+
+# The direct function signature with pointers that are not dereferenced
+recordingFX = ctypes.CFUNCTYPE(ctypes.c_long, ctypes.c_void_p, ctypes.c_int,
+	ctypes.c_void_p, ctypes.c_void_p)
+
+class TestCallable(unittest.TestCase):
+
+	def setUp(self):
+		self.face = Face.Face()
+		# No cache so tests do not write into the source tree
+		self.face.ReadFromFile(os.path.join(scintillaIncludeDirectory, "Scintilla.iface"), False)
+		self.messages = []
+		def directFunction(ptr, msg, w, l):
+			self.messages.append((msg, w))
+			return msg
+		self.directFunction = recordingFX(directFunction)
+		self.address = ctypes.cast(self.directFunction, ctypes.c_void_p).value
+		self.tableDirectory = tempfile.mkdtemp()
+		tableFileName = os.path.join(self.tableDirectory, "Scintilla.ifacetable")
+		with open(tableFileName, "wb") as f:
+			f.write(IfaceTable.TableFromFace(self.face))
+		self.tableFace = IfaceTable.TableFace(tableFileName)
+
+	def tearDown(self):
+		self.tableFace.close()
+		shutil.rmtree(self.tableDirectory)
+
+	def Callable(self, face):
+		return ScintillaCallable.ScintillaCallable(face, self.address, None)
+
+	def testCalls(self):
+		for face in [self.face, self.tableFace]:
+			ed = self.Callable(face)
+			del self.messages[:]
+			self.assertEquals(ed.GetCurrentPos(), 2008)
+			ed.SetAnchor(5)
+			self.assertEquals(ed.Length, 2006)
+			ed.CurrentPos = 7
+			self.assertEquals(self.messages, [(2008, None), (2026, 5), (2006, None), (2141, 7)])
+			self.assertEquals(ed.INVALID_POSITION, -1)
+			self.assertEquals(ed.k["SCN_Modified"], 2008)
+			self.assertTrue("GetCurrentPos" in ed.used)
+			self.assertTrue("GetLength" in ed.used)
+
+	def testNotMessages(self):
+		# Events, enumerations, and lexers can not be called
+		for face in [self.face, self.tableFace]:
+			ed = self.Callable(face)
+			for name in ["Modified", "CharAdded", "MarkerSymbol", "Python", "NotAName"]:
+				self.assertRaises(AttributeError, getattr, ed, name)
+			self.assertRaises(AttributeError, setattr, ed, "NotAName", 1)
+			self.assertEquals(self.messages, [])
+
+	def testTableFace(self):
+		# Every message, constant, and property is the same with a TableFace
+		def accessAll(ed):
+			results = []
+			for name in sorted(self.face.features):
+				try:
+					value = getattr(ed, name)
+				except AttributeError:
+					value = None
+				if isinstance(value, ScintillaCallable.SciCall):
+					value = (value._msg, value._stringResult, value(1, 2))
+				results.append((name, value))
+			for name in sorted(self.face.properties):
+				try:
+					results.append((name, getattr(ed, name)))
+				except AttributeError:
+					results.append((name, None))
+			return results, sorted(ed.used)
+		del self.messages[:]
+		fromFace = accessAll(self.Callable(self.face))
+		faceMessages = list(self.messages)
+		del self.messages[:]
+		self.assertEquals(accessAll(self.Callable(self.tableFace)), fromFace)
+		self.assertEquals(self.messages, faceMessages)
+
+	def testFaceClasses(self):
+		# Properties are installed in a subclass for each face rather than in ScintillaCallable
+		ed = self.Callable(self.face)
+		edTable = self.Callable(self.tableFace)
+		self.assertFalse("Length" in vars(ScintillaCallable.ScintillaCallable))
+		self.assertTrue(isinstance(vars(type(ed))["Length"], ScintillaCallable.Property))
+		self.assertTrue(type(ed) is not type(edTable))
+		self.assertTrue(type(self.Callable(self.face)) is type(ed))
+		ed.Instrument(ScintillaCallable.CallProfile())
+		self.assertTrue(type(ed) is type(self.Callable(self.face)))
+		self.assertEquals(ed.Length, 2006)
+		self.assertEquals(edTable.Length, 2006)
+
+	def testProfile(self):
+		ed = self.Callable(self.tableFace)
+		ed.Instrument(ScintillaCallable.CallProfile())
+		ed.AddText(3, b"abc")
+		ed.AddText(2, b"de")
+		self.assertEquals(ed.Length, 2006)
+		messages = ed.profile.messages
+		self.assertEquals(messages["AddText"].count, 2)
+		self.assertEquals(messages["AddText"].stringBytes, 5)
+		self.assertEquals(messages["GetLength"].count, 1)
+		ed.Instrument(None)
+		self.assertTrue(isinstance(ed.AddText, ScintillaCallable.SciCall))
+
+if __name__ == '__main__':
+	unittest.main()
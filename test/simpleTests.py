@@ -627,6 +627,24 @@ class TestSimple(unittest.TestCase):
 		self.assertEquals(self.ed.WordEndPosition(5, 0), 6)
 		self.assertEquals(self.ed.WordEndPosition(6, 0), 8)
 
+	def testWordPositionsUTF8(self):
+		# IDEOGRAPHIC SPACE separates words and IDEOGRAPHIC FULL STOP is punctuation
+		self.ed.SetCodePage(65001)
+		text = b"ab\xe3\x80\x80cd\xe3\x80\x82ef"
+		self.ed.AddText(len(text), text)
+		self.assertEquals(self.ed.WordStartPosition(5, 0), 2)
+		self.assertEquals(self.ed.WordStartPosition(7, 0), 5)
+		self.assertEquals(self.ed.WordStartPosition(10, 0), 7)
+
+		self.assertEquals(self.ed.WordEndPosition(2, 0), 5)
+		self.assertEquals(self.ed.WordEndPosition(5, 0), 7)
+		self.assertEquals(self.ed.WordEndPosition(7, 0), 10)
+
+		self.assertEquals(self.ed.IsRangeWord(5, 7), 1)
+		self.assertEquals(self.ed.IsRangeWord(7, 10), 1)
+		self.assertEquals(self.ed.IsRangeWord(6, 7), 0)
+		self.ed.SetCodePage(0)
+
 	def testWordRange(self):
 		text = b"ab cd\t++"
 		self.ed.AddText(len(text), text)
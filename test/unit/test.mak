@@ -10,13 +10,18 @@ CXXFLAGS = /EHsc /wd 4805 $(INCLUDEDIRS)
 
 # Files in this directory containing tests
 TESTSRC=test*.cxx
-# Files being tested from scintilla/src directory
+# Files being tested from scintilla/src and scintilla/lexlib directories
 TESTEDSRC=\
+ ../../src/CaseConvert.cxx \
+ ../../src/CaseFolder.cxx \
  ../../src/CellBuffer.cxx \
  ../../src/CharClassify.cxx \
  ../../src/ContractionState.cxx \
  ../../src/Decoration.cxx \
- ../../src/RunStyles.cxx 
+ ../../src/RESearch.cxx \
+ ../../src/RunStyles.cxx \
+ ../../src/UniConversion.cxx \
+ ../../lexlib/CharacterCategory.cxx 
 
 TESTS=$(EXE)
 
@@ -0,0 +1,115 @@
+// Unit Tests for Scintilla internal data structures
+
+#include <string.h>
+
+#include <algorithm>
+
+#include "Platform.h"
+
+#include "CaseConvert.h"
+#include "CaseFolder.h"
+#include "UniConversion.h"
+
+#include "catch.hpp"
+
+// Test CaseConvert.
+
+namespace {
+
+std::string ConvertString(const std::string &mixed, enum CaseConversion conversion) {
+	// Normally initialised by Document
+	UTF8BytesOfLeadInitialise();
+	std::string converted(mixed.length() * maxExpansionCaseConversion + 1, '\0');
+	const size_t lenConverted = CaseConvertString(&converted[0], converted.length(),
+		mixed.c_str(), mixed.length(), conversion);
+	converted.resize(lenConverted);
+	return converted;
+}
+
+std::string UTF8Character(int character) {
+	std::string utf8;
+	if (character < 0x80) {
+		utf8 += static_cast<char>(character);
+	} else if (character < 0x800) {
+		utf8 += static_cast<char>(0xC0 | (character >> 6));
+		utf8 += static_cast<char>(0x80 | (character & 0x3f));
+	} else if (character < 0x10000) {
+		utf8 += static_cast<char>(0xE0 | (character >> 12));
+		utf8 += static_cast<char>(0x80 | ((character >> 6) & 0x3f));
+		utf8 += static_cast<char>(0x80 | (character & 0x3f));
+	} else {
+		utf8 += static_cast<char>(0xF0 | (character >> 18));
+		utf8 += static_cast<char>(0x80 | ((character >> 12) & 0x3f));
+		utf8 += static_cast<char>(0x80 | ((character >> 6) & 0x3f));
+		utf8 += static_cast<char>(0x80 | (character & 0x3f));
+	}
+	return utf8;
+}
+
+}
+
+TEST_CASE("CaseConvert") {
+
+	SECTION("ASCII") {
+		REQUIRE(ConvertString("Fold Margin", CaseConversionFold) == "fold margin");
+		REQUIRE(ConvertString("Fold Margin", CaseConversionUpper) == "FOLD MARGIN");
+		REQUIRE(ConvertString("Fold Margin", CaseConversionLower) == "fold margin");
+	}
+
+	SECTION("Simple") {
+		// GREEK CAPITAL LETTER PHI and GREEK SMALL LETTER PHI
+		REQUIRE(ConvertString("\xce\xa6", CaseConversionFold) == "\xcf\x86");
+		REQUIRE(ConvertString("\xcf\x86", CaseConversionUpper) == "\xce\xa6");
+		REQUIRE(ConvertString("\xce\xa6", CaseConversionLower) == "\xcf\x86");
+		// DESERET CAPITAL LETTER LONG I is outside the Basic Multilingual Plane
+		REQUIRE(ConvertString("\xf0\x90\x90\x80", CaseConversionFold) == "\xf0\x90\x90\xa8");
+		// CJK characters have no conversions
+		REQUIRE(ConvertString("\xe6\x8a\x98", CaseConversionFold) == "\xe6\x8a\x98");
+	}
+
+	SECTION("Complex") {
+		// LATIN SMALL LETTER SHARP S folds and converts to upper case as 2 characters
+		REQUIRE(ConvertString("\xc3\x9f", CaseConversionFold) == "ss");
+		REQUIRE(ConvertString("\xc3\x9f", CaseConversionUpper) == "SS");
+		REQUIRE(ConvertString("\xc3\x9f", CaseConversionLower) == "\xc3\x9f");
+		// MICRO SIGN folds to GREEK SMALL LETTER MU
+		REQUIRE(ConvertString("\xc2\xb5", CaseConversionFold) == "\xce\xbc");
+	}
+
+	SECTION("Invalid") {
+		REQUIRE(ConvertString("A\xff" "B", CaseConversionLower) == "a\xff" "b");
+	}
+
+	SECTION("MatchesCharacterConversion") {
+		// Strings are converted with the two-stage tables while CaseConvert for a single
+		// character uses a search of all conversions so they should agree.
+		const enum CaseConversion conversions[] = {
+			CaseConversionFold, CaseConversionUpper, CaseConversionLower
+		};
+		for (size_t c = 0; c < sizeof(conversions) / sizeof(conversions[0]); c++) {
+			int differences = 0;
+			for (int character = 1; character < 0x110000; character++) {
+				if (character >= 0xD800 && character <= 0xDFFF)
+					continue;
+				const std::string original = UTF8Character(character);
+				const char *characterConverted = CaseConvert(character, conversions[c]);
+				const std::string expected = characterConverted ? characterConverted : original;
+				if (ConvertString(original, conversions[c]) != expected)
+					differences++;
+			}
+			REQUIRE(differences == 0);
+		}
+	}
+}
+
+TEST_CASE("CaseFolderUnicode") {
+
+	SECTION("Fold") {
+		UTF8BytesOfLeadInitialise();
+		CaseFolderUnicode folder;
+		char folded[20];
+		const char mixed[] = "Fold \xce\xa6\xc3\x9f";
+		const size_t lenFolded = folder.Fold(folded, sizeof(folded), mixed, strlen(mixed));
+		REQUIRE(std::string(folded, lenFolded) == "fold \xcf\x86ss");
+	}
+}
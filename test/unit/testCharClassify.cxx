@@ -7,6 +7,7 @@
 #include "Platform.h"
 
 #include "CharClassify.h"
+#include "UniConversion.h"
 
 #include "catch.hpp"
 
@@ -119,3 +120,104 @@ TEST_CASE_METHOD(CharClassifyTest, "CharsOfClass") {
 		delete []buffer;
 	}
 }
+
+namespace {
+
+int ClassifyUTF8String(const char *s, int &width) {
+	return CharClassify::ClassifyUTF8(reinterpret_cast<const unsigned char *>(s),
+		static_cast<int>(strlen(s)), width);
+}
+
+int UTF8FromCharacter(int ch, unsigned char *us) {
+	if (ch < 0x800) {
+		us[0] = static_cast<unsigned char>(0xC0 | (ch >> 6));
+		us[1] = static_cast<unsigned char>(0x80 | (ch & 0x3f));
+		return 2;
+	} else if (ch < 0x10000) {
+		us[0] = static_cast<unsigned char>(0xE0 | (ch >> 12));
+		us[1] = static_cast<unsigned char>(0x80 | ((ch >> 6) & 0x3f));
+		us[2] = static_cast<unsigned char>(0x80 | (ch & 0x3f));
+		return 3;
+	} else {
+		us[0] = static_cast<unsigned char>(0xF0 | (ch >> 18));
+		us[1] = static_cast<unsigned char>(0x80 | ((ch >> 12) & 0x3f));
+		us[2] = static_cast<unsigned char>(0x80 | ((ch >> 6) & 0x3f));
+		us[3] = static_cast<unsigned char>(0x80 | (ch & 0x3f));
+		return 4;
+	}
+}
+
+}
+
+TEST_CASE_METHOD(CharClassifyTest, "ClassifiesUTF8") {
+	// Only setting classes for bytes from 0x80 turns off the UTF-8 table
+	REQUIRE(pcc->ClassifiesUTF8());
+	pcc->SetDefaultCharClasses(false);
+	pcc->SetCharClasses(reinterpret_cast<const unsigned char *>("abc"), CharClassify::ccWord);
+	REQUIRE(pcc->ClassifiesUTF8());
+	pcc->SetCharClasses(reinterpret_cast<const unsigned char *>("\xc2\xa0"), CharClassify::ccSpace);
+	REQUIRE(!pcc->ClassifiesUTF8());
+	pcc->SetDefaultCharClasses(true);
+	REQUIRE(pcc->ClassifiesUTF8());
+}
+
+TEST_CASE("ClassifyUTF8") {
+
+	int width = 0;
+
+	SECTION("Classes") {
+		// LATIN SMALL LETTER E WITH ACUTE, CJK ideograph, GOTHIC LETTER AHSA
+		REQUIRE(ClassifyUTF8String("\xc3\xa9", width) == CharClassify::ccWord);
+		REQUIRE(width == 2);
+		REQUIRE(ClassifyUTF8String("\xe4\xb8\x80", width) == CharClassify::ccWord);
+		REQUIRE(width == 3);
+		REQUIRE(ClassifyUTF8String("\xf0\x90\x8c\xb0", width) == CharClassify::ccWord);
+		REQUIRE(width == 4);
+		// COMBINING ACUTE ACCENT continues a word
+		REQUIRE(ClassifyUTF8String("\xcc\x81", width) == CharClassify::ccWord);
+		// NO-BREAK SPACE, IDEOGRAPHIC SPACE
+		REQUIRE(ClassifyUTF8String("\xc2\xa0", width) == CharClassify::ccSpace);
+		REQUIRE(ClassifyUTF8String("\xe3\x80\x80", width) == CharClassify::ccSpace);
+		// LINE SEPARATOR
+		REQUIRE(ClassifyUTF8String("\xe2\x80\xa8", width) == CharClassify::ccNewLine);
+		// IDEOGRAPHIC FULL STOP, LEFT DOUBLE QUOTATION MARK, EURO SIGN
+		REQUIRE(ClassifyUTF8String("\xe3\x80\x82", width) == CharClassify::ccPunctuation);
+		REQUIRE(ClassifyUTF8String("\xe2\x80\x9c", width) == CharClassify::ccPunctuation);
+		REQUIRE(ClassifyUTF8String("\xe2\x82\xac", width) == CharClassify::ccPunctuation);
+		REQUIRE(width == 3);
+	}
+
+	SECTION("Invalid") {
+		// ASCII is left to the byte classes
+		REQUIRE(ClassifyUTF8String("a", width) == CharClassify::utf8ClassInvalid);
+		REQUIRE(width == 1);
+		// Trail byte, truncated, overlong, surrogate, non-character, beyond 10FFFF
+		REQUIRE(ClassifyUTF8String("\x80", width) == CharClassify::utf8ClassInvalid);
+		REQUIRE(ClassifyUTF8String("\xe4\xb8", width) == CharClassify::utf8ClassInvalid);
+		REQUIRE(ClassifyUTF8String("\xe4\xb8" "a", width) == CharClassify::utf8ClassInvalid);
+		REQUIRE(ClassifyUTF8String("\xc0\x80", width) == CharClassify::utf8ClassInvalid);
+		REQUIRE(ClassifyUTF8String("\xe0\x80\x80", width) == CharClassify::utf8ClassInvalid);
+		REQUIRE(ClassifyUTF8String("\xed\xa0\x80", width) == CharClassify::utf8ClassInvalid);
+		REQUIRE(ClassifyUTF8String("\xef\xbf\xbe", width) == CharClassify::utf8ClassInvalid);
+		REQUIRE(ClassifyUTF8String("\xf4\x90\x80\x80", width) == CharClassify::utf8ClassInvalid);
+		REQUIRE(width == 1);
+	}
+
+	SECTION("ValidAsUTF8Classify") {
+		// Every character is valid in the table when it is valid for UTF8Classify
+		unsigned char us[UTF8MaxBytes+1];
+		for (int ch = 0x80; ch <= 0x10FFFF; ch++) {
+			const int len = UTF8FromCharacter(ch, us);
+			us[len] = 'a';
+			const int utf8Status = UTF8Classify(us, len + 1);
+			const int result = CharClassify::ClassifyUTF8(us, len + 1, width);
+			if (utf8Status & UTF8MaskInvalid) {
+				REQUIRE(result == CharClassify::utf8ClassInvalid);
+				REQUIRE(width == 1);
+			} else {
+				REQUIRE(result != CharClassify::utf8ClassInvalid);
+				REQUIRE(width == len);
+			}
+		}
+	}
+}
@@ -0,0 +1,63 @@
+// Unit Tests for Scintilla internal data structures
+
+#include <string.h>
+
+#include <algorithm>
+
+#include "Platform.h"
+
+#include "CharacterCategory.h"
+
+#include "catch.hpp"
+
+// Test CharacterCategory.
+
+TEST_CASE("CharacterCategory") {
+
+	SECTION("ASCII") {
+		REQUIRE(CategoriseCharacter('A') == ccLu);
+		REQUIRE(CategoriseCharacter('a') == ccLl);
+		REQUIRE(CategoriseCharacter('0') == ccNd);
+		REQUIRE(CategoriseCharacter('_') == ccPc);
+		REQUIRE(CategoriseCharacter(' ') == ccZs);
+		REQUIRE(CategoriseCharacter('\n') == ccCc);
+	}
+
+	SECTION("BasicMultilingualPlane") {
+		// GREEK SMALL LETTER PHI
+		REQUIRE(CategoriseCharacter(0x3C6) == ccLl);
+		// COMBINING ACUTE ACCENT
+		REQUIRE(CategoriseCharacter(0x301) == ccMn);
+		// CJK ideograph and HIRAGANA LETTER RI
+		REQUIRE(CategoriseCharacter(0x6298) == ccLo);
+		REQUIRE(CategoriseCharacter(0x308A) == ccLo);
+		// IDEOGRAPHIC SPACE
+		REQUIRE(CategoriseCharacter(0x3000) == ccZs);
+		// Surrogates and private use
+		REQUIRE(CategoriseCharacter(0xD800) == ccCs);
+		REQUIRE(CategoriseCharacter(0xE000) == ccCo);
+	}
+
+	SECTION("Supplementary") {
+		// DESERET CAPITAL LETTER LONG I
+		REQUIRE(CategoriseCharacter(0x10400) == ccLu);
+		// MATHEMATICAL BOLD DIGIT ZERO
+		REQUIRE(CategoriseCharacter(0x1D7CE) == ccNd);
+		// CJK Unified Ideographs Extension B
+		REQUIRE(CategoriseCharacter(0x20000) == ccLo);
+		// Unassigned
+		REQUIRE(CategoriseCharacter(0x2FFFF) == ccCn);
+		REQUIRE(CategoriseCharacter(0x30000) == ccCn);
+		// LANGUAGE TAG and VARIATION SELECTOR-17
+		REQUIRE(CategoriseCharacter(0xE0001) == ccCf);
+		REQUIRE(CategoriseCharacter(0xE0100) == ccMn);
+		// Supplementary Private Use Area
+		REQUIRE(CategoriseCharacter(0xF0000) == ccCo);
+		REQUIRE(CategoriseCharacter(0x10FFFD) == ccCo);
+	}
+
+	SECTION("OutOfRange") {
+		REQUIRE(CategoriseCharacter(-1) == ccCn);
+		REQUIRE(CategoriseCharacter(0x110000) == ccCn);
+	}
+}
@@ -0,0 +1,96 @@
+// Unit Tests for Scintilla internal data structures
+
+#include <string.h>
+
+#include <string>
+#include <stdexcept>
+#include <algorithm>
+
+#include "Platform.h"
+
+#include "Position.h"
+#include "CharClassify.h"
+#include "RESearch.h"
+
+#include "catch.hpp"
+
+// Test RESearch.
+
+namespace {
+
+// Indexes a UTF-8 string and classifies whole characters like Document.
+class StringIndexer : public CharacterIndexer {
+	std::string s;
+public:
+	explicit StringIndexer(const std::string &s_) : s(s_) {
+	}
+	virtual char CharAt(int index) {
+		if (index < 0 || index >= static_cast<int>(s.length()))
+			return 0;
+		return s[index];
+	}
+	virtual int WordClassAfter(int index, int &width) {
+		width = 1;
+		if (index < 0 || index >= static_cast<int>(s.length()))
+			return -1;
+		const unsigned char *us = reinterpret_cast<const unsigned char *>(s.c_str());
+		int start = index;
+		while ((start > 0) && (index - start < 3) && ((us[start] & 0xC0) == 0x80))
+			start--;
+		int widthChar = 1;
+		const int result = CharClassify::ClassifyUTF8(us + start,
+			static_cast<int>(s.length()) - start, widthChar);
+		if ((result == CharClassify::utf8ClassInvalid) || (start + widthChar <= index))
+			return -1;
+		width = start + widthChar - index;
+		return result;
+	}
+};
+
+std::string Match(RESearch &re, const std::string &text, const char *pattern) {
+	StringIndexer si(text);
+	REQUIRE(re.Compile(pattern, static_cast<int>(strlen(pattern)), true, false) == 0);
+	if (!re.Execute(si, 0, static_cast<int>(text.length())))
+		return "<none>";
+	return text.substr(re.bopat[0], re.eopat[0] - re.bopat[0]);
+}
+
+}
+
+TEST_CASE("RESearch") {
+
+	CharClassify cc;
+	RESearch re(&cc);
+
+	SECTION("ASCII") {
+		REQUIRE(Match(re, "a.bc d", "\\w+") == "a");
+		REQUIRE(Match(re, "a.bc d", "\\<bc\\>") == "bc");
+		REQUIRE(Match(re, "abc d", "\\<bc") == "<none>");
+		REQUIRE(Match(re, "abc d", "\\W") == " ");
+	}
+
+	SECTION("Characters") {
+		// LATIN SMALL LETTER E WITH ACUTE is a word character and EM DASH punctuation
+		const std::string text = "caf\xc3\xa9\xe2\x80\x94" "bar";
+		REQUIRE(Match(re, text, "\\w+") == "caf\xc3\xa9");
+		REQUIRE(Match(re, text, "\\W") == "\xe2\x80\x94");
+		REQUIRE(Match(re, text, "\\<bar") == "bar");
+		REQUIRE(Match(re, text, "\\w\\>") == "\xc3\xa9");
+		REQUIRE(Match(re, text, "\\w\\W\\w") == "\xc3\xa9\xe2\x80\x94" "b");
+	}
+
+	SECTION("Backtrack") {
+		// A closure over word characters backs up by whole characters so the trail byte
+		// of the e with acute accent is only matched by a search starting there
+		const std::string text = "caf\xc3\xa9";
+		REQUIRE(Match(re, text, "\\w*\xa9") == "\xa9");
+		REQUIRE(Match(re, text, "\\w*\xc3") == "caf\xc3");
+		REQUIRE(Match(re, text, "\\w+f") == "caf");
+	}
+
+	SECTION("Sets") {
+		// Inside sets \w only holds bytes so a default class makes every byte a word byte
+		const std::string text = "\xe2\x80\x94";
+		REQUIRE(Match(re, text, "[\\w]+") == text);
+	}
+}
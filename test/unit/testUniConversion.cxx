@@ -0,0 +1,69 @@
+// Unit Tests for Scintilla internal data structures
+
+#include <string.h>
+
+#include <algorithm>
+
+#include "Platform.h"
+
+#include "UniConversion.h"
+
+#include "catch.hpp"
+
+// Test UniConversion.
+
+TEST_CASE("ClassifyWidth") {
+
+	SECTION("Narrow") {
+		REQUIRE(ClassifyWidth(' ') == cwNarrow);
+		REQUIRE(ClassifyWidth('a') == cwNarrow);
+		REQUIRE(ClassifyWidth('~') == cwNarrow);
+		// HALFWIDTH KATAKANA LETTER A
+		REQUIRE(ClassifyWidth(0xFF71) == cwNarrow);
+	}
+
+	SECTION("Wide") {
+		// CJK ideograph, HIRAGANA LETTER A, HANGUL SYLLABLE GA, FULLWIDTH LATIN CAPITAL LETTER A
+		REQUIRE(ClassifyWidth(0x4E00) == cwWide);
+		REQUIRE(ClassifyWidth(0x3042) == cwWide);
+		REQUIRE(ClassifyWidth(0xAC00) == cwWide);
+		REQUIRE(ClassifyWidth(0xFF21) == cwWide);
+		// IDEOGRAPHIC SPACE, IDEOGRAPHIC FULL STOP, KATAKANA LETTER A
+		REQUIRE(ClassifyWidth(0x3000) == cwWide);
+		REQUIRE(ClassifyWidth(0x3002) == cwWide);
+		REQUIRE(ClassifyWidth(0x30A2) == cwWide);
+	}
+
+	SECTION("WideMeasured") {
+		// Wide characters outside the sampled blocks often come from other fonts:
+		// emoji, WATCH, UMBRELLA WITH RAIN DROPS, CYCLONE, YI SYLLABLE IT,
+		// CJK RADICAL REPEAT, and CJK Unified Ideographs Extension B
+		REQUIRE(ClassifyWidth(0x1F600) == cwOther);
+		REQUIRE(ClassifyWidth(0x231A) == cwOther);
+		REQUIRE(ClassifyWidth(0x2614) == cwOther);
+		REQUIRE(ClassifyWidth(0x1F300) == cwOther);
+		REQUIRE(ClassifyWidth(0xA000) == cwOther);
+		REQUIRE(ClassifyWidth(0x2E80) == cwOther);
+		REQUIRE(ClassifyWidth(0x20000) == cwOther);
+	}
+
+	SECTION("Zero") {
+		// COMBINING ACUTE ACCENT, ZERO WIDTH SPACE, HANGUL JUNGSEONG A
+		REQUIRE(ClassifyWidth(0x301) == cwZero);
+		REQUIRE(ClassifyWidth(0x200B) == cwZero);
+		REQUIRE(ClassifyWidth(0x1161) == cwZero);
+	}
+
+	SECTION("Other") {
+		// Controls, ambiguous width, and unassigned and private use are measured
+		REQUIRE(ClassifyWidth('\t') == cwOther);
+		REQUIRE(ClassifyWidth(0x7F) == cwOther);
+		REQUIRE(ClassifyWidth(0xAD) == cwOther);
+		// GREEK SMALL LETTER ALPHA has ambiguous width
+		REQUIRE(ClassifyWidth(0x3B1) == cwOther);
+		REQUIRE(ClassifyWidth(0xE000) == cwOther);
+		REQUIRE(ClassifyWidth(0x40000) == cwOther);
+		REQUIRE(ClassifyWidth(0x10FFFF) == cwOther);
+		REQUIRE(ClassifyWidth(-1) == cwOther);
+	}
+}